@@ -0,0 +1,228 @@
+"""
+AFD a nivel de bytes UTF-8: cada símbolo del AFD se reemplaza por su secuencia
+de bytes, de modo que el simulador recorre bytes, bytearray, memoryview o mmap
+directamente, sin decodificar ni copiar
+Los 256 bytes se agrupan en clases equivalentes para achicar la tabla
+"""
+from collections import deque
+from automata import Automata
+from analisis_literales import AnalizadorLiterales
+from busqueda_lineal import BusquedaAdelante, BusquedaAtras
+
+
+class ConstructorAFDBytes:
+    def __init__(self):
+        self.siguiente_estado = 0
+        # Estados intermedios (a mitad de un carácter) por sus transiciones {byte: destino}
+        self.intermedios = {}
+
+    def convertir(self, afd):
+        """
+        Retorna un Automata equivalente cuyos símbolos son bytes (enteros 0..255)
+        Los estados intermedios con las mismas transiciones restantes se comparten
+        """
+        tabla = afd.tabla_determinista()
+        afd_bytes = Automata()
+        for estado in afd.estados:
+            afd_bytes.agregar_estado(estado)
+        afd_bytes.establecer_estado_inicial(afd.estado_inicial)
+        for estado in afd.estados_aceptacion:
+            afd_bytes.agregar_estado_aceptacion(estado)
+
+        self.siguiente_estado = max(afd.estados) + 1 if afd.estados else 0
+        self.intermedios = {}
+        for estado, transiciones in tabla.items():
+            # Trie de las codificaciones: {byte: subárbol o estado destino}
+            arbol = {}
+            for simbolo, destino in transiciones.items():
+                codigo = simbolo.encode('utf-8')
+                nodo = arbol
+                for byte in codigo[:-1]:
+                    nodo = nodo.setdefault(byte, {})
+                nodo[codigo[-1]] = destino
+            for byte, hijo in arbol.items():
+                afd_bytes.agregar_transicion(estado, byte, self.internar(hijo, afd_bytes))
+        return afd_bytes
+
+    def internar(self, nodo, afd_bytes):
+        """Retorna el estado para un subárbol del trie, reutilizando uno idéntico"""
+        if not isinstance(nodo, dict):
+            return nodo
+        clave = tuple(sorted((byte, self.internar(hijo, afd_bytes)) for byte, hijo in nodo.items()))
+        estado = self.intermedios.get(clave)
+        if estado is None:
+            estado = self.intermedios[clave] = self.siguiente_estado
+            self.siguiente_estado += 1
+            for byte, destino in clave:
+                afd_bytes.agregar_transicion(estado, byte, destino)
+        return estado
+
+
+class AFDBytes:
+    def __init__(self, afd):
+        """
+        Recibe el AFD de caracteres (idealmente el mínimo) y arma la tabla de bytes:
+        el estado 0 es el sumidero y los números de estado vienen multiplicados
+        por el número de clases, así una transición es tabla[estado + clase]
+        """
+        afd_bytes = ConstructorAFDBytes().convertir(afd)
+        transiciones = afd_bytes.tabla_determinista()
+
+        estados = [None, afd_bytes.estado_inicial]
+        indice = {None: 0, afd_bytes.estado_inicial: 1}
+        cola = deque([afd_bytes.estado_inicial])
+        while cola:
+            estado = cola.popleft()
+            for _, destino in sorted(transiciones.get(estado, {}).items()):
+                if destino not in indice:
+                    indice[destino] = len(estados)
+                    estados.append(destino)
+                    cola.append(destino)
+
+        # Dos bytes son de la misma clase si llevan al mismo destino desde todo estado
+        firmas = {}
+        self.clases = []
+        for byte in range(256):
+            firma = tuple(transiciones.get(estado, {}).get(byte) for estado in estados)
+            self.clases.append(firmas.setdefault(firma, len(firmas)))
+        self.numero_clases = len(firmas)
+        self.numero_estados = len(estados)
+
+        self.tabla = [0] * (self.numero_estados * self.numero_clases)
+        for firma, clase in firmas.items():
+            for i, destino in enumerate(firma):
+                self.tabla[i * self.numero_clases + clase] = indice[destino] * self.numero_clases
+        self.inicial = self.numero_clases
+        self.aceptacion = frozenset(indice[estado] * self.numero_clases
+                                    for estado in afd_bytes.estados_aceptacion if estado in indice)
+
+        self.vivos = self.calcular_vivos()
+        # Las transiciones hacia estados muertos van al sumidero: el ciclo corta ahí
+        self.tabla = [destino if destino in self.vivos else 0 for destino in self.tabla]
+
+        self.prefijo = AnalizadorLiterales(afd).analizar()['prefijo'].encode('utf-8')
+        self.estado_tras_prefijo = self.avanzar(self.inicial, self.prefijo)
+        self.primeros = frozenset(byte for byte in range(256)
+                                  if self.tabla[self.inicial + self.clases[byte]])
+
+        # Búsqueda lineal: los símbolos de los AFD perezosos son las clases de bytes
+        self.predecesores = {}
+        for posicion, destino in enumerate(self.tabla):
+            if destino:
+                clase = posicion % self.numero_clases
+                self.predecesores.setdefault((destino, clase), []).append(posicion - clase)
+        self.adelante = BusquedaAdelante(self.siguiente_clase, self.inicial, self.aceptacion)
+        self.atras = BusquedaAtras(self.anteriores_clase, self.inicial, self.aceptacion)
+
+    def calcular_vivos(self):
+        """Estados (multiplicados) desde los que todavía se puede llegar a aceptación"""
+        predecesores = {}
+        for posicion, destino in enumerate(self.tabla):
+            origen = posicion - posicion % self.numero_clases
+            predecesores.setdefault(destino, set()).add(origen)
+        vivos = set(self.aceptacion)
+        pila = list(vivos)
+        while pila:
+            for predecesor in predecesores.get(pila.pop(), ()):
+                if predecesor not in vivos:
+                    vivos.add(predecesor)
+                    pila.append(predecesor)
+        return frozenset(vivos)
+
+    def siguiente_clase(self, estado, clase):
+        """Destino con una clase de bytes, o None si va al sumidero"""
+        return self.tabla[estado + clase] or None
+
+    def anteriores_clase(self, estado, clase):
+        """Estados que llegan al estado dado con una clase de bytes"""
+        return self.predecesores.get((estado, clase), ())
+
+    def es_aceptacion(self, estado):
+        """Indica si el estado es de aceptación"""
+        return estado in self.aceptacion
+
+    def es_vivo(self, estado):
+        """Indica si desde el estado todavía se puede aceptar (el sumidero 0 nunca)"""
+        return estado in self.vivos
+
+    def vista(self, datos):
+        """bytes y bytearray se recorren tal cual; lo demás (mmap, memoryview) con una vista de bytes"""
+        if isinstance(datos, (bytes, bytearray)):
+            return datos
+        return memoryview(datos).cast('B')
+
+    def acepta(self, datos):
+        """Retorna True si todos los bytes forman una cadena aceptada"""
+        tabla = self.tabla
+        clases = self.clases
+        estado = self.inicial
+        for byte in self.vista(datos):
+            estado = tabla[estado + clases[byte]]
+            if not estado:
+                return False
+        return estado in self.aceptacion
+
+    def avanzar(self, estado, datos, inicio=0, fin=None):
+        """Lee datos[inicio:fin] desde el estado dado; retorna el estado alcanzado (0 si muere)"""
+        tabla = self.tabla
+        clases = self.clases
+        vista = self.vista(datos)
+        for i in range(inicio, len(vista) if fin is None else fin):
+            estado = tabla[estado + clases[vista[i]]]
+            if not estado:
+                break
+        return estado
+
+    def coincidencia_mas_larga(self, datos, posicion, estado=None, limite=None):
+        """
+        Fin (en bytes) de la coincidencia más larga que empieza en 'posicion', o -1
+        La coincidencia no pasa de 'limite' (por defecto el final de los datos)
+        """
+        tabla = self.tabla
+        clases = self.clases
+        aceptacion = self.aceptacion
+        vista = self.vista(datos)
+        if estado is None:
+            estado = self.inicial
+        fin = posicion if estado in aceptacion else -1
+        for i in range(posicion, len(vista) if limite is None else limite):
+            estado = tabla[estado + clases[vista[i]]]
+            if not estado:
+                break
+            if estado in aceptacion:
+                fin = i + 1
+        return fin
+
+    def buscar(self, datos, inicio=0, limite=None):
+        """
+        Coincidencia más a la izquierda (y más larga) en datos[inicio:limite]
+        como (inicio, fin) en bytes, o None
+        Con prefijo literal se salta con find (bytes, bytearray y mmap lo tienen)
+        hasta su primera aparición; desde ahí una pasada hacia adelante da el fin
+        y otra hacia atrás, anclada en ese fin, da el inicio (tiempo lineal)
+        """
+        # Una memoryview recorta sin copiar el resto de los datos
+        vista = memoryview(self.vista(datos))
+        if limite is None:
+            limite = len(vista)
+        if self.prefijo and hasattr(datos, 'find'):
+            inicio = datos.find(self.prefijo, inicio, limite)
+            if inicio == -1:
+                return None
+        clases = self.clases.__getitem__
+        fin = self.adelante.fin(map(clases, vista[inicio:limite]), inicio)
+        if fin == -1:
+            return None
+        return self.atras.inicio(map(clases, reversed(vista[inicio:fin])), fin), fin
+
+    def existe(self, datos, inicio=0, limite=None):
+        """Indica si hay alguna coincidencia en datos[inicio:limite] (se detiene en la primera)"""
+        # Una memoryview recorta sin copiar el resto de los datos
+        vista = memoryview(self.vista(datos))
+        if limite is None:
+            limite = len(vista)
+        if self.prefijo and hasattr(datos, 'find'):
+            inicio = datos.find(self.prefijo, inicio, limite)
+            if inicio == -1:
+                return False
+        return self.adelante.existe(map(self.clases.__getitem__, vista[inicio:limite]))
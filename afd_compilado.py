@@ -0,0 +1,109 @@
+"""
+Representación compacta de un AFD para simular rápido: estados numerados 0..n-1,
+una lista de diccionarios {símbolo: destino} y una lista de aceptación
+Las transiciones hacia estados muertos se descartan: el simulador se detiene
+en cuanto ninguna continuación puede ser aceptada
+"""
+from collections import deque
+from itertools import islice
+from analisis_estados import AnalizadorEstados
+
+
+class AFDCompilado:
+    def __init__(self, afd):
+        """
+        Numera los estados alcanzables en orden de descubrimiento (el inicial es 0)
+        """
+        tabla = afd.tabla_determinista()
+        self.simbolos = sorted(afd.simbolos)
+        self.estados = [afd.estado_inicial]
+        self.indice = {afd.estado_inicial: 0}
+        cola = deque([afd.estado_inicial])
+        while cola:
+            estado = cola.popleft()
+            for simbolo in self.simbolos:
+                destino = tabla.get(estado, {}).get(simbolo)
+                if destino is not None and destino not in self.indice:
+                    self.indice[destino] = len(self.estados)
+                    self.estados.append(destino)
+                    cola.append(destino)
+
+        self.inicial = 0
+        self.transiciones = [
+            {simbolo: self.indice[destino] for simbolo, destino in tabla.get(estado, {}).items()}
+            for estado in self.estados
+        ]
+        self.aceptacion = [estado in afd.estados_aceptacion for estado in self.estados]
+        analizador = AnalizadorEstados(afd, tabla)
+        vivos = analizador.estados_vivos()
+        self.vivos = [estado in vivos for estado in self.estados]
+        for transiciones in self.transiciones:
+            for simbolo, destino in list(transiciones.items()):
+                if not self.vivos[destino]:
+                    del transiciones[simbolo]
+        universales = analizador.estados_universales()
+        self.universales = [estado in universales for estado in self.estados]
+        self.hay_universales = any(self.universales)
+        self.conjunto_simbolos = frozenset(self.simbolos)
+
+    def es_aceptacion(self, estado):
+        """Indica si el estado (None = sin transición) es de aceptación"""
+        return estado is not None and self.aceptacion[estado]
+
+    def es_vivo(self, estado):
+        """Indica si desde el estado (None = sin transición) todavía se puede aceptar"""
+        return estado is not None and self.vivos[estado]
+
+    def acepta(self, cadena):
+        """
+        Retorna True si la cadena completa es aceptada
+        Se detiene en un estado muerto (sin transición) o, si el AFD tiene estados
+        universales, al llegar a uno: basta que el resto esté en el alfabeto
+        """
+        transiciones = self.transiciones
+        estado = self.inicial
+        if not self.hay_universales:
+            for simbolo in cadena:
+                estado = transiciones[estado].get(simbolo)
+                if estado is None:
+                    return False
+            return self.aceptacion[estado]
+
+        universales = self.universales
+        for i, simbolo in enumerate(cadena):
+            if universales[estado]:
+                return self.conjunto_simbolos.issuperset(islice(cadena, i, None))
+            estado = transiciones[estado].get(simbolo)
+            if estado is None:
+                return False
+        return self.aceptacion[estado]
+
+    def avanzar(self, estado, texto, inicio=0, fin=None):
+        """
+        Lee texto[inicio:fin] desde el estado dado sin copiar el texto
+        Retorna el estado alcanzado o None si falta una transición
+        """
+        transiciones = self.transiciones
+        for i in range(inicio, len(texto) if fin is None else fin):
+            estado = transiciones[estado].get(texto[i])
+            if estado is None:
+                return None
+        return estado
+
+    def coincidencia_mas_larga(self, texto, posicion, estado=None):
+        """
+        Ejecuta el AFD sobre texto desde 'posicion' en el estado dado (por defecto
+        el inicial) y retorna el fin de la coincidencia más larga, o -1 si no hay
+        """
+        transiciones = self.transiciones
+        aceptacion = self.aceptacion
+        if estado is None:
+            estado = self.inicial
+        fin = posicion if aceptacion[estado] else -1
+        for i in range(posicion, len(texto)):
+            estado = transiciones[estado].get(texto[i])
+            if estado is None:
+                break
+            if aceptacion[estado]:
+                fin = i + 1
+        return fin
@@ -0,0 +1,70 @@
+"""
+Base de los AFD perezosos (construidos mientras se lee la entrada)
+Cada estado perezoso tiene una clave (por ejemplo, los estados del AFN que
+representa) y un número; las transiciones (estado, símbolo) se calculan una
+vez y quedan en caché. Si se crean demasiados estados, la caché se vacía en
+medio de la lectura conservando solo el estado actual (como RE2)
+"""
+
+# Si un AFD perezoso supera este número de estados se vacía su caché
+LIMITE_ESTADOS_PEREZOSOS = 10000
+
+
+class AFDPerezoso:
+    """
+    Las subclases definen paso(estado, símbolo) y, si guardan datos por estado,
+    reiniciar_datos() y agregar_datos(clave)
+    """
+    limite_estados = LIMITE_ESTADOS_PEREZOSOS
+
+    def __init__(self, clave_inicial):
+        self.clave_inicial = clave_inicial
+        self.vaciar_cache()
+
+    def vaciar_cache(self):
+        """Descarta todos los estados perezosos y crea de nuevo el inicial"""
+        self.claves = []
+        self.indices = {}
+        self.cache = {}
+        self.reiniciar_datos()
+        self.inicial = self.indice_estado(self.clave_inicial)
+
+    def reiniciar_datos(self):
+        """Vacía los datos por estado de la subclase"""
+
+    def agregar_datos(self, clave):
+        """Calcula los datos de la subclase para un estado nuevo"""
+
+    def indice_estado(self, clave):
+        """Número del estado perezoso con esa clave (lo crea si es nuevo)"""
+        indice = self.indices.get(clave)
+        if indice is None:
+            indice = self.indices[clave] = len(self.claves)
+            self.claves.append(clave)
+            self.agregar_datos(clave)
+        return indice
+
+    def paso(self, estado, simbolo):
+        """Transición del estado con el símbolo (sin caché)"""
+        raise NotImplementedError
+
+    def transicion_nueva(self, estado, simbolo):
+        """
+        Calcula una transición que no estaba en caché y la guarda
+        Si con ella se supera el límite de estados, la caché se vacía y solo se
+        conserva el destino; quien recorre debe volver a leer self.cache y los
+        datos por estado después de llamarla
+        """
+        transicion = self.cache[(estado, simbolo)] = self.paso(estado, simbolo)
+        if len(self.claves) > self.limite_estados:
+            transicion = self.reubicar(transicion)
+        return transicion
+
+    def reubicar(self, transicion):
+        """
+        Vacía la caché conservando el destino de la transición (aquí, el número
+        del estado destino); retorna la transición con el destino renumerado
+        """
+        clave = self.claves[transicion]
+        self.vaciar_cache()
+        return self.indice_estado(clave)
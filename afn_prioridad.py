@@ -0,0 +1,106 @@
+"""
+AFN de Thompson con alternativas ordenadas por prioridad
+Conserva el orden de la expresión (a|ab prefiere a; *, + y ? son codiciosos)
+para reproducir la semántica leftmost-first de los motores con backtracking
+"""
+from arbol_regex import (NodoVacio, NodoEpsilon, NodoSimbolo, NodoClase, NodoConcatenacion,
+                         NodoUnion, NodoEstrella, NodoPositiva, NodoOpcional)
+
+
+class AFNPrioridad:
+    def __init__(self, arbol):
+        """
+        Construye el AFN a partir del árbol sin optimizar (el optimizador puede
+        reordenar alternativas y cambiar la prioridad)
+        """
+        # epsilon[q]: destinos épsilon en orden de prioridad
+        # consumo[q]: (símbolos, destino) si q consume un carácter, None si no
+        self.epsilon = []
+        self.consumo = []
+        self.inicial, self.final = self.construir(arbol)
+
+    def nuevo_estado(self):
+        """Crea un estado sin transiciones y retorna su número"""
+        self.epsilon.append([])
+        self.consumo.append(None)
+        return len(self.epsilon) - 1
+
+    def construir(self, arbol):
+        """
+        Retorna (inicio, fin) del fragmento del árbol
+        Los nodos se recorren en postorden con una pila explícita (así un
+        anidamiento profundo no agota la recursión): cada nodo se arma con
+        los fragmentos de sus hijos, que quedan en orden en 'fragmentos'
+        """
+        fragmentos = []
+        pila = [(arbol, False)]
+        while pila:
+            nodo, listo = pila.pop()
+            hijos = nodo.subarboles()
+            if hijos and not listo:
+                pila.append((nodo, True))
+                pila.extend((hijo, False) for hijo in reversed(hijos))
+                continue
+            if hijos:
+                de_hijos = fragmentos[-len(hijos):]
+                del fragmentos[-len(hijos):]
+            else:
+                de_hijos = []
+            fragmentos.append(self.ensamblar(nodo, de_hijos))
+        return fragmentos[0]
+
+    def ensamblar(self, nodo, hijos):
+        """Retorna (inicio, fin) del fragmento del nodo a partir de los (inicio, fin) de sus hijos"""
+        inicio = self.nuevo_estado()
+        if isinstance(nodo, NodoConcatenacion):
+            actual = inicio
+            for inicio_hijo, fin_hijo in hijos:
+                self.epsilon[actual].append(inicio_hijo)
+                actual = fin_hijo
+            return inicio, actual
+
+        fin = self.nuevo_estado()
+        if isinstance(nodo, NodoSimbolo):
+            self.consumo[inicio] = (frozenset((nodo.simbolo,)), fin)
+        elif isinstance(nodo, NodoClase):
+            self.consumo[inicio] = (nodo.simbolos, fin)
+        elif isinstance(nodo, NodoEpsilon):
+            self.epsilon[inicio].append(fin)
+        elif isinstance(nodo, NodoUnion):
+            for inicio_hijo, fin_hijo in hijos:
+                self.epsilon[inicio].append(inicio_hijo)
+                self.epsilon[fin_hijo].append(fin)
+        elif isinstance(nodo, (NodoEstrella, NodoPositiva, NodoOpcional)):
+            inicio_hijo, fin_hijo = hijos[0]
+            self.epsilon[inicio].append(inicio_hijo)
+            if not isinstance(nodo, NodoPositiva):
+                self.epsilon[inicio].append(fin)
+            if isinstance(nodo, NodoOpcional):
+                self.epsilon[fin_hijo].append(fin)
+            else:
+                # Repetir tiene más prioridad que salir (codicioso)
+                self.epsilon[fin_hijo].extend([inicio_hijo, fin])
+        elif not isinstance(nodo, NodoVacio):
+            raise ValueError(f"Nodo desconocido: {nodo!r}")
+        return inicio, fin
+
+    def agregar_clausura(self, estado, hilos, vistos):
+        """
+        Agrega a 'hilos', en orden de prioridad, los estados que consumen (o el
+        final) alcanzables por épsilon desde 'estado'
+        Al llegar al final se corta: los hilos de menor prioridad ya no importan
+        Retorna True si hubo corte
+        """
+        pila = [estado]
+        while pila:
+            estado = pila.pop()
+            if estado in vistos:
+                continue
+            vistos.add(estado)
+            if estado == self.final:
+                hilos.append(estado)
+                return True
+            if self.consumo[estado] is not None:
+                hilos.append(estado)
+            pila.extend(reversed(self.epsilon[estado]))
+        return False
@@ -0,0 +1,49 @@
+"""
+Análisis de estados de un AFD: estados muertos (desde los que no se puede
+llegar a aceptación) y estados universales (de aceptación y que aceptan
+cualquier continuación sobre el alfabeto)
+Los simuladores los usan para dejar de leer la cadena antes del final
+"""
+
+
+class AnalizadorEstados:
+    def __init__(self, afd, tabla=None):
+        """tabla: afd.tabla_determinista(), si ya se calculó"""
+        self.afd = afd
+        self.tabla = afd.tabla_determinista() if tabla is None else tabla
+        self.predecesores = {}
+        for estado, transiciones in self.tabla.items():
+            for destino in transiciones.values():
+                self.predecesores.setdefault(destino, set()).add(estado)
+
+    def hacia_atras(self, iniciales):
+        """Estados desde los que se llega a alguno de 'iniciales' (incluidos)"""
+        alcanzados = set(iniciales)
+        pila = list(alcanzados)
+        while pila:
+            for predecesor in self.predecesores.get(pila.pop(), ()):
+                if predecesor not in alcanzados:
+                    alcanzados.add(predecesor)
+                    pila.append(predecesor)
+        return alcanzados
+
+    def estados_vivos(self):
+        """Estados desde los que se puede llegar a un estado de aceptación (co-alcanzables)"""
+        return self.hacia_atras(self.afd.estados_aceptacion)
+
+    def estados_muertos(self):
+        """Estados que ya no pueden aceptar ninguna continuación"""
+        return self.afd.estados - self.estados_vivos()
+
+    def estados_universales(self):
+        """
+        Estados de aceptación con transición en todo el alfabeto hacia otros
+        estados universales: aceptan cualquier continuación
+        Un estado no es universal si no es de aceptación, si le falta algún
+        símbolo o si llega a uno que no lo es; basta un recorrido hacia atrás
+        """
+        numero_simbolos = len(self.afd.simbolos)
+        incompletos = {estado for estado in self.afd.estados
+                       if estado not in self.afd.estados_aceptacion
+                       or len(self.tabla.get(estado, {})) != numero_simbolos}
+        return self.afd.estados - self.hacia_atras(incompletos)
@@ -0,0 +1,209 @@
+"""
+Análisis de literales obligatorios de un AFD (idealmente el mínimo): prefijo,
+sufijo y factor interno que aparecen en toda cadena aceptada
+"""
+from collections import deque
+from generador_cadenas import GeneradorCadenas
+
+
+class AnalizadorLiterales:
+    def __init__(self, afd):
+        self.afd = afd
+        self.tabla = afd.tabla_determinista()
+        self.alcanzables = self.calcular_alcanzables()
+        self.vivos = self.calcular_vivos(self.alcanzables)
+
+    def analizar(self):
+        """
+        Retorna un diccionario con:
+          prefijo: literal con el que empieza toda cadena aceptada
+          sufijo: literal con el que termina toda cadena aceptada
+          factor: literal interno más largo presente en toda cadena aceptada
+          distancia_factor: (mínima, máxima) posición donde empieza el factor;
+                            la máxima es None si no está acotada
+        Si el lenguaje es vacío todos los literales son ''
+        """
+        resultado = {'prefijo': '', 'sufijo': '', 'factor': '', 'distancia_factor': (0, 0)}
+        if self.afd.estado_inicial not in self.vivos:
+            return resultado
+
+        resultado['prefijo'] = self.literal_forzado(self.afd.estado_inicial)
+        resultado['sufijo'] = self.sufijo_obligatorio()
+
+        mejor_estado = self.afd.estado_inicial
+        mejor_factor = resultado['prefijo']
+        for estado in self.estados_obligatorios():
+            factor = self.literal_forzado(estado)
+            if len(factor) > len(mejor_factor):
+                mejor_estado, mejor_factor = estado, factor
+        resultado['factor'] = mejor_factor
+        resultado['distancia_factor'] = self.distancias(mejor_estado)
+
+        # El sufijo también es un factor; empieza a len(cadena) - len(sufijo)
+        sufijo = resultado['sufijo']
+        if len(sufijo) > len(mejor_factor):
+            generador = GeneradorCadenas(self.afd)
+            minima = len(generador.cadena_mas_corta_aceptada()) - len(sufijo)
+            maxima = generador.longitud_maxima_aceptada()
+            resultado['factor'] = sufijo
+            resultado['distancia_factor'] = (minima, None if maxima is None else maxima - len(sufijo))
+        return resultado
+
+    def sucesores_vivos(self, estado):
+        """Pares (símbolo, destino) hacia estados que aún pueden aceptar"""
+        return [(simbolo, destino) for simbolo, destino in sorted(self.tabla.get(estado, {}).items())
+                if destino in self.vivos]
+
+    def calcular_alcanzables(self, excluido=None):
+        """Estados alcanzables desde el inicial sin pasar por 'excluido'"""
+        inicial = self.afd.estado_inicial
+        if inicial == excluido:
+            return set()
+        alcanzables = {inicial}
+        pila = [inicial]
+        while pila:
+            estado = pila.pop()
+            for destino in self.tabla.get(estado, {}).values():
+                if destino != excluido and destino not in alcanzables:
+                    alcanzables.add(destino)
+                    pila.append(destino)
+        return alcanzables
+
+    def calcular_vivos(self, alcanzables):
+        """Estados alcanzables desde los que se puede llegar a aceptación"""
+        predecesores = {}
+        for estado in alcanzables:
+            for destino in self.tabla.get(estado, {}).values():
+                predecesores.setdefault(destino, set()).add(estado)
+        vivos = set(self.afd.estados_aceptacion) & alcanzables
+        pila = list(vivos)
+        while pila:
+            estado = pila.pop()
+            for predecesor in predecesores.get(estado, ()):
+                if predecesor not in vivos:
+                    vivos.add(predecesor)
+                    pila.append(predecesor)
+        return vivos
+
+    def literal_forzado(self, estado):
+        """
+        Sigue las transiciones obligatorias desde el estado: mientras no sea de
+        aceptación y tenga un único sucesor vivo, ese símbolo es forzado
+        """
+        literal = []
+        visitados = set()
+        while estado not in self.afd.estados_aceptacion and estado not in visitados:
+            visitados.add(estado)
+            sucesores = self.sucesores_vivos(estado)
+            if len(sucesores) != 1:
+                break
+            simbolo, estado = sucesores[0]
+            literal.append(simbolo)
+        return ''.join(literal)
+
+    def sufijo_obligatorio(self):
+        """
+        Sufijo común de todas las cadenas aceptadas, calculado hacia adelante:
+        sufijo[q] es el sufijo común de todos los caminos del inicial a q
+        (se itera hasta un punto fijo; los sufijos solo pueden acortarse)
+        """
+        inicial = self.afd.estado_inicial
+        sufijos = {inicial: ''}
+        cola = deque([inicial])
+        en_cola = {inicial}
+        while cola:
+            estado = cola.popleft()
+            en_cola.discard(estado)
+            for simbolo, destino in self.sucesores_vivos(estado):
+                candidato = sufijos[estado] + simbolo
+                if destino in sufijos:
+                    candidato = sufijo_comun(sufijos[destino], candidato)
+                    if candidato == sufijos[destino]:
+                        continue
+                sufijos[destino] = candidato
+                if destino not in en_cola:
+                    en_cola.add(destino)
+                    cola.append(destino)
+
+        resultado = None
+        for estado in self.afd.estados_aceptacion:
+            if estado in sufijos:
+                resultado = sufijos[estado] if resultado is None else sufijo_comun(resultado, sufijos[estado])
+        return resultado or ''
+
+    def estados_obligatorios(self):
+        """
+        Estados por los que pasa toda cadena aceptada: al quitarlos ya no se
+        puede llegar a aceptación desde el inicial
+        """
+        obligatorios = []
+        for estado in self.vivos:
+            if estado == self.afd.estado_inicial:
+                continue
+            if self.calcular_alcanzables(excluido=estado).isdisjoint(self.afd.estados_aceptacion):
+                obligatorios.append(estado)
+        return obligatorios
+
+    def distancias(self, objetivo):
+        """
+        Longitud mínima y máxima de los caminos vivos del inicial al objetivo
+        La máxima es None si algún camino contiene un ciclo
+        """
+        inicial = self.afd.estado_inicial
+        # Estados vivos que están en algún camino inicial -> objetivo
+        predecesores = {}
+        for estado in self.vivos:
+            for _, destino in self.sucesores_vivos(estado):
+                predecesores.setdefault(destino, set()).add(estado)
+        previos = {objetivo}
+        pila = [objetivo]
+        while pila:
+            for predecesor in predecesores.get(pila.pop(), ()):
+                if predecesor not in previos:
+                    previos.add(predecesor)
+                    pila.append(predecesor)
+
+        minima = {inicial: 0}
+        cola = deque([inicial])
+        while cola:
+            estado = cola.popleft()
+            for _, destino in self.sucesores_vivos(estado):
+                if destino in previos and destino not in minima:
+                    minima[destino] = minima[estado] + 1
+                    cola.append(destino)
+
+        # Camino más largo en el subgrafo (orden topológico de Kahn; ciclo => None)
+        subgrafo = {e: [d for _, d in self.sucesores_vivos(e) if d in previos] for e in previos}
+        if objetivo in subgrafo:
+            subgrafo[objetivo] = []
+        grado = {e: 0 for e in subgrafo}
+        for destinos in subgrafo.values():
+            for destino in destinos:
+                grado[destino] += 1
+        cola = deque(e for e, g in grado.items() if g == 0)
+        orden = []
+        while cola:
+            estado = cola.popleft()
+            orden.append(estado)
+            for destino in subgrafo[estado]:
+                grado[destino] -= 1
+                if grado[destino] == 0:
+                    cola.append(destino)
+        if len(orden) < len(subgrafo):
+            return minima.get(objetivo, 0), None
+
+        maxima = {inicial: 0}
+        for estado in orden:
+            if estado not in maxima:
+                continue
+            for destino in subgrafo[estado]:
+                maxima[destino] = max(maxima.get(destino, 0), maxima[estado] + 1)
+        return minima.get(objetivo, 0), maxima.get(objetivo, 0)
+
+
+def sufijo_comun(a, b):
+    """Sufijo común más largo de dos cadenas"""
+    i = 0
+    while i < len(a) and i < len(b) and a[len(a) - 1 - i] == b[len(b) - 1 - i]:
+        i += 1
+    return a[len(a) - i:]
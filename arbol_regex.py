@@ -0,0 +1,302 @@
+"""
+Árbol de sintaxis abstracta (AST) para expresiones regulares
+"""
+
+# Símbolos especiales que procesar_escapes usa para los caracteres escapados
+SIMBOLOS_CENTINELA = {
+    '●': '.',
+    '◆': '?',
+    '◎': '(',
+    '◉': ')',
+    '◈': '\\',
+    '◊': '{',
+    '◘': '}',
+}
+
+# Caracteres que deben escaparse al volver a escribir el árbol como expresión
+METACARACTERES = {'|', '·', '*', '+', '?', '(', ')', '[', ']', '\\', '.', '{', '}', 'E', 'ε'}
+
+
+class NodoRegex:
+    """
+    Clase base de los nodos del árbol
+    Los nodos son inmutables y se comparan por estructura, por lo que pueden
+    usarse como claves de diccionarios y en conjuntos
+    """
+    def __init__(self, clave):
+        self.clave = clave
+        self._hash = hash(clave)
+
+    def __eq__(self, otro):
+        # Comparación con una pila explícita: un árbol profundo no agota la recursión
+        pendientes = [(self, otro)]
+        while pendientes:
+            a, b = pendientes.pop()
+            if a is b:
+                continue
+            if isinstance(a, NodoRegex):
+                if not isinstance(b, NodoRegex) or a._hash != b._hash:
+                    return False
+                pendientes.append((a.clave, b.clave))
+            elif isinstance(a, tuple):
+                if not isinstance(b, tuple) or len(a) != len(b):
+                    return False
+                pendientes.extend(zip(a, b))
+            elif a != b:
+                return False
+        return True
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.a_expresion()!r})"
+
+    def anulable(self):
+        """Indica si el lenguaje del nodo contiene la cadena vacía"""
+        raise NotImplementedError
+
+    def subarboles(self):
+        """Hijos directos del nodo"""
+        return ()
+
+    def tamano(self):
+        """Número de nodos del subárbol"""
+        total = 0
+        pila = [self]
+        while pila:
+            total += 1
+            pila.extend(pila.pop().subarboles())
+        return total
+
+    def a_expresion(self):
+        """Escribe el subárbol con la sintaxis de entrada del proyecto"""
+        # Recorrido en postorden con pila explícita (los hijos se escriben antes que el padre)
+        textos = {}
+        pila = [(self, False)]
+        while pila:
+            nodo, listo = pila.pop()
+            hijos = nodo.subarboles()
+            if hijos and not listo:
+                pila.append((nodo, True))
+                pila.extend((hijo, False) for hijo in hijos)
+                continue
+            textos[id(nodo)] = nodo.escribir([textos[id(hijo)] for hijo in hijos])
+        return textos[id(self)]
+
+    def escribir(self, partes):
+        """Texto del nodo a partir de los textos de sus hijos (partes)"""
+        raise NotImplementedError
+
+
+class NodoVacio(NodoRegex):
+    """Lenguaje vacío (no acepta ninguna cadena)"""
+    def __init__(self):
+        super().__init__(('vacio',))
+
+    def anulable(self):
+        return False
+
+    def escribir(self, partes):
+        return '∅'
+
+
+class NodoEpsilon(NodoRegex):
+    """Cadena vacía"""
+    def __init__(self):
+        super().__init__(('epsilon',))
+
+    def anulable(self):
+        return True
+
+    def escribir(self, partes):
+        return 'ε'
+
+
+class NodoSimbolo(NodoRegex):
+    """Un único símbolo literal del alfabeto"""
+    def __init__(self, simbolo):
+        self.simbolo = simbolo
+        super().__init__(('simbolo', simbolo))
+
+    def anulable(self):
+        return False
+
+    def escribir(self, partes):
+        return escapar_simbolo(self.simbolo)
+
+
+class NodoClase(NodoRegex):
+    """Clase de caracteres: acepta exactamente uno de sus símbolos"""
+    def __init__(self, simbolos):
+        self.simbolos = frozenset(simbolos)
+        super().__init__(('clase', tuple(sorted(self.simbolos))))
+
+    def anulable(self):
+        return False
+
+    def escribir(self, partes):
+        simbolos = sorted(self.simbolos)
+        if all(s not in METACARACTERES for s in simbolos):
+            return '[' + ''.join(simbolos) + ']'
+        return '(' + '|'.join(escapar_simbolo(s) for s in simbolos) + ')'
+
+
+class NodoConcatenacion(NodoRegex):
+    """Concatenación de dos o más subexpresiones"""
+    def __init__(self, hijos):
+        self.hijos = tuple(hijos)
+        # anulable se calcula al construir: los hijos ya lo tienen calculado
+        self._anulable = all(hijo.anulable() for hijo in self.hijos)
+        super().__init__(('concatenacion', self.hijos))
+
+    def anulable(self):
+        return self._anulable
+
+    def subarboles(self):
+        return self.hijos
+
+    def escribir(self, partes):
+        return ''.join(f"({texto})" if isinstance(hijo, NodoUnion) else texto
+                       for hijo, texto in zip(self.hijos, partes))
+
+
+class NodoUnion(NodoRegex):
+    """Unión (alternativa) de dos o más subexpresiones"""
+    def __init__(self, hijos):
+        self.hijos = tuple(hijos)
+        self._anulable = any(hijo.anulable() for hijo in self.hijos)
+        super().__init__(('union', self.hijos))
+
+    def anulable(self):
+        return self._anulable
+
+    def subarboles(self):
+        return self.hijos
+
+    def escribir(self, partes):
+        return '|'.join(partes)
+
+
+class NodoUnario(NodoRegex):
+    """Base para los operadores unarios *, + y ?"""
+    operador = None
+
+    def __init__(self, hijo):
+        self.hijo = hijo
+        super().__init__((self.operador, hijo))
+
+    def subarboles(self):
+        return (self.hijo,)
+
+    def escribir(self, partes):
+        texto = partes[0]
+        if isinstance(self.hijo, (NodoConcatenacion, NodoUnion, NodoUnario)):
+            texto = f"({texto})"
+        return texto + self.operador
+
+
+class NodoEstrella(NodoUnario):
+    """Estrella de Kleene (cero o más repeticiones)"""
+    operador = '*'
+
+    def anulable(self):
+        return True
+
+
+class NodoPositiva(NodoUnario):
+    """Operador positivo (una o más repeticiones)"""
+    operador = '+'
+
+    def __init__(self, hijo):
+        self._anulable = hijo.anulable()
+        super().__init__(hijo)
+
+    def anulable(self):
+        return self._anulable
+
+
+class NodoOpcional(NodoUnario):
+    """Operador opcional (cero o una repetición)"""
+    operador = '?'
+
+    def anulable(self):
+        return True
+
+
+class NodoGrupo(NodoRegex):
+    """
+    Grupo de captura numerado; solo aparece con analizar_expresion(..., capturas=True)
+    (el resto de los módulos trata los paréntesis como simple agrupación)
+    """
+    def __init__(self, hijo, numero):
+        self.hijo = hijo
+        self.numero = numero
+        self._anulable = hijo.anulable()
+        super().__init__(('grupo', numero, hijo))
+
+    def anulable(self):
+        return self._anulable
+
+    def subarboles(self):
+        return (self.hijo,)
+
+    def escribir(self, partes):
+        return f"({partes[0]})"
+
+
+def escapar_simbolo(simbolo):
+    """Escapa un símbolo literal si coincide con un metacarácter"""
+    if simbolo in METACARACTERES:
+        return '\\' + simbolo
+    return simbolo
+
+
+def construir_arbol(postfix):
+    """
+    Construye el árbol de sintaxis a partir de una expresión en notación postfix
+    Sigue la misma semántica de pila que ConstructorAFN.convertir_postfix_a_afn
+    """
+    pila = []
+
+    for simbolo in postfix:
+        if simbolo == '·':
+            if len(pila) >= 2:
+                derecho = pila.pop()
+                izquierdo = pila.pop()
+                hijos = []
+                for nodo in (izquierdo, derecho):
+                    # Aplanar concatenaciones anidadas: a·b·c es un solo nodo
+                    if isinstance(nodo, NodoConcatenacion):
+                        hijos.extend(nodo.hijos)
+                    else:
+                        hijos.append(nodo)
+                pila.append(NodoConcatenacion(hijos))
+        elif simbolo == '|':
+            if len(pila) >= 2:
+                derecho = pila.pop()
+                izquierdo = pila.pop()
+                hijos = []
+                for nodo in (izquierdo, derecho):
+                    if isinstance(nodo, NodoUnion):
+                        hijos.extend(nodo.hijos)
+                    else:
+                        hijos.append(nodo)
+                pila.append(NodoUnion(hijos))
+        elif simbolo == '*':
+            if pila:
+                pila.append(NodoEstrella(pila.pop()))
+        elif simbolo == '+':
+            if pila:
+                pila.append(NodoPositiva(pila.pop()))
+        elif simbolo == '?':
+            if pila:
+                pila.append(NodoOpcional(pila.pop()))
+        elif simbolo == 'ε' or simbolo == 'E':
+            pila.append(NodoEpsilon())
+        elif simbolo not in ('(', ')', '[', ']', '\\'):
+            pila.append(NodoSimbolo(SIMBOLOS_CENTINELA.get(simbolo, simbolo)))
+
+    if pila:
+        return pila[0]
+    return NodoVacio()
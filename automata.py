@@ -47,6 +47,46 @@ class Automata:
         clave = (estado, simbolo)
         return self.transiciones.get(clave, set())
         
+    def tabla_determinista(self):
+        """
+        Retorna las transiciones como {estado: {simbolo: destino}}
+        Lanza ValueError si el autómata no es determinista
+        """
+        tabla = {}
+        for (estado_origen, simbolo), estados_destino in self.transiciones.items():
+            if simbolo == 'ε' or len(estados_destino) != 1:
+                raise ValueError(f"El autómata no es determinista en ({estado_origen}, {simbolo})")
+            tabla.setdefault(estado_origen, {})[simbolo] = next(iter(estados_destino))
+        return tabla
+        
+    def invertido(self):
+        """
+        Retorna el autómata (AFN) del lenguaje inverso: invierte las transiciones,
+        el inicial pasa a ser el único estado de aceptación y un nuevo estado
+        inicial entra con épsilon a los antiguos estados de aceptación
+        """
+        inverso = Automata()
+        inverso.simbolos = set(self.simbolos)
+        for estado in self.estados:
+            inverso.agregar_estado(estado)
+        for (estado_origen, simbolo), estados_destino in self.transiciones.items():
+            for estado_destino in estados_destino:
+                inverso.agregar_transicion(estado_destino, simbolo, estado_origen)
+        inverso.agregar_estado_aceptacion(self.estado_inicial)
+
+        if len(self.estados_aceptacion) == 1:
+            inverso.establecer_estado_inicial(next(iter(self.estados_aceptacion)))
+        else:
+            nuevo_inicial = max(self.estados) + 1 if self.estados else 0
+            inverso.establecer_estado_inicial(nuevo_inicial)
+            for estado in self.estados_aceptacion:
+                inverso.agregar_transicion(nuevo_inicial, 'ε', estado)
+        return inverso
+
+    def numero_transiciones(self):
+        """Cuenta las aristas del autómata (incluyendo las transiciones épsilon)"""
+        return sum(len(estados_destino) for estados_destino in self.transiciones.values())
+        
     def guardar_archivo(self, nombre_archivo):
         """Guarda el autómata en un archivo JSON"""
         datos = {
@@ -0,0 +1,202 @@
+"""
+Representación compacta de autómatas para autómatas muy grandes
+Estados y símbolos se numeran con enteros y las transiciones se guardan en
+formato CSR con arreglos de array: desplazamientos[q]..desplazamientos[q+1]
+son las posiciones de las aristas de q en etiquetas (símbolo) y destinos
+Se convierte desde y hacia Automata para visualizar y exportar a JSON
+"""
+import sys
+from array import array
+from bisect import bisect_left
+from automata import Automata
+
+# Etiqueta de las transiciones épsilon (los símbolos se numeran desde 0)
+EPSILON = -1
+
+
+class AutomataCompacto:
+    __slots__ = ('simbolos', 'indice_simbolo', 'inicial', 'aceptacion',
+                 'desplazamientos', 'etiquetas', 'destinos')
+
+    def __init__(self, simbolos, inicial, aceptacion, desplazamientos, etiquetas, destinos):
+        self.simbolos = tuple(simbolos)
+        self.indice_simbolo = {simbolo: i for i, simbolo in enumerate(self.simbolos)}
+        self.inicial = inicial
+        self.aceptacion = aceptacion          # bytearray: 1 si el estado es de aceptación
+        self.desplazamientos = desplazamientos  # array('I'), numero_estados() + 1 elementos
+        self.etiquetas = etiquetas            # array('i'): índice del símbolo o EPSILON
+        self.destinos = destinos              # array('I')
+
+    @classmethod
+    def desde_automata(cls, automata):
+        """
+        Convierte un Automata; los estados se numeran en orden (el inicial es 0)
+        y las aristas de cada estado quedan ordenadas por símbolo y destino
+        """
+        try:
+            nombres = sorted(automata.estados - {automata.estado_inicial})
+        except TypeError:
+            nombres = sorted(automata.estados - {automata.estado_inicial}, key=repr)
+        nombres.insert(0, automata.estado_inicial)
+        indice = {nombre: i for i, nombre in enumerate(nombres)}
+        simbolos = sorted(automata.simbolos)
+        indice_simbolo = {simbolo: i for i, simbolo in enumerate(simbolos)}
+
+        aristas = [[] for _ in nombres]
+        for (estado_origen, simbolo), estados_destino in automata.transiciones.items():
+            etiqueta = EPSILON if simbolo == 'ε' else indice_simbolo[simbolo]
+            for estado_destino in estados_destino:
+                aristas[indice[estado_origen]].append((etiqueta, indice[estado_destino]))
+
+        desplazamientos = array('I', [0])
+        etiquetas = array('i')
+        destinos = array('I')
+        for lista in aristas:
+            lista.sort()
+            for etiqueta, destino in lista:
+                etiquetas.append(etiqueta)
+                destinos.append(destino)
+            desplazamientos.append(len(destinos))
+        aceptacion = bytearray(nombre in automata.estados_aceptacion for nombre in nombres)
+        compacto = cls(simbolos, 0, aceptacion, desplazamientos, etiquetas, destinos)
+        compacto.validar()
+        return compacto
+
+    def validar(self):
+        """Las subclases verifican aquí sus restricciones"""
+
+    def a_automata(self):
+        """Automata equivalente con estados 0..n-1 (para el visualizador y JSON)"""
+        automata = Automata()
+        automata.simbolos = set(self.simbolos)
+        for estado in range(self.numero_estados()):
+            automata.agregar_estado(estado)
+            if self.aceptacion[estado]:
+                automata.agregar_estado_aceptacion(estado)
+            for simbolo, destino in self.aristas(estado):
+                automata.agregar_transicion(estado, simbolo, destino)
+        automata.establecer_estado_inicial(self.inicial)
+        return automata
+
+    def numero_estados(self):
+        return len(self.desplazamientos) - 1
+
+    def numero_transiciones(self):
+        return len(self.destinos)
+
+    def aristas(self, estado):
+        """Genera (símbolo, destino) del estado; las épsilon con el símbolo 'ε'"""
+        for i in range(self.desplazamientos[estado], self.desplazamientos[estado + 1]):
+            etiqueta = self.etiquetas[i]
+            yield ('ε' if etiqueta == EPSILON else self.simbolos[etiqueta]), self.destinos[i]
+
+    def memoria(self):
+        """Bytes aproximados que ocupan los arreglos de la representación"""
+        return sum(sys.getsizeof(arreglo) for arreglo in
+                   (self.aceptacion, self.desplazamientos, self.etiquetas, self.destinos))
+
+
+class AFNCompacto(AutomataCompacto):
+    __slots__ = ()
+
+    def clausura(self, estados):
+        """Épsilon-clausura de un conjunto de estados (las épsilon van primero en cada estado)"""
+        clausura = set(estados)
+        pila = list(estados)
+        desplazamientos, etiquetas, destinos = self.desplazamientos, self.etiquetas, self.destinos
+        while pila:
+            estado = pila.pop()
+            i = desplazamientos[estado]
+            fin = desplazamientos[estado + 1]
+            while i < fin and etiquetas[i] == EPSILON:
+                if destinos[i] not in clausura:
+                    clausura.add(destinos[i])
+                    pila.append(destinos[i])
+                i += 1
+        return clausura
+
+    def movimientos(self, estados):
+        """{índice de símbolo: destinos} de las aristas no épsilon del conjunto"""
+        resultado = {}
+        desplazamientos, etiquetas, destinos = self.desplazamientos, self.etiquetas, self.destinos
+        for estado in estados:
+            for i in range(desplazamientos[estado], desplazamientos[estado + 1]):
+                if etiquetas[i] != EPSILON:
+                    resultado.setdefault(etiquetas[i], set()).add(destinos[i])
+        return resultado
+
+    def acepta(self, cadena):
+        """Simulación por conjuntos de estados"""
+        actuales = self.clausura({self.inicial})
+        for simbolo in cadena:
+            etiqueta = self.indice_simbolo.get(simbolo)
+            if etiqueta is None:
+                return False
+            actuales = self.clausura(self.movimientos(actuales).get(etiqueta, ()))
+            if not actuales:
+                return False
+        return any(self.aceptacion[estado] for estado in actuales)
+
+
+class AFDCompacto(AutomataCompacto):
+    __slots__ = ()
+
+    def validar(self):
+        """Un AFD no tiene épsilon ni dos aristas con el mismo símbolo desde un estado"""
+        for estado in range(self.numero_estados()):
+            inicio, fin = self.desplazamientos[estado], self.desplazamientos[estado + 1]
+            for i in range(inicio, fin):
+                if self.etiquetas[i] == EPSILON or (i > inicio and self.etiquetas[i] == self.etiquetas[i - 1]):
+                    raise ValueError(f"El autómata no es determinista en el estado {estado}")
+
+    @classmethod
+    def desde_afn(cls, afn):
+        """
+        Construcción de subconjuntos sobre un AFNCompacto: cada subconjunto se
+        numera en cuanto aparece y sus aristas se agregan directamente a los
+        arreglos (los estados se procesan en orden, así el CSR queda ordenado)
+        """
+        inicial = frozenset(afn.clausura({afn.inicial}))
+        indices = {inicial: 0}
+        pendientes = [inicial]
+        desplazamientos = array('I', [0])
+        etiquetas = array('i')
+        destinos = array('I')
+        aceptacion = bytearray()
+
+        siguiente = 0
+        while siguiente < len(pendientes):
+            conjunto = pendientes[siguiente]
+            pendientes[siguiente] = None
+            siguiente += 1
+            aceptacion.append(any(afn.aceptacion[estado] for estado in conjunto))
+            for etiqueta, estados in sorted(afn.movimientos(conjunto).items()):
+                destino = frozenset(afn.clausura(estados))
+                if destino not in indices:
+                    indices[destino] = len(pendientes)
+                    pendientes.append(destino)
+                etiquetas.append(etiqueta)
+                destinos.append(indices[destino])
+            desplazamientos.append(len(destinos))
+        return cls(afn.simbolos, 0, aceptacion, desplazamientos, etiquetas, destinos)
+
+    def transicion(self, estado, etiqueta):
+        """Destino desde el estado con el símbolo de índice 'etiqueta', o -1 (búsqueda binaria)"""
+        inicio, fin = self.desplazamientos[estado], self.desplazamientos[estado + 1]
+        i = bisect_left(self.etiquetas, etiqueta, inicio, fin)
+        if i < fin and self.etiquetas[i] == etiqueta:
+            return self.destinos[i]
+        return -1
+
+    def acepta(self, cadena):
+        """Retorna True si la cadena es aceptada"""
+        estado = self.inicial
+        indice_simbolo = self.indice_simbolo
+        for simbolo in cadena:
+            etiqueta = indice_simbolo.get(simbolo)
+            if etiqueta is None:
+                return False
+            estado = self.transicion(estado, etiqueta)
+            if estado < 0:
+                return False
+        return bool(self.aceptacion[estado])
@@ -0,0 +1,118 @@
+"""
+Búsqueda de un patrón dentro de un texto acelerada con literales obligatorios:
+str.find salta a la primera posición candidata y desde ahí la búsqueda es lineal
+(una pasada hacia adelante para el fin y otra hacia atrás para el inicio)
+"""
+from afd_compilado import AFDCompilado
+from analisis_literales import AnalizadorLiterales
+from busqueda_lineal import BusquedaAdelante, BusquedaAtras
+
+
+class BuscadorAFD:
+    def __init__(self, afd):
+        """Recibe el AFD del patrón (idealmente el mínimo) y analiza sus literales"""
+        self.compilado = AFDCompilado(afd)
+        literales = AnalizadorLiterales(afd).analizar()
+        self.prefijo = literales['prefijo']
+        self.sufijo = literales['sufijo']
+        self.factor = literales['factor']
+        self.distancia_factor = literales['distancia_factor']
+        self.estado_tras_prefijo = self.compilado.avanzar(self.compilado.inicial, self.prefijo)
+        self.primeros = frozenset(self.compilado.transiciones[self.compilado.inicial])
+        self.posiciones_probadas = 0
+
+        finales = frozenset(estado for estado, acepta in enumerate(self.compilado.aceptacion) if acepta)
+        self.predecesores = {}
+        for origen, transiciones in enumerate(self.compilado.transiciones):
+            for simbolo, destino in transiciones.items():
+                self.predecesores.setdefault((destino, simbolo), []).append(origen)
+        self.adelante = BusquedaAdelante(self.siguiente, self.compilado.inicial, finales)
+        self.atras = BusquedaAtras(self.anteriores, self.compilado.inicial, finales)
+
+    def siguiente(self, estado, simbolo):
+        """Destino en el AFD compilado, o None"""
+        return self.compilado.transiciones[estado].get(simbolo)
+
+    def anteriores(self, estado, simbolo):
+        """Estados del AFD compilado que llegan al estado dado con el símbolo"""
+        return self.predecesores.get((estado, simbolo), ())
+
+    def estrategia(self):
+        """Nombre del método de salto que usará la búsqueda"""
+        if self.prefijo:
+            return 'prefijo'
+        if self.factor:
+            return 'factor'
+        return 'primer_simbolo'
+
+    def acepta(self, texto):
+        """Aceptación de la cadena completa con rechazo rápido por literales"""
+        if not texto.startswith(self.prefijo) or not texto.endswith(self.sufijo):
+            return False
+        if self.factor and self.factor not in texto:
+            return False
+        return self.compilado.acepta(texto)
+
+    def buscar(self, texto, inicio=0):
+        """
+        Coincidencia más a la izquierda y, entre ellas, la más larga
+        Retorna (inicio, fin) o None si el patrón no aparece desde 'inicio'
+        """
+        # Si falta un literal obligatorio no hace falta ejecutar el AFD
+        if self.sufijo and texto.find(self.sufijo, inicio) == -1:
+            return None
+        if self.prefijo:
+            return self.buscar_por_prefijo(texto, inicio)
+        if self.factor:
+            return self.buscar_por_factor(texto, inicio)
+        return self.buscar_por_primer_simbolo(texto, inicio)
+
+    def buscar_todas(self, texto):
+        """Genera las coincidencias (inicio, fin) sin solapamiento, de izquierda a derecha"""
+        posicion = 0
+        while posicion <= len(texto):
+            coincidencia = self.buscar(texto, posicion)
+            if coincidencia is None:
+                return
+            yield coincidencia
+            inicio, fin = coincidencia
+            posicion = fin if fin > inicio else fin + 1
+
+    def buscar_desde(self, texto, desde):
+        """
+        Coincidencia leftmost-longest que empieza en 'desde' o después, en tiempo lineal:
+        el fin sale de la pasada hacia adelante y el inicio de la pasada hacia atrás
+        """
+        self.posiciones_probadas += 1
+        obtener = texto.__getitem__
+        fin = self.adelante.fin(map(obtener, range(desde, len(texto))), desde)
+        if fin == -1:
+            return None
+        return self.atras.inicio(map(obtener, range(fin - 1, desde - 1, -1)), fin), fin
+
+    def buscar_por_prefijo(self, texto, inicio):
+        """Toda coincidencia empieza con el prefijo: se busca desde su primera aparición"""
+        posicion = texto.find(self.prefijo, inicio)
+        if posicion == -1:
+            return None
+        return self.buscar_desde(texto, posicion)
+
+    def buscar_por_factor(self, texto, inicio):
+        """
+        Toda coincidencia que empieza en i contiene el factor en una posición p con
+        i + mínima <= p <= i + máxima; la primera aparición del factor (desde
+        inicio + mínima) acota el inicio de la primera coincidencia
+        """
+        minima, maxima = self.distancia_factor
+        aparicion = texto.find(self.factor, inicio + minima)
+        if aparicion == -1:
+            return None
+        return self.buscar_desde(texto, inicio if maxima is None else max(inicio, aparicion - maxima))
+
+    def buscar_por_primer_simbolo(self, texto, inicio):
+        """Sin literales útiles: se empieza en el primer símbolo inicial posible"""
+        if not self.compilado.aceptacion[self.compilado.inicial]:
+            primeros = self.primeros
+            while inicio < len(texto) and texto[inicio] not in primeros:
+                inicio += 1
+        return self.buscar_desde(texto, inicio)
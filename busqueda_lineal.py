@@ -0,0 +1,144 @@
+"""
+Búsqueda leftmost-longest en tiempo lineal sobre un AFD (de caracteres o de bytes)
+Hacia adelante, un AFD perezoso de Σ*·L sigue un hilo por cada inicio posible y
+encuentra el fin de la coincidencia; hacia atrás, un AFD perezoso del lenguaje
+inverso, anclado en ese fin, encuentra el inicio (como busqueda_regex, sin prioridades)
+Cada símbolo del texto se lee a lo sumo una vez en cada sentido
+"""
+from afd_perezoso import AFDPerezoso
+
+
+class BusquedaAdelante(AFDPerezoso):
+    def __init__(self, siguiente, inicial, finales):
+        """
+        siguiente(q, símbolo): destino en el AFD o None; inicial y finales del AFD
+        Estado perezoso: (hilos, bucle); los hilos son estados del AFD ordenados
+        por su inicio (el primero empezó antes) y, mientras bucle es True (aún no
+        hubo aceptación), cada paso agrega al final un hilo que empieza ahí
+        """
+        self.siguiente = siguiente
+        self.inicial_afd = inicial
+        self.finales = finales
+        super().__init__(((inicial,), inicial not in finales))
+
+    def reiniciar_datos(self):
+        self.aceptacion = []
+        self.muertos = []
+
+    def agregar_datos(self, clave):
+        hilos, bucle = clave
+        # Tras un paso solo el último hilo puede estar en aceptación (ver paso)
+        self.aceptacion.append(bool(hilos) and hilos[-1] in self.finales)
+        self.muertos.append(not hilos and not bucle)
+
+    def paso(self, indice, simbolo):
+        """
+        Avanza los hilos en orden; dos hilos en el mismo estado tienen el mismo
+        futuro y se conserva el que empezó antes. Cuando un hilo acepta, los que
+        empezaron después se descartan y no se agregan más: ninguno daría una
+        coincidencia más a la izquierda
+        """
+        hilos, bucle = self.claves[indice]
+        nuevos = []
+        vistos = set()
+        for estado in hilos:
+            destino = self.siguiente(estado, simbolo)
+            if destino is None or destino in vistos:
+                continue
+            vistos.add(destino)
+            nuevos.append(destino)
+            if destino in self.finales:
+                return self.indice_estado((tuple(nuevos), False))
+        if bucle and self.inicial_afd not in vistos:
+            nuevos.append(self.inicial_afd)
+        return self.indice_estado((tuple(nuevos), bucle))
+
+    def fin(self, simbolos, inicio):
+        """
+        Lee los símbolos (el texto desde 'inicio') y retorna el fin de la
+        coincidencia leftmost-longest, o -1 si no hay
+        """
+        cache = self.cache
+        aceptacion = self.aceptacion
+        muertos = self.muertos
+        estado = self.inicial
+        fin = inicio if aceptacion[estado] else -1
+        posicion = inicio
+        for simbolo in simbolos:
+            posicion += 1
+            siguiente = cache.get((estado, simbolo))
+            if siguiente is None:
+                siguiente = self.transicion_nueva(estado, simbolo)
+                cache, aceptacion, muertos = self.cache, self.aceptacion, self.muertos
+            estado = siguiente
+            if aceptacion[estado]:
+                fin = posicion
+            elif muertos[estado]:
+                break
+        return fin
+
+    def existe(self, simbolos):
+        """Indica si alguna coincidencia termina dentro de los símbolos (se detiene en la primera)"""
+        cache = self.cache
+        aceptacion = self.aceptacion
+        estado = self.inicial
+        if aceptacion[estado]:
+            return True
+        for simbolo in simbolos:
+            siguiente = cache.get((estado, simbolo))
+            if siguiente is None:
+                siguiente = self.transicion_nueva(estado, simbolo)
+                cache, aceptacion = self.cache, self.aceptacion
+            estado = siguiente
+            if aceptacion[estado]:
+                return True
+        return False
+
+
+class BusquedaAtras(AFDPerezoso):
+    def __init__(self, anteriores, inicial, finales):
+        """
+        anteriores(q, símbolo): estados del AFD que llegan a q con el símbolo
+        Estado perezoso: conjunto de estados del AFD desde los que lo leído
+        (hacia atrás) lleva a aceptación
+        """
+        self.anteriores = anteriores
+        self.inicial_afd = inicial
+        super().__init__(frozenset(finales))
+
+    def reiniciar_datos(self):
+        self.aceptacion = []
+        self.muertos = []
+
+    def agregar_datos(self, clave):
+        self.aceptacion.append(self.inicial_afd in clave)
+        self.muertos.append(not clave)
+
+    def paso(self, indice, simbolo):
+        return self.indice_estado(frozenset(origen for estado in self.claves[indice]
+                                            for origen in self.anteriores(estado, simbolo)))
+
+    def inicio(self, simbolos_al_reves, fin):
+        """
+        Lee hacia atrás los símbolos que terminan en 'fin' (texto[inicio:fin] invertido)
+        y retorna el menor i tal que texto[i:fin] es aceptado; la búsqueda hacia
+        adelante ya garantizó que hay uno
+        """
+        cache = self.cache
+        aceptacion = self.aceptacion
+        muertos = self.muertos
+        estado = self.inicial
+        comienzo = fin
+        posicion = fin
+        for simbolo in simbolos_al_reves:
+            posicion -= 1
+            siguiente = cache.get((estado, simbolo))
+            if siguiente is None:
+                siguiente = self.transicion_nueva(estado, simbolo)
+                cache, aceptacion, muertos = self.cache, self.aceptacion, self.muertos
+            estado = siguiente
+            if aceptacion[estado]:
+                comienzo = posicion
+            elif muertos[estado]:
+                break
+        return comienzo
@@ -0,0 +1,131 @@
+"""
+Búsqueda no anclada con posiciones (inicio, fin) en tiempo lineal, sin backtracking
+Un AFD perezoso hacia adelante con prefijo .* encuentra el fin de la coincidencia
+y un AFD inverso, anclado en ese fin, encuentra el inicio (enfoque de RE2)
+"""
+from afn_prioridad import AFNPrioridad
+from afd_compilado import AFDCompilado
+from afd_perezoso import AFDPerezoso
+from analisis_literales import AnalizadorLiterales
+from constructor_afd import ConstructorAFD
+from minimizador_afd import MinimizadorAFD
+
+MODOS_BUSQUEDA = ('primera', 'mas_larga')
+
+
+class BuscadorRegex(AFDPerezoso):
+    def __init__(self, arbol, afd):
+        """
+        arbol: árbol de sintaxis sin optimizar (da la prioridad de las alternativas)
+        afd: AFD mínimo de la misma expresión
+        Estado perezoso hacia adelante: (hilos en orden de prioridad, si el prefijo .* sigue vivo)
+        """
+        self.afn = AFNPrioridad(arbol)
+        self.compilado = AFDCompilado(afd)
+        inverso = ConstructorAFD().convertir_afn_a_afd(afd.invertido())
+        self.inverso = AFDCompilado(MinimizadorAFD().minimizar_afd(inverso))
+        self.prefijo = AnalizadorLiterales(afd).analizar()['prefijo']
+        hilos = []
+        cortado = self.afn.agregar_clausura(self.afn.inicial, hilos, set())
+        super().__init__((tuple(hilos), not cortado))
+
+    def reiniciar_datos(self):
+        self.aceptacion = []
+        self.muertos = []
+
+    def agregar_datos(self, clave):
+        hilos, bucle = clave
+        self.aceptacion.append(bool(hilos) and hilos[-1] == self.afn.final)
+        self.muertos.append(not hilos and not bucle)
+
+    def paso(self, indice, simbolo):
+        """
+        Transición del AFD perezoso: avanza los hilos en orden de prioridad y,
+        mientras no haya coincidencia, agrega al final un hilo nuevo (.* perezoso)
+        """
+        hilos, bucle = self.claves[indice]
+        nuevos = []
+        vistos = set()
+        cortado = False
+        for estado in hilos:
+            consumo = self.afn.consumo[estado]
+            if consumo is not None and simbolo in consumo[0]:
+                if self.afn.agregar_clausura(consumo[1], nuevos, vistos):
+                    cortado = True
+                    break
+        if bucle and not cortado:
+            cortado = self.afn.agregar_clausura(self.afn.inicial, nuevos, vistos)
+        return self.indice_estado((tuple(nuevos), bucle and not cortado))
+
+    def buscar(self, texto, inicio=0, modo='primera'):
+        """
+        Primera coincidencia en texto[inicio:] como (inicio, fin), o None
+        modo 'primera': leftmost-first (la que elegiría un motor con backtracking)
+        modo 'mas_larga': leftmost-longest (POSIX)
+        """
+        if modo not in MODOS_BUSQUEDA:
+            raise ValueError(f"Modo de búsqueda desconocido: {modo} (use {', '.join(MODOS_BUSQUEDA)})")
+        if self.prefijo:
+            # Ninguna coincidencia puede empezar antes de la primera aparición del prefijo
+            inicio = texto.find(self.prefijo, inicio)
+            if inicio == -1:
+                return None
+
+        fin = self.fin_primera(texto, inicio)
+        if fin == -1:
+            return None
+        comienzo = self.inicio_desde_fin(texto, inicio, fin)
+        if modo == 'mas_larga':
+            fin = self.compilado.coincidencia_mas_larga(texto, comienzo)
+        return comienzo, fin
+
+    def buscar_todas(self, texto, modo='primera'):
+        """Genera las coincidencias (inicio, fin) sin solapamiento, de izquierda a derecha"""
+        posicion = 0
+        while posicion <= len(texto):
+            coincidencia = self.buscar(texto, posicion, modo)
+            if coincidencia is None:
+                return
+            yield coincidencia
+            inicio, fin = coincidencia
+            posicion = fin if fin > inicio else fin + 1
+
+    def fin_primera(self, texto, inicio):
+        """
+        Recorre el texto una vez con el AFD perezoso y retorna el fin de la
+        coincidencia leftmost-first, o -1 si no hay ninguna
+        """
+        cache = self.cache
+        aceptacion = self.aceptacion
+        muertos = self.muertos
+        estado = self.inicial
+        fin = inicio if aceptacion[estado] else -1
+        for i in range(inicio, len(texto)):
+            simbolo = texto[i]
+            siguiente = cache.get((estado, simbolo))
+            if siguiente is None:
+                siguiente = self.transicion_nueva(estado, simbolo)
+                cache, aceptacion, muertos = self.cache, self.aceptacion, self.muertos
+            estado = siguiente
+            if aceptacion[estado]:
+                fin = i + 1
+            elif muertos[estado]:
+                break
+        return fin
+
+    def inicio_desde_fin(self, texto, inicio, fin):
+        """
+        Ejecuta el AFD inverso desde 'fin' hacia atrás y retorna el menor inicio
+        i >= 'inicio' tal que texto[i:fin] es aceptado
+        """
+        transiciones = self.inverso.transiciones
+        aceptacion = self.inverso.aceptacion
+        estado = self.inverso.inicial
+        comienzo = fin
+        for i in range(fin - 1, inicio - 1, -1):
+            estado = transiciones[estado].get(texto[i])
+            if estado is None:
+                break
+            if aceptacion[estado]:
+                comienzo = i
+        return comienzo
@@ -0,0 +1,167 @@
+"""
+Grupos de captura sin backtracking, en tiempo lineal
+El AFN con prioridades marca la entrada y la salida de cada grupo (etiquetas);
+un AFD etiquetado perezoso guarda en cada transición, además del destino, qué
+hilo anterior continúa cada hilo nuevo y qué etiquetas fija en el camino
+Así, con la transición en caché, un paso solo copia posiciones entre hilos
+"""
+from afn_prioridad import AFNPrioridad
+from arbol_regex import NodoGrupo
+from afd_perezoso import AFDPerezoso
+
+
+class AFNCapturas(AFNPrioridad):
+    def __init__(self, arbol):
+        """
+        marcas[q]: etiqueta que se fija al pasar por q (2g al entrar al grupo g,
+        2g+1 al salir) o None
+        """
+        self.marcas = []
+        self.numero_grupos = 0
+        super().__init__(arbol)
+
+    def nuevo_estado(self):
+        self.marcas.append(None)
+        return super().nuevo_estado()
+
+    def ensamblar(self, nodo, hijos):
+        """Como en AFNPrioridad, con dos estados marcados alrededor de cada grupo"""
+        if not isinstance(nodo, NodoGrupo):
+            return super().ensamblar(nodo, hijos)
+        self.numero_grupos = max(self.numero_grupos, nodo.numero)
+        entrada = self.nuevo_estado()
+        salida = self.nuevo_estado()
+        self.marcas[entrada] = 2 * nodo.numero
+        self.marcas[salida] = 2 * nodo.numero + 1
+        inicio_hijo, fin_hijo = hijos[0]
+        self.epsilon[entrada].append(inicio_hijo)
+        self.epsilon[fin_hijo].append(salida)
+        return entrada, salida
+
+    def clausura_etiquetada(self, estado, hilos, vistos):
+        """
+        Agrega a 'hilos', en orden de prioridad, (estado, etiquetas del camino)
+        de los estados que consumen (o el final) alcanzables por épsilon
+        Cada estado queda con el camino de mayor prioridad que lo alcanza
+        """
+        pila = [(estado, ())]
+        while pila:
+            estado, etiquetas = pila.pop()
+            if estado in vistos:
+                continue
+            vistos.add(estado)
+            if self.marcas[estado] is not None:
+                etiquetas = etiquetas + (self.marcas[estado],)
+            if estado == self.final or self.consumo[estado] is not None:
+                hilos.append((estado, etiquetas))
+            for destino in reversed(self.epsilon[estado]):
+                pila.append((destino, etiquetas))
+
+
+class ExtractorCapturas(AFDPerezoso):
+    def __init__(self, arbol, buscador=None):
+        """
+        arbol: árbol con grupos (analizar_expresion(expresion, capturas=True))
+        buscador: BuscadorRegex de la misma expresión, para buscar() en textos
+        """
+        self.afn = AFNCapturas(arbol)
+        self.numero_grupos = self.afn.numero_grupos
+        self.buscador = buscador
+        # Estado perezoso: estados del AFN en orden de prioridad
+        hilos = []
+        self.afn.clausura_etiquetada(self.afn.inicial, hilos, set())
+        # Operaciones iniciales: cada hilo parte de un registro vacío (el hilo 0)
+        self.operaciones_iniciales = tuple((0, etiquetas) for _, etiquetas in hilos)
+        super().__init__(tuple(estado for estado, _ in hilos))
+
+    def paso(self, indice, simbolo):
+        """
+        Retorna (estado perezoso destino, operaciones); la operación i es
+        (hilo anterior que continúa el hilo nuevo i, etiquetas que fija)
+        """
+        afn = self.afn
+        nuevos = []
+        operaciones = []
+        vistos = set()
+        for j, estado in enumerate(self.claves[indice]):
+            consumo = afn.consumo[estado]
+            if consumo is not None and simbolo in consumo[0]:
+                antes = len(nuevos)
+                afn.clausura_etiquetada(consumo[1], nuevos, vistos)
+                operaciones.extend((j, etiquetas) for _, etiquetas in nuevos[antes:])
+        return self.indice_estado(tuple(estado for estado, _ in nuevos)), tuple(operaciones)
+
+    def reubicar(self, transicion):
+        """
+        La transición es (destino, operaciones): se conserva el destino; sus hilos
+        siguen en el mismo orden, así los registros siguen valiendo
+        """
+        destino, operaciones = transicion
+        return super().reubicar(destino), operaciones
+
+    def aplicar(self, registros, operaciones, posicion):
+        """
+        Registros (posiciones de las etiquetas) de los hilos nuevos
+        Un registro no se modifica después de creado, así que un hilo sin
+        etiquetas nuevas comparte el de su hilo anterior en lugar de copiarlo
+        """
+        nuevos = []
+        for anterior, etiquetas in operaciones:
+            if not etiquetas:
+                nuevos.append(registros[anterior])
+                continue
+            registro = list(registros[anterior])
+            for etiqueta in etiquetas:
+                registro[etiqueta] = posicion
+            nuevos.append(registro)
+        return nuevos
+
+    def coincidir(self, texto, inicio=0, fin=None):
+        """
+        Si texto[inicio:fin] completo es aceptado, retorna los intervalos de los
+        grupos: [(inicio, fin) del total, grupo 1, grupo 2, ...] con None para
+        los grupos que no participan; si no, None
+        Entre varias formas de aceptar elige la de un motor con backtracking
+        (alternativas en orden, repeticiones codiciosas), salvo en repeticiones
+        que pueden ser vacías y contienen otra: aquí no hay iteraciones vacías,
+        mientras que re de Python agrega una al final (en ((a)*)+ sobre 'aa' el
+        grupo 1 queda (0, 2) aquí y (2, 2) en re)
+        """
+        if fin is None:
+            fin = len(texto)
+        cache = self.cache
+        estado = self.inicial
+        vacio = [-1] * (2 * self.numero_grupos + 2)
+        registros = self.aplicar([vacio], self.operaciones_iniciales, inicio)
+        for i in range(inicio, fin):
+            simbolo = texto[i]
+            transicion = cache.get((estado, simbolo))
+            if transicion is None:
+                transicion = self.transicion_nueva(estado, simbolo)
+                cache = self.cache
+            estado, operaciones = transicion
+            registros = self.aplicar(registros, operaciones, i + 1)
+            if not registros:
+                return None
+
+        for hilo, estado_afn in enumerate(self.claves[estado]):
+            if estado_afn == self.afn.final:
+                registro = registros[hilo]
+                grupos = [(inicio, fin)]
+                for numero in range(1, self.numero_grupos + 1):
+                    apertura, cierre = registro[2 * numero], registro[2 * numero + 1]
+                    grupos.append((apertura, cierre) if apertura != -1 and cierre != -1 else None)
+                return grupos
+        return None
+
+    def buscar(self, texto, inicio=0):
+        """
+        Primera coincidencia (leftmost-first) en texto[inicio:] con sus grupos,
+        o None; el intervalo lo da el buscador y los grupos coincidir()
+        """
+        if self.buscador is None:
+            raise ValueError("Se necesita un BuscadorRegex para buscar dentro de textos")
+        coincidencia = self.buscador.buscar(texto, inicio)
+        if coincidencia is None:
+            return None
+        return self.coincidir(texto, *coincidencia)
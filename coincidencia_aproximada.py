@@ -0,0 +1,132 @@
+"""
+Reconocimiento aproximado: acepta cadenas que están a lo sumo a k ediciones
+(inserciones, eliminaciones o sustituciones) de alguna cadena del lenguaje
+Simula el AFN de Levenshtein sobre el AFN de Thompson: una fila de estados por
+cantidad de errores, cada fila es un entero usado como conjunto de bits, y los
+conjuntos alcanzados se determinizan de forma perezosa (tiempo lineal en la entrada)
+"""
+from afd_perezoso import AFDPerezoso
+
+
+class ReconocedorAproximado(AFDPerezoso):
+    def __init__(self, afn, maximo_errores=1):
+        """
+        afn: AFN de Thompson (con épsilon) de la expresión
+        maximo_errores: k, el número máximo de ediciones toleradas
+        """
+        if maximo_errores < 0:
+            raise ValueError("El número máximo de errores no puede ser negativo")
+        self.maximo_errores = maximo_errores
+
+        try:
+            estados = sorted(afn.estados)
+        except TypeError:
+            estados = sorted(afn.estados, key=repr)
+        bit = {estado: 1 << i for i, estado in enumerate(estados)}
+        self.aceptacion = 0
+        for estado in afn.estados_aceptacion:
+            self.aceptacion |= bit[estado]
+
+        # Épsilon-clausura de cada estado como máscara
+        self.clausuras = []
+        for estado in estados:
+            mascara = bit[estado]
+            pila = [estado]
+            while pila:
+                for destino in afn.obtener_transiciones(pila.pop(), 'ε'):
+                    if not mascara & bit[destino]:
+                        mascara |= bit[destino]
+                        pila.append(destino)
+            self.clausuras.append(mascara)
+
+        # avances[simbolo][i]: clausura de los destinos del estado i con el símbolo
+        # cualquiera[i]: lo mismo con cualquier símbolo (sustituciones y eliminaciones)
+        self.avances = {}
+        self.cualquiera = [0] * len(estados)
+        for (estado, simbolo), destinos in afn.transiciones.items():
+            if simbolo == 'ε':
+                continue
+            mascara = 0
+            for destino in destinos:
+                mascara |= self.clausuras[bit[destino].bit_length() - 1]
+            i = bit[estado].bit_length() - 1
+            fila = self.avances.setdefault(simbolo, [0] * len(estados))
+            fila[i] |= mascara
+            self.cualquiera[i] |= mascara
+
+        inicial = self.clausuras[bit[afn.estado_inicial].bit_length() - 1]
+        filas = [inicial]
+        for _ in range(maximo_errores):
+            filas.append(filas[-1] | self.unir(self.cualquiera, filas[-1]))
+        super().__init__(tuple(filas))
+
+    def reiniciar_datos(self):
+        self.distancias = []
+        self.muertos = []
+
+    def agregar_datos(self, filas):
+        # Menor cantidad de errores con la que se llega a aceptación (None si ninguna)
+        self.distancias.append(next((errores for errores, fila in enumerate(filas)
+                                     if fila & self.aceptacion), None))
+        # Ni con todos los errores queda algún estado: ya no se puede aceptar
+        self.muertos.append(not filas[-1])
+
+    def unir(self, tabla, mascara):
+        """Unión de tabla[i] para cada bit i de la máscara"""
+        resultado = 0
+        while mascara:
+            menor = mascara & -mascara
+            resultado |= tabla[menor.bit_length() - 1]
+            mascara ^= menor
+        return resultado
+
+    def paso(self, indice, simbolo):
+        """
+        Transición del AFD perezoso; con e errores se llega a un estado:
+        leyendo el símbolo con e errores, insertándolo (se queda) o sustituyéndolo
+        con e-1, o eliminando un símbolo del patrón desde la fila e-1 ya calculada
+        """
+        filas = self.claves[indice]
+        avance = self.avances.get(simbolo)
+        nuevas = [self.unir(avance, filas[0]) if avance else 0]
+        for errores in range(1, len(filas)):
+            fila = self.unir(avance, filas[errores]) if avance else 0
+            fila |= filas[errores - 1] | self.unir(self.cualquiera, filas[errores - 1])
+            fila |= self.unir(self.cualquiera, nuevas[-1])
+            nuevas.append(fila | nuevas[-1])
+        return self.indice_estado(tuple(nuevas))
+
+    def distancia(self, cadena):
+        """
+        Menor número de ediciones que lleva la cadena al lenguaje, o None si
+        hacen falta más de maximo_errores
+        """
+        cache = self.cache
+        muertos = self.muertos
+        estado = self.inicial
+        for simbolo in cadena:
+            siguiente = cache.get((estado, simbolo))
+            if siguiente is None:
+                siguiente = self.transicion_nueva(estado, simbolo)
+                cache, muertos = self.cache, self.muertos
+            estado = siguiente
+            if muertos[estado]:
+                return None
+        return self.distancias[estado]
+
+    def acepta(self, cadena):
+        """Retorna True si la cadena está a lo sumo a maximo_errores ediciones del lenguaje"""
+        return self.distancia(cadena) is not None
+
+    def mas_cercanas(self, candidatas):
+        """
+        Candidatas a menor distancia, ordenadas por distancia y en su orden original
+        Retorna [(distancia, candidata)] (útil para sugerir identificadores)
+        """
+        resultado = []
+        for candidata in candidatas:
+            distancia = self.distancia(candidata)
+            if distancia is not None:
+                resultado.append((distancia, candidata))
+        resultado.sort(key=lambda par: par[0])
+        return resultado
@@ -0,0 +1,239 @@
+"""
+Compilación silenciosa de expresiones regulares (sin imprimir ni guardar archivos)
+Encadena Shunting Yard, árbol de sintaxis, optimizador, Thompson, subconjuntos y Hopcroft
+"""
+import time
+from shunting_yard import convertir_a_postfix, analizar_expresion
+from arbol_regex import construir_arbol
+from optimizador_regex import OptimizadorRegex
+from constructor_afn import ConstructorAFN
+from constructor_afd import ConstructorAFD
+from minimizador_afd import MinimizadorAFD
+from eliminador_epsilon import EliminadorEpsilon
+from equivalencia_afd import ComparadorAFD
+from inclusion_afn import VerificadorInclusion
+from buscador import BuscadorAFD
+from busqueda_regex import BuscadorRegex
+from afd_bytes import AFDBytes
+from generador_codigo import GeneradorCodigo
+from coincidencia_aproximada import ReconocedorAproximado
+from motor_glushkov import AutomataGlushkov
+from estimador_costo import EstimadorCosto, PRESUPUESTO_ESTADOS
+from afd_compilado import AFDCompilado
+from simulador_afd import SimuladorAFD
+from capturas import ExtractorCapturas
+from plegado_mayusculas import ReconocedorSinMayusculas, plegar_arbol, normalizar
+
+
+def construir_arbol_optimizado(expresion):
+    """Retorna el árbol de sintaxis simplificado de la expresión"""
+    arbol = analizar_expresion(expresion)
+    return OptimizadorRegex().optimizar(arbol)
+
+
+def postfix_expresion(expresion, ignorar_mayusculas=False):
+    """Postfix de la expresión; con ignorar_mayusculas, plegado (los operadores no cambian al plegarse)"""
+    postfix = convertir_a_postfix(expresion)
+    return normalizar(postfix) if ignorar_mayusculas else postfix
+
+
+def compilar_afn(expresion, optimizar=True, sin_epsilon=False, memo_afd=None, ignorar_mayusculas=False):
+    """
+    Construye el AFN de Thompson de la expresión
+    Optimizando, los subárboles repetidos se construyen una sola vez y, con un
+    MemoSubAFD, se reutilizan los AFD de subexpresiones de compilaciones anteriores
+    (el memo también registra la reutilización de fragmentos: memo.tasa_reutilizacion())
+    Si sin_epsilon es True, se eliminan sus transiciones épsilon
+    Con ignorar_mayusculas los símbolos se pliegan (la entrada debe pasar por
+    plegado_mayusculas.normalizar, ver compilar_sin_mayusculas)
+    """
+    if optimizar:
+        try:
+            if ignorar_mayusculas:
+                arbol = OptimizadorRegex().optimizar(plegar_arbol(analizar_expresion(expresion)))
+            else:
+                arbol = construir_arbol_optimizado(expresion)
+            afn = ConstructorAFN(memo_afd).convertir_arbol_compartido(arbol)
+        except RecursionError:
+            # Anidamiento demasiado profundo para la construcción sobre el árbol:
+            # la construcción desde el postfix no es recursiva
+            afn = ConstructorAFN().convertir_postfix_a_afn(postfix_expresion(expresion, ignorar_mayusculas))
+    else:
+        afn = ConstructorAFN().convertir_postfix_a_afn(postfix_expresion(expresion, ignorar_mayusculas))
+    if sin_epsilon:
+        afn = EliminadorEpsilon().eliminar_epsilon(afn)
+    return afn
+
+
+def compilar_afd(expresion, optimizar=True, sin_epsilon=False, minimizar=True, memo_afd=None,
+                 ignorar_mayusculas=False):
+    """Construye el AFD (mínimo, salvo que minimizar sea False) de la expresión"""
+    afn = compilar_afn(expresion, optimizar, sin_epsilon, memo_afd, ignorar_mayusculas)
+    afd = ConstructorAFD().convertir_afn_a_afd(afn)
+    if not minimizar:
+        return afd
+    return MinimizadorAFD().minimizar_afd(afd)
+
+
+def expresiones_equivalentes(expresion1, expresion2):
+    """
+    Verifica si dos expresiones aceptan el mismo lenguaje (sin minimizar los AFD)
+    Retorna (True, None) o (False, cadena más corta que las distingue)
+    """
+    afd1 = compilar_afd(expresion1, minimizar=False)
+    afd2 = compilar_afd(expresion2, minimizar=False)
+    return ComparadorAFD().son_equivalentes(afd1, afd2)
+
+
+def comparar_optimizacion(expresion):
+    """
+    Mide el tamaño del AFN y del AFD sin optimizar y optimizando el árbol
+    Retorna un diccionario {medida: (antes, después)}
+    """
+    postfix = convertir_a_postfix(expresion)
+    arbol = construir_arbol(postfix)
+    arbol_optimizado = OptimizadorRegex().optimizar(arbol)
+
+    afn_antes = ConstructorAFN().convertir_postfix_a_afn(postfix)
+    afn_despues = ConstructorAFN().convertir_arbol_a_afn(arbol_optimizado)
+    afd_antes = ConstructorAFD().convertir_afn_a_afd(afn_antes)
+    afd_despues = ConstructorAFD().convertir_afn_a_afd(afn_despues)
+
+    return {
+        'expresion': (arbol.a_expresion(), arbol_optimizado.a_expresion()),
+        'nodos_arbol': (arbol.tamano(), arbol_optimizado.tamano()),
+        'estados_afn': (len(afn_antes.estados), len(afn_despues.estados)),
+        'transiciones_afn': (afn_antes.numero_transiciones(), afn_despues.numero_transiciones()),
+        'estados_afd': (len(afd_antes.estados), len(afd_despues.estados)),
+        'transiciones_afd': (afd_antes.numero_transiciones(), afd_despues.numero_transiciones()),
+    }
+
+
+def mostrar_comparacion_optimizacion(expresion):
+    """Muestra en consola el tamaño de los autómatas antes y después de optimizar"""
+    comparacion = comparar_optimizacion(expresion)
+    antes, despues = comparacion.pop('expresion')
+    print(f"Árbol original:   {antes}")
+    print(f"Árbol optimizado: {despues}")
+    print(f"{'Medida':<20}{'Antes':>10}{'Después':>10}")
+    for medida, (valor_antes, valor_despues) in comparacion.items():
+        print(f"{medida:<20}{valor_antes:>10}{valor_despues:>10}")
+    return comparacion
+
+
+def expresion_incluida(expresion_nueva, expresion_vieja):
+    """
+    Verifica si L(expresion_nueva) ⊆ L(expresion_vieja) sobre los AFN, sin determinizar
+    Retorna (True, None) o (False, cadena aceptada por la nueva y no por la vieja)
+    """
+    afn_nuevo = compilar_afn(expresion_nueva, sin_epsilon=True)
+    afn_viejo = compilar_afn(expresion_vieja, sin_epsilon=True)
+    return VerificadorInclusion().incluido(afn_nuevo, afn_viejo)
+
+
+def compilar_buscador(expresion):
+    """Buscador del patrón dentro de textos, acelerado con los literales del AFD mínimo"""
+    return BuscadorAFD(compilar_afd(expresion))
+
+
+def compilar_busqueda(expresion):
+    """Buscador no anclado (leftmost-first o leftmost-longest) de la expresión"""
+    return BuscadorRegex(analizar_expresion(expresion), compilar_afd(expresion))
+
+
+def compilar_afd_bytes(expresion):
+    """AFD mínimo de la expresión llevado a bytes UTF-8 (ver afd_bytes)"""
+    return AFDBytes(compilar_afd(expresion))
+
+
+def compilar_funcion(expresion, estrategia='traducir'):
+    """Función acepta(cadena) generada como código Python (con caché en disco)"""
+    return GeneradorCodigo(compilar_afd(expresion)).compilar(estrategia)
+
+
+def compilar_aproximado(expresion, maximo_errores=1):
+    """Reconocedor que tolera hasta maximo_errores ediciones (ver coincidencia_aproximada)"""
+    return ReconocedorAproximado(compilar_afn(expresion), maximo_errores)
+
+
+def estimar_costo(expresion, presupuesto=PRESUPUESTO_ESTADOS):
+    """
+    Reporte de costo de la expresión antes de construir el AFD (ver estimador_costo):
+    tamaño del AFN, formas explosivas, determinización de muestra y motor sugerido
+    """
+    arbol = construir_arbol_optimizado(expresion)
+    afn = ConstructorAFN().convertir_arbol_compartido(arbol)
+    return EstimadorCosto(arbol, presupuesto).estimar(afn)
+
+
+def compilar_motor(expresion, presupuesto=PRESUPUESTO_ESTADOS):
+    """
+    Elige el motor con estimar_costo: el AFD mínimo si entra en el presupuesto;
+    si no, el autómata de Glushkov bit-paralelo (hasta LIMITE_POSICIONES posiciones)
+    o un AFD perezoso con caché acotada
+    Todos ofrecen acepta(cadena)
+    """
+    motor = estimar_costo(expresion, presupuesto)['motor']
+    if motor == 'afd':
+        return AFDCompilado(compilar_afd(expresion))
+    if motor == 'glushkov':
+        return AutomataGlushkov(construir_arbol_optimizado(expresion))
+    # Sin errores permitidos, el reconocedor aproximado es un AFD perezoso sobre el AFN
+    return ReconocedorAproximado(compilar_afn(expresion), 0)
+
+
+def comparar_motores(expresion, cadenas, repeticiones=3):
+    """
+    Mide compilación y reconocimiento de las cadenas (el mejor de varias repeticiones)
+    con Glushkov, con ConstructorAFD → SimuladorAFD y con el AFD por tablas
+    Retorna {motor: (segundos compilando, segundos reconociendo)}
+    """
+    def compilar_glushkov():
+        return AutomataGlushkov(construir_arbol_optimizado(expresion)).acepta
+
+    def compilar_simulador():
+        simulador = SimuladorAFD(compilar_afd(expresion))
+        return lambda cadena: simulador.simular_cadena_paso_a_paso(cadena)[1]
+
+    def compilar_tablas():
+        return AFDCompilado(compilar_afd(expresion)).acepta
+
+    motores = {'glushkov': compilar_glushkov, 'simulador_afd': compilar_simulador,
+               'afd_compilado': compilar_tablas}
+    resultados = {}
+    for nombre, compilar in motores.items():
+        mejor_compilacion = mejor_reconocimiento = None
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            acepta = compilar()
+            medio = time.perf_counter()
+            for cadena in cadenas:
+                acepta(cadena)
+            fin = time.perf_counter()
+            mejor_compilacion = medio - inicio if mejor_compilacion is None else min(mejor_compilacion, medio - inicio)
+            mejor_reconocimiento = fin - medio if mejor_reconocimiento is None else min(mejor_reconocimiento, fin - medio)
+        resultados[nombre] = (mejor_compilacion, mejor_reconocimiento)
+    return resultados
+
+
+def mostrar_comparacion_motores(expresion, cadenas, repeticiones=3):
+    """Muestra en consola los tiempos de comparar_motores (en milisegundos)"""
+    resultados = comparar_motores(expresion, cadenas, repeticiones)
+    print(f"{'Motor':<16}{'Compilar (ms)':>15}{'Reconocer (ms)':>16}")
+    for nombre, (compilacion, reconocimiento) in resultados.items():
+        print(f"{nombre:<16}{compilacion * 1000:>15.3f}{reconocimiento * 1000:>16.3f}")
+    return resultados
+
+
+def compilar_capturas(expresion):
+    """Extractor de grupos de captura (cada paréntesis es un grupo; ver capturas)"""
+    return ExtractorCapturas(analizar_expresion(expresion, capturas=True), compilar_busqueda(expresion))
+
+
+def compilar_sin_mayusculas(expresion):
+    """
+    Reconocedor que no distingue mayúsculas de minúsculas: el AFD se compila
+    con los símbolos plegados y la entrada se normaliza con str.translate
+    Las búsquedas usan un BuscadorAFD sobre el texto normalizado
+    """
+    return ReconocedorSinMayusculas(BuscadorAFD(compilar_afd(expresion, ignorar_mayusculas=True)))
@@ -6,6 +6,7 @@ from automata import Automata
 class ConstructorAFD:
     def __init__(self):
         self.contador_estados = 0
+        self.tiene_epsilon = True
         
     def convertir_afn_a_afd(self, afn):
         """
@@ -13,6 +14,9 @@ class ConstructorAFD:
         """
         afd = Automata()
         
+        # Un AFN sin transiciones épsilon (ver eliminador_epsilon) no necesita clausuras
+        self.tiene_epsilon = any(simbolo == 'ε' for (_, simbolo) in afn.transiciones)
+        
         # Calcular epsilon-clausura del estado inicial
         epsilon_clausura_inicial = self.epsilon_clausura(afn, {afn.estado_inicial})
         
@@ -70,6 +74,9 @@ class ConstructorAFD:
         Calcula la epsilon-clausura de un conjunto de estados
         """
         clausura = conjunto_estados.copy()
+        if not self.tiene_epsilon:
+            return clausura
+
         pila = list(conjunto_estados)
         
         while pila:
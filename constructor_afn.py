@@ -1,11 +1,70 @@
 """
 Implementación del algoritmo de Thompson para convertir expresiones regulares a AFN
 """
+from collections import OrderedDict
 from automata import Automata
+from shunting_yard import OPERADORES_RESERVADOS
+from arbol_regex import (SIMBOLOS_CENTINELA, NodoVacio, NodoEpsilon, NodoSimbolo, NodoClase, NodoConcatenacion,
+                         NodoUnion, NodoEstrella, NodoPositiva, NodoOpcional)
+from constructor_afd import ConstructorAFD
+from minimizador_afd import MinimizadorAFD
+
+
+class MemoSubAFD:
+    """
+    AFD mínimos de subexpresiones, por estructura del subárbol (los nodos son
+    hashables); se comparte entre compilaciones para reutilizar las partes que
+    no cambian al editar un patrón
+    También acumula la reutilización de fragmentos de los ConstructorAFN que lo usan
+    """
+    def __init__(self, tamano_minimo=8, capacidad=256):
+        """
+        tamano_minimo: solo se guardan subárboles con al menos ese número de nodos
+        capacidad: número máximo de AFD guardados (se descarta el usado hace más tiempo)
+        """
+        self.tamano_minimo = tamano_minimo
+        self.capacidad = capacidad
+        self.afds = OrderedDict()
+        self.consultas = 0
+        self.aciertos = 0
+        self.fragmentos_consultados = 0
+        self.fragmentos_reutilizados = 0
+
+    def obtener(self, nodo):
+        """AFD guardado del subárbol o None"""
+        self.consultas += 1
+        afd = self.afds.get(nodo)
+        if afd is not None:
+            self.afds.move_to_end(nodo)
+            self.aciertos += 1
+        return afd
+
+    def guardar(self, nodo, afd):
+        """Guarda el AFD y descarta el usado hace más tiempo si se excede la capacidad"""
+        self.afds[nodo] = afd
+        self.afds.move_to_end(nodo)
+        while len(self.afds) > self.capacidad:
+            self.afds.popitem(last=False)
+
+    def tasa_aciertos(self):
+        """Fracción de consultas resueltas con un AFD ya calculado"""
+        return self.aciertos / self.consultas if self.consultas else 0.0
+
+    def tasa_reutilizacion(self):
+        """Fracción de fragmentos pedidos que ya estaban construidos, en todas las compilaciones"""
+        if not self.fragmentos_consultados:
+            return 0.0
+        return self.fragmentos_reutilizados / self.fragmentos_consultados
+
 
 class ConstructorAFN:
-    def __init__(self):
+    def __init__(self, memo_afd=None):
         self.contador_estados = 0
+        self.memo_afd = memo_afd
+        # Fragmentos ya construidos por (subárbol, estado de continuación)
+        self.fragmentos = {}
+        self.fragmentos_consultados = 0
+        self.fragmentos_reutilizados = 0
         
     def nuevo_estado(self):
         """Genera un nuevo estado único"""
@@ -63,18 +122,135 @@ class ConstructorAFN:
             # AFN vacío
             return self.crear_afn_vacio()
     
+    def convertir_arbol_a_afn(self, arbol):
+        """
+        Convierte un árbol de sintaxis (ver arbol_regex) a un AFN usando Thompson
+        Las clases de caracteres generan un solo par de estados y las uniones
+        de n alternativas comparten un único estado inicial y final
+        """
+        if isinstance(arbol, NodoVacio):
+            return self.crear_afn_vacio()
+        elif isinstance(arbol, NodoEpsilon):
+            return self.crear_afn_simbolo('ε')
+        elif isinstance(arbol, NodoSimbolo):
+            return self.crear_afn_clase([arbol.simbolo])
+        elif isinstance(arbol, NodoClase):
+            return self.crear_afn_clase(arbol.simbolos)
+        elif isinstance(arbol, NodoConcatenacion):
+            return self.concatenar_multiple([self.convertir_arbol_a_afn(hijo) for hijo in arbol.hijos])
+        elif isinstance(arbol, NodoUnion):
+            return self.union_multiple([self.convertir_arbol_a_afn(hijo) for hijo in arbol.hijos])
+        elif isinstance(arbol, NodoEstrella):
+            return self.estrella_kleene(self.convertir_arbol_a_afn(arbol.hijo))
+        elif isinstance(arbol, NodoPositiva):
+            return self.positiva(self.convertir_arbol_a_afn(arbol.hijo))
+        elif isinstance(arbol, NodoOpcional):
+            return self.opcional(self.convertir_arbol_a_afn(arbol.hijo))
+        raise ValueError(f"Nodo de expresión regular no soportado: {arbol!r}")
+
+    def convertir_arbol_compartido(self, arbol):
+        """
+        Thompson con continuaciones y hash-consing: cada subárbol se construye
+        hacia el estado que lo sigue, y el par (subárbol, continuación) se
+        construye una sola vez (el lenguaje de un estado depende solo de sus
+        transiciones de salida, así compartirlo no cambia el lenguaje)
+        Ejemplo: en x(ab|cd)|y(ab|cd) el grupo (ab|cd) se construye una vez
+        Con memo_afd, los subárboles grandes se insertan como su AFD mínimo
+        """
+        afn = Automata()
+        self.fragmentos = {}
+        final = self.nuevo_estado()
+        afn.agregar_estado_aceptacion(final)
+        afn.establecer_estado_inicial(self.fragmento(afn, arbol, final, raiz=True))
+        return afn
+
+    def fragmento(self, afn, nodo, continuacion, raiz=False):
+        """Retorna el estado desde el que se reconoce nodo seguido de la continuación"""
+        if isinstance(nodo, NodoEpsilon):
+            return continuacion
+        if isinstance(nodo, NodoConcatenacion):
+            for hijo in reversed(nodo.hijos):
+                continuacion = self.fragmento(afn, hijo, continuacion)
+            return continuacion
+
+        clave = (nodo, continuacion)
+        reutilizado = clave in self.fragmentos
+        self.fragmentos_consultados += 1
+        self.fragmentos_reutilizados += reutilizado
+        if self.memo_afd is not None:
+            self.memo_afd.fragmentos_consultados += 1
+            self.memo_afd.fragmentos_reutilizados += reutilizado
+        if reutilizado:
+            return self.fragmentos[clave]
+
+        if not raiz and self.memo_afd is not None and nodo.tamano() >= self.memo_afd.tamano_minimo:
+            entrada = self.incrustar_afd(afn, self.sub_afd(nodo), continuacion)
+        else:
+            entrada = self.nuevo_estado()
+            afn.agregar_estado(entrada)
+            if isinstance(nodo, NodoSimbolo):
+                afn.agregar_transicion(entrada, nodo.simbolo, continuacion)
+            elif isinstance(nodo, NodoClase):
+                for simbolo in sorted(nodo.simbolos):
+                    afn.agregar_transicion(entrada, simbolo, continuacion)
+            elif isinstance(nodo, NodoUnion):
+                for hijo in nodo.hijos:
+                    afn.agregar_transicion(entrada, 'ε', self.fragmento(afn, hijo, continuacion))
+            elif isinstance(nodo, NodoEstrella):
+                # entrada es el estado del ciclo: repetir el hijo o salir
+                afn.agregar_transicion(entrada, 'ε', self.fragmento(afn, nodo.hijo, entrada))
+                afn.agregar_transicion(entrada, 'ε', continuacion)
+            elif isinstance(nodo, NodoPositiva):
+                ciclo = entrada
+                entrada = self.fragmento(afn, nodo.hijo, ciclo)
+                afn.agregar_transicion(ciclo, 'ε', entrada)
+                afn.agregar_transicion(ciclo, 'ε', continuacion)
+            elif isinstance(nodo, NodoOpcional):
+                afn.agregar_transicion(entrada, 'ε', self.fragmento(afn, nodo.hijo, continuacion))
+                afn.agregar_transicion(entrada, 'ε', continuacion)
+            elif not isinstance(nodo, NodoVacio):
+                raise ValueError(f"Nodo de expresión regular no soportado: {nodo!r}")
+        self.fragmentos[clave] = entrada
+        return entrada
+
+    def sub_afd(self, nodo):
+        """AFD mínimo del subárbol, tomado de memo_afd o calculado y guardado"""
+        afd = self.memo_afd.obtener(nodo)
+        if afd is not None:
+            return afd
+        afn = ConstructorAFN(self.memo_afd).convertir_arbol_compartido(nodo)
+        afd = MinimizadorAFD().minimizar_afd(ConstructorAFD().convertir_afn_a_afd(afn))
+        self.memo_afd.guardar(nodo, afd)
+        return afd
+
+    def incrustar_afd(self, afn, afd, continuacion):
+        """Copia el AFD con estados nuevos; sus estados de aceptación siguen a la continuación"""
+        mapeo = {}
+        for estado in afd.estados:
+            mapeo[estado] = self.nuevo_estado()
+            afn.agregar_estado(mapeo[estado])
+        for (estado_origen, simbolo), estados_destino in afd.transiciones.items():
+            for estado_destino in estados_destino:
+                afn.agregar_transicion(mapeo[estado_origen], simbolo, mapeo[estado_destino])
+        for estado in afd.estados_aceptacion:
+            afn.agregar_transicion(mapeo[estado], 'ε', continuacion)
+        return mapeo[afd.estado_inicial]
+
+    def tasa_reutilizacion(self):
+        """Fracción de fragmentos pedidos que ya estaban construidos"""
+        if not self.fragmentos_consultados:
+            return 0.0
+        return self.fragmentos_reutilizados / self.fragmentos_consultados
+
     def es_simbolo(self, caracter):
         """
         Determina si un carácter es un símbolo del alfabeto
         (letras, dígitos, épsilon, @, . literal, etc.)
         """
-        # Operadores y metacaracteres reservados del regex  
-        operadores_reservados = {'|', '·', '*', '+', '(', ')', '[', ']', '\\', '?'}
-        
         # Un símbolo es cualquier carácter que NO sea un operador reservado
         # El punto (.) es ahora un símbolo literal
         # El operador de concatenación es · (MIDDLE DOT)
-        return caracter not in operadores_reservados
+        return caracter not in OPERADORES_RESERVADOS
     
     def crear_afn_simbolo(self, simbolo):
         """Crea un AFN básico que acepta un solo símbolo"""
@@ -88,32 +264,26 @@ class ConstructorAFN:
         if simbolo == 'ε' or simbolo == 'E':
             # Para épsilon, hacer transición épsilon
             afn.agregar_transicion(estado_inicial, 'ε', estado_final)
-        elif simbolo == '●':
-            # Punto literal - convertir de vuelta a '.'
-            afn.agregar_transicion(estado_inicial, '.', estado_final)
-        elif simbolo == '◆':
-            # Signo de interrogación literal - convertir de vuelta a '?'
-            afn.agregar_transicion(estado_inicial, '?', estado_final)
-        elif simbolo == '◎':
-            # Paréntesis izquierdo literal - convertir de vuelta a '('
-            afn.agregar_transicion(estado_inicial, '(', estado_final)
-        elif simbolo == '◉':
-            # Paréntesis derecho literal - convertir de vuelta a ')'
-            afn.agregar_transicion(estado_inicial, ')', estado_final)
-        elif simbolo == '◈':
-            # Barra invertida literal - convertir de vuelta a '\'
-            afn.agregar_transicion(estado_inicial, '\\', estado_final)
-        elif simbolo == '◊':
-            # Llave izquierda literal - convertir de vuelta a '{'
-            afn.agregar_transicion(estado_inicial, '{', estado_final)
-        elif simbolo == '◘':
-            # Llave derecha literal - convertir de vuelta a '}'
-            afn.agregar_transicion(estado_inicial, '}', estado_final)
         else:
-            afn.agregar_transicion(estado_inicial, simbolo, estado_final)
+            # Los escapes (●, ◆, ...) se convierten de vuelta al carácter literal
+            afn.agregar_transicion(estado_inicial, SIMBOLOS_CENTINELA.get(simbolo, simbolo), estado_final)
         
         return afn
     
+    def crear_afn_clase(self, simbolos):
+        """Crea un AFN básico que acepta uno cualquiera de los símbolos (literales)"""
+        afn = Automata()
+        estado_inicial = self.nuevo_estado()
+        estado_final = self.nuevo_estado()
+
+        afn.establecer_estado_inicial(estado_inicial)
+        afn.agregar_estado_aceptacion(estado_final)
+
+        for simbolo in sorted(simbolos):
+            afn.agregar_transicion(estado_inicial, simbolo, estado_final)
+
+        return afn
+
     def crear_afn_vacio(self):
         """Crea un AFN que no acepta nada"""
         afn = Automata()
@@ -138,6 +308,26 @@ class ConstructorAFN:
         
         return afn_resultado
     
+    def concatenar_multiple(self, afns):
+        """
+        Concatena n AFN en orden copiando cada uno una sola vez
+        (plegar concatenar sería cuadrático en expresiones muy largas)
+        """
+        afn_resultado = Automata()
+        afn_resultado.estado_inicial = afns[0].estado_inicial
+        afn_resultado.estados_aceptacion = afns[-1].estados_aceptacion.copy()
+
+        for afn in afns:
+            afn_resultado.estados.update(afn.estados)
+            afn_resultado.simbolos.update(afn.simbolos)
+            afn_resultado.transiciones.update(afn.transiciones)
+
+        for afn_anterior, afn_siguiente in zip(afns, afns[1:]):
+            for estado_final in afn_anterior.estados_aceptacion:
+                afn_resultado.agregar_transicion(estado_final, 'ε', afn_siguiente.estado_inicial)
+
+        return afn_resultado
+
     def union(self, afn1, afn2):
         """Crea la unión de dos AFN"""
         afn_resultado = Automata()
@@ -167,6 +357,31 @@ class ConstructorAFN:
         
         return afn_resultado
     
+    def union_multiple(self, afns):
+        """Crea la unión de n AFN con un solo estado inicial y un solo estado final"""
+        if len(afns) == 1:
+            return afns[0]
+
+        afn_resultado = Automata()
+
+        nuevo_inicial = self.nuevo_estado()
+        afn_resultado.establecer_estado_inicial(nuevo_inicial)
+
+        nuevo_final = self.nuevo_estado()
+        afn_resultado.agregar_estado_aceptacion(nuevo_final)
+
+        for afn in afns:
+            afn_resultado.estados.update(afn.estados)
+            afn_resultado.simbolos.update(afn.simbolos)
+            afn_resultado.transiciones.update(afn.transiciones)
+
+        for afn in afns:
+            afn_resultado.agregar_transicion(nuevo_inicial, 'ε', afn.estado_inicial)
+            for estado_final in afn.estados_aceptacion:
+                afn_resultado.agregar_transicion(estado_final, 'ε', nuevo_final)
+
+        return afn_resultado
+
     def estrella_kleene(self, afn):
         """Aplica la estrella de Kleene a un AFN"""
         afn_resultado = Automata()
@@ -217,22 +432,26 @@ class ConstructorAFN:
         """Aplica el operador ? (cero o una repetición) a un AFN"""
         afn_resultado = Automata()
         
-        # Nuevo estado inicial/final
-        nuevo_estado = self.nuevo_estado()
-        afn_resultado.establecer_estado_inicial(nuevo_estado)
-        afn_resultado.agregar_estado_aceptacion(nuevo_estado)
+        # Nuevos estados inicial y final (separados para no crear un ciclo)
+        nuevo_inicial = self.nuevo_estado()
+        afn_resultado.establecer_estado_inicial(nuevo_inicial)
+        
+        nuevo_final = self.nuevo_estado()
+        afn_resultado.agregar_estado_aceptacion(nuevo_final)
         
         # Copiar estados y transiciones del AFN original
         afn_resultado.estados = afn_resultado.estados.union(afn.estados)
         afn_resultado.simbolos = afn.simbolos.copy()
         afn_resultado.transiciones = afn.transiciones.copy()
         
-        # Conectar nuevo estado con el inicial del AFN original (para "una ocurrencia")
-        afn_resultado.agregar_transicion(nuevo_estado, 'ε', afn.estado_inicial)
+        # Conectar nuevo inicial con el inicial del AFN original (para "una ocurrencia")
+        afn_resultado.agregar_transicion(nuevo_inicial, 'ε', afn.estado_inicial)
+        
+        # Conectar nuevo inicial directamente con el nuevo final (para "cero ocurrencias")
+        afn_resultado.agregar_transicion(nuevo_inicial, 'ε', nuevo_final)
         
         # Conectar estados finales del AFN original con el nuevo estado final
         for estado_final in afn.estados_aceptacion:
-            afn_resultado.agregar_transicion(estado_final, 'ε', nuevo_estado)
+            afn_resultado.agregar_transicion(estado_final, 'ε', nuevo_final)
         
-        # El nuevo estado ya es de aceptación, permitiendo "cero ocurrencias"
         return afn_resultado
@@ -0,0 +1,185 @@
+"""
+Conteo del número de cadenas aceptadas por longitud en un AFD (idealmente mínimo)
+Usa NumPy si está disponible; sin NumPy se usa la misma aritmética en Python puro
+"""
+import math
+from analisis_estados import AnalizadorEstados
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MODOS = ('exacto', 'flotante', 'log')
+
+
+class ContadorLenguaje:
+    def __init__(self, afd):
+        self.afd = afd
+        self.estados = self.estados_utiles()
+        indice = {estado: i for i, estado in enumerate(self.estados)}
+        self.inicial = indice.get(afd.estado_inicial)
+        self.aceptacion = [1 if estado in afd.estados_aceptacion else 0 for estado in self.estados]
+
+        # matriz[i][j]: número de símbolos que llevan del estado i al estado j
+        self.matriz = [[0] * len(self.estados) for _ in self.estados]
+        tabla = afd.tabla_determinista()
+        for estado in self.estados:
+            for destino in tabla.get(estado, {}).values():
+                if destino in indice:
+                    self.matriz[indice[estado]][indice[destino]] += 1
+
+    def estados_utiles(self):
+        """
+        Estados alcanzables desde el inicial que además pueden llegar a aceptación
+        (los demás no aportan cadenas y solo agrandarían la matriz)
+        """
+        tabla = self.afd.tabla_determinista()
+        alcanzables = []
+        vistos = {self.afd.estado_inicial}
+        pila = [self.afd.estado_inicial]
+        while pila:
+            estado = pila.pop()
+            alcanzables.append(estado)
+            for destino in tabla.get(estado, {}).values():
+                if destino not in vistos:
+                    vistos.add(destino)
+                    pila.append(destino)
+
+        vivos = AnalizadorEstados(self.afd, tabla).estados_vivos()
+        return [estado for estado in alcanzables if estado in vivos]
+
+    def conteos_hasta(self, n, modo='exacto'):
+        """
+        Lista con el número de cadenas aceptadas de cada longitud 0..n
+        Itera v_{k+1} = M · v_k partiendo del vector de aceptación
+        modo 'exacto': enteros de precisión arbitraria
+        modo 'flotante': float (rápido, puede desbordar a inf)
+        modo 'log': log10 del conteo (-inf si es cero), sin desbordamiento
+        """
+        self.validar_modo(modo)
+        if self.inicial is None:
+            return [0 if modo != 'log' else -math.inf] * (n + 1)
+
+        if modo == 'log':
+            return self.conteos_log_hasta(n)
+
+        if np is not None:
+            tipo = object if modo == 'exacto' else float
+            matriz = np.array(self.matriz, dtype=tipo)
+            vector = np.array(self.aceptacion, dtype=tipo)
+            conteos = []
+            for _ in range(n + 1):
+                conteos.append(vector[self.inicial])
+                vector = matriz.dot(vector)
+            return [int(c) if modo == 'exacto' else float(c) for c in conteos]
+
+        vector = list(self.aceptacion)
+        conteos = []
+        for _ in range(n + 1):
+            conteos.append(vector[self.inicial])
+            vector = multiplicar_matriz_vector(self.matriz, vector)
+        return conteos if modo == 'exacto' else [float(c) for c in conteos]
+
+    def conteos_log_hasta(self, n):
+        """Iteración normalizada: el vector se reescala en cada paso y se acumula log10 de la escala"""
+        vector = [float(a) for a in self.aceptacion]
+        matriz = np.array(self.matriz, dtype=float) if np is not None else self.matriz
+        escala = 0.0
+        conteos = []
+        for _ in range(n + 1):
+            valor = vector[self.inicial]
+            conteos.append(math.log10(valor) + escala if valor > 0 else -math.inf)
+            if np is not None:
+                vector = matriz.dot(np.array(vector))
+            else:
+                vector = multiplicar_matriz_vector(matriz, vector)
+            maximo = max(vector) if len(vector) else 0
+            if maximo > 0:
+                vector = [v / maximo for v in vector]
+                escala += math.log10(maximo)
+        return conteos
+
+    def contar(self, n, modo='exacto'):
+        """
+        Número de cadenas aceptadas de longitud exactamente n, calculando
+        e_inicial · M^n · aceptación con exponenciación por cuadrados (O(q³ log n))
+        """
+        self.validar_modo(modo)
+        if self.inicial is None:
+            return 0 if modo != 'log' else -math.inf
+
+        if modo == 'exacto' or np is None:
+            fila = [0] * len(self.estados)
+            fila[self.inicial] = 1
+            potencia = self.matriz
+            while n:
+                if n & 1:
+                    fila = multiplicar_vector_matriz(fila, potencia)
+                n >>= 1
+                # El último cuadrado (el más costoso) no se necesita
+                if n:
+                    potencia = multiplicar_matrices(potencia, potencia)
+            total = sum(f * a for f, a in zip(fila, self.aceptacion))
+            if modo == 'exacto':
+                return total
+            if modo == 'flotante':
+                return float(total) if total < 2 ** 1023 else math.inf
+            return math.log10(total) if total > 0 else -math.inf
+
+        # Con NumPy en modo flotante/log: potencias reescaladas para no desbordar
+        fila = np.zeros(len(self.estados))
+        fila[self.inicial] = 1.0
+        potencia = np.array(self.matriz, dtype=float)
+        escala_fila = 0.0
+        escala_potencia = 0.0
+        while n:
+            if n & 1:
+                fila = fila.dot(potencia)
+                escala_fila += escala_potencia
+                maximo = fila.max()
+                if maximo > 0:
+                    fila /= maximo
+                    escala_fila += math.log10(maximo)
+            n >>= 1
+            if not n:
+                break
+            potencia = potencia.dot(potencia)
+            escala_potencia *= 2
+            maximo = potencia.max()
+            if maximo > 0:
+                potencia /= maximo
+                escala_potencia += math.log10(maximo)
+        total = float(fila.dot(np.array(self.aceptacion, dtype=float)))
+        if total <= 0:
+            return 0.0 if modo == 'flotante' else -math.inf
+        logaritmo = math.log10(total) + escala_fila
+        if modo == 'log':
+            return logaritmo
+        return 10 ** logaritmo if logaritmo < 308 else math.inf
+
+    def validar_modo(self, modo):
+        """Verifica que el modo de conteo sea válido"""
+        if modo not in MODOS:
+            raise ValueError(f"Modo de conteo desconocido: {modo} (use {', '.join(MODOS)})")
+
+
+def multiplicar_matriz_vector(matriz, vector):
+    """Producto M · v con listas de Python (exacto para enteros)"""
+    return [sum(m * v for m, v in zip(fila, vector) if m) for fila in matriz]
+
+
+def multiplicar_vector_matriz(vector, matriz):
+    """Producto v · M con listas de Python"""
+    resultado = [0] * len(matriz[0]) if matriz else []
+    for v, fila in zip(vector, matriz):
+        if v:
+            for j, m in enumerate(fila):
+                if m:
+                    resultado[j] += v * m
+    return resultado
+
+
+def multiplicar_matrices(a, b):
+    """Producto de matrices cuadradas con listas de Python"""
+    return [multiplicar_vector_matriz(fila, b) for fila in a]
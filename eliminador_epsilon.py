@@ -0,0 +1,133 @@
+"""
+Eliminación de transiciones épsilon: convierte un AFN de Thompson en un AFN sin ε
+equivalente, quitando además los estados inalcanzables y los inútiles
+"""
+from collections import deque
+from automata import Automata
+
+
+class EliminadorEpsilon:
+    def __init__(self):
+        self.estadisticas = {}
+
+    def eliminar_epsilon(self, afn):
+        """
+        Construye un AFN sin transiciones épsilon que acepta el mismo lenguaje
+        Cada estado alcanzable q recibe las transiciones con símbolo de toda su
+        ε-clausura, y es de aceptación si su clausura contiene un estado final
+        """
+        sucesores_epsilon, transiciones_simbolo = self.indexar_transiciones(afn)
+
+        # Paso 1: explorar desde el estado inicial siguiendo solo las nuevas transiciones
+        inicial = afn.estado_inicial
+        orden = [inicial]
+        visitados = {inicial}
+        salidas = {}
+        aceptacion = set()
+        cola = deque([inicial])
+
+        while cola:
+            estado = cola.popleft()
+            clausura = self.clausura(estado, sucesores_epsilon)
+            if not clausura.isdisjoint(afn.estados_aceptacion):
+                aceptacion.add(estado)
+
+            salida = {}
+            for estado_clausura in clausura:
+                for simbolo, destinos in transiciones_simbolo.get(estado_clausura, ()):
+                    salida.setdefault(simbolo, set()).update(destinos)
+            salidas[estado] = salida
+
+            for destinos in salida.values():
+                for destino in destinos:
+                    if destino not in visitados:
+                        visitados.add(destino)
+                        orden.append(destino)
+                        cola.append(destino)
+
+        # Paso 2: conservar solo los estados desde los que se puede llegar a aceptación
+        utiles = self.estados_utiles(salidas, aceptacion)
+
+        # Paso 3: construir el AFN renumerado en orden de descubrimiento
+        afn_sin_epsilon = Automata()
+        afn_sin_epsilon.simbolos = afn.simbolos.copy()
+        mapeo = {}
+        for estado in orden:
+            if estado in utiles or estado == inicial:
+                mapeo[estado] = len(mapeo)
+
+        afn_sin_epsilon.establecer_estado_inicial(mapeo[inicial])
+        afn_sin_epsilon.estados.update(mapeo.values())
+        for estado in aceptacion:
+            if estado in utiles:
+                afn_sin_epsilon.agregar_estado_aceptacion(mapeo[estado])
+
+        for estado, salida in salidas.items():
+            if estado not in utiles:
+                continue
+            for simbolo, destinos in salida.items():
+                for destino in destinos:
+                    if destino in utiles:
+                        afn_sin_epsilon.agregar_transicion(mapeo[estado], simbolo, mapeo[destino])
+
+        self.estadisticas = {
+            'estados': (len(afn.estados), len(afn_sin_epsilon.estados)),
+            'transiciones': (afn.numero_transiciones(), afn_sin_epsilon.numero_transiciones()),
+            'transiciones_epsilon': (sum(len(d) for d in sucesores_epsilon.values()), 0),
+        }
+        return afn_sin_epsilon
+
+    def indexar_transiciones(self, afn):
+        """
+        Separa las transiciones por estado origen: sucesores épsilon y
+        lista de (símbolo, destinos) para el resto
+        """
+        sucesores_epsilon = {}
+        transiciones_simbolo = {}
+        for (estado_origen, simbolo), estados_destino in afn.transiciones.items():
+            if simbolo == 'ε':
+                sucesores_epsilon.setdefault(estado_origen, set()).update(estados_destino)
+            else:
+                transiciones_simbolo.setdefault(estado_origen, []).append((simbolo, estados_destino))
+        return sucesores_epsilon, transiciones_simbolo
+
+    def clausura(self, estado, sucesores_epsilon):
+        """
+        Calcula la ε-clausura de un estado usando el índice de sucesores épsilon
+        """
+        clausura = {estado}
+        pila = [estado]
+        while pila:
+            actual = pila.pop()
+            for destino in sucesores_epsilon.get(actual, ()):
+                if destino not in clausura:
+                    clausura.add(destino)
+                    pila.append(destino)
+        return clausura
+
+    def estados_utiles(self, salidas, aceptacion):
+        """
+        Retorna los estados que pueden alcanzar un estado de aceptación
+        (búsqueda hacia atrás sobre las transiciones invertidas)
+        """
+        predecesores = {}
+        for estado, salida in salidas.items():
+            for destinos in salida.values():
+                for destino in destinos:
+                    predecesores.setdefault(destino, set()).add(estado)
+
+        utiles = set(aceptacion)
+        pila = list(aceptacion)
+        while pila:
+            estado = pila.pop()
+            for predecesor in predecesores.get(estado, ()):
+                if predecesor not in utiles:
+                    utiles.add(predecesor)
+                    pila.append(predecesor)
+        return utiles
+
+    def mostrar_estadisticas(self):
+        """Muestra el tamaño del AFN antes y después de eliminar épsilon"""
+        print(f"{'Medida':<24}{'Antes':>10}{'Después':>10}")
+        for medida, (antes, despues) in self.estadisticas.items():
+            print(f"{medida:<24}{antes:>10}{despues:>10}")
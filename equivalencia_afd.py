@@ -0,0 +1,99 @@
+"""
+Verificación de equivalencia de AFD con el algoritmo de Hopcroft-Karp (union-find)
+No requiere minimizar y acepta AFD parciales (una transición faltante va a un sumidero)
+"""
+from collections import deque
+
+
+class ComparadorAFD:
+    def __init__(self):
+        self.pares_explorados = 0
+
+    def son_equivalentes(self, afd1, afd2):
+        """
+        Recorre el producto de ambos AFD uniendo en un union-find los pares de
+        estados que se suponen equivalentes (casi lineal en el número de estados)
+        Retorna (True, None) si aceptan el mismo lenguaje, o (False, cadena) con
+        la cadena más corta que solo uno de los dos acepta
+        """
+        simbolos = sorted(afd1.simbolos | afd2.simbolos)
+        # El estado None representa el sumidero implícito de un AFD parcial
+        tabla1 = afd1.tabla_determinista()
+        tabla2 = afd2.tabla_determinista()
+
+        padre = {}
+        rango = {}
+
+        def encontrar(x):
+            raiz = padre.setdefault(x, x)
+            while raiz != padre[raiz]:
+                raiz = padre[raiz]
+            # Compresión de caminos
+            while x != raiz:
+                padre[x], x = raiz, padre[x]
+            return raiz
+
+        def unir(raiz1, raiz2):
+            if rango.get(raiz1, 0) < rango.get(raiz2, 0):
+                raiz1, raiz2 = raiz2, raiz1
+            padre[raiz2] = raiz1
+            if rango.get(raiz1, 0) == rango.get(raiz2, 0):
+                rango[raiz1] = rango.get(raiz1, 0) + 1
+
+        par_inicial = (afd1.estado_inicial, afd2.estado_inicial)
+        unir(encontrar((1, par_inicial[0])), encontrar((2, par_inicial[1])))
+        previo = {par_inicial: None}
+        cola = deque([par_inicial])
+        self.pares_explorados = 0
+
+        while cola:
+            par = cola.popleft()
+            self.pares_explorados += 1
+            estado1, estado2 = par
+
+            if (estado1 in afd1.estados_aceptacion) != (estado2 in afd2.estados_aceptacion):
+                testigo = self.reconstruir_cadena(previo, par)
+                return False, self.buscar_testigo_mas_corto(afd1, afd2, tabla1, tabla2,
+                                                            simbolos, len(testigo), testigo)
+
+            for simbolo in simbolos:
+                siguiente = (tabla1.get(estado1, {}).get(simbolo), tabla2.get(estado2, {}).get(simbolo))
+                raiz1 = encontrar((1, siguiente[0]))
+                raiz2 = encontrar((2, siguiente[1]))
+                if raiz1 != raiz2:
+                    unir(raiz1, raiz2)
+                    previo[siguiente] = (par, simbolo)
+                    cola.append(siguiente)
+
+        return True, None
+
+    def reconstruir_cadena(self, previo, par):
+        """Recupera la cadena que lleva del par inicial al par dado"""
+        simbolos = []
+        while previo[par] is not None:
+            par, simbolo = previo[par]
+            simbolos.append(simbolo)
+        return ''.join(reversed(simbolos))
+
+    def buscar_testigo_mas_corto(self, afd1, afd2, tabla1, tabla2, simbolos, limite, testigo):
+        """
+        El union-find puede omitir pares y encontrar un testigo no mínimo;
+        una búsqueda en anchura del producto limitada a longitud < limite
+        garantiza la cadena distinguible más corta
+        """
+        par_inicial = (afd1.estado_inicial, afd2.estado_inicial)
+        previo = {par_inicial: None}
+        nivel = [par_inicial]
+        for _ in range(limite):
+            siguiente_nivel = []
+            for par in nivel:
+                estado1, estado2 = par
+                if (estado1 in afd1.estados_aceptacion) != (estado2 in afd2.estados_aceptacion):
+                    return self.reconstruir_cadena(previo, par)
+                for simbolo in simbolos:
+                    siguiente = (tabla1.get(estado1, {}).get(simbolo), tabla2.get(estado2, {}).get(simbolo))
+                    if siguiente not in previo:
+                        previo[siguiente] = (par, simbolo)
+                        siguiente_nivel.append(siguiente)
+            nivel = siguiente_nivel
+        return testigo
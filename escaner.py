@@ -0,0 +1,189 @@
+"""
+Escáner estilo grep: busca una expresión regular en archivos y directorios
+Compila el AFD mínimo (el mismo que produce procesar_expresion_regular) a
+bytes UTF-8 y recorre cada archivo con mmap, sin decodificarlo
+Los archivos se reparten entre un pool de procesos
+Uso: python escaner.py [opciones] EXPRESION RUTA [RUTA ...]
+"""
+import argparse
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+from afd_bytes import AFDBytes
+from compilador import compilar_afd
+from shunting_yard import ErrorSintaxisRegex
+
+# AFD de cada proceso del pool (se compila una vez en inicializar_proceso)
+_escaner = None
+
+
+class EscanerArchivos:
+    def __init__(self, expresion, por_archivo=False, completa=False, invertir=False,
+                 solo_contar=False, solo_nombres=False):
+        """
+        por_archivo: la unidad es el archivo completo en lugar de cada línea
+        completa: la unidad entera debe ser aceptada (como grep -x); si no, basta una coincidencia
+        invertir: selecciona las unidades que no coinciden (grep -v)
+        solo_contar / solo_nombres: solo el número de unidades o el nombre del archivo (grep -c / -l)
+        """
+        self.afd = AFDBytes(compilar_afd(expresion))
+        self.por_archivo = por_archivo
+        self.completa = completa
+        self.invertir = invertir
+        self.solo_contar = solo_contar
+        self.solo_nombres = solo_nombres
+
+    def coincide(self, datos, inicio, fin):
+        """
+        Indica si la unidad datos[inicio:fin] es seleccionada
+        Sin -x basta saber si hay una coincidencia: una sola pasada que se detiene en la primera
+        """
+        if self.completa:
+            encontrada = self.afd.acepta(memoryview(datos)[inicio:fin])
+        else:
+            encontrada = self.afd.existe(datos, inicio, fin)
+        return encontrada != self.invertir
+
+    def escanear_archivo(self, ruta):
+        """
+        Retorna (ruta, coincidencias, lineas, bytes leídos, error)
+        coincidencias: número de unidades seleccionadas
+        lineas: [(número, contenido en bytes)] si se piden las líneas
+        """
+        try:
+            with open(ruta, 'rb') as archivo:
+                tamano = os.fstat(archivo.fileno()).st_size
+                if tamano == 0:
+                    return (ruta,) + self.escanear_datos(b'') + (0, None)
+                with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+                    return (ruta,) + self.escanear_datos(datos) + (tamano, None)
+        except (OSError, ValueError) as e:
+            return ruta, 0, [], 0, str(e)
+
+    def escanear_datos(self, datos):
+        """Retorna (coincidencias, líneas seleccionadas) de un bloque de datos"""
+        if self.por_archivo:
+            return (1 if self.coincide(datos, 0, len(datos)) else 0), []
+
+        guardar_lineas = not (self.solo_contar or self.solo_nombres)
+        coincidencias = 0
+        lineas = []
+        inicio = 0
+        numero = 0
+        while inicio < len(datos):
+            fin = datos.find(b'\n', inicio)
+            if fin == -1:
+                fin = len(datos)
+            numero += 1
+            if self.coincide(datos, inicio, fin):
+                coincidencias += 1
+                if guardar_lineas:
+                    lineas.append((numero, datos[inicio:fin]))
+                elif self.solo_nombres:
+                    break
+            inicio = fin + 1
+        return coincidencias, lineas
+
+
+def inicializar_proceso(argumentos):
+    """Compila el AFD una sola vez en cada proceso del pool"""
+    global _escaner
+    _escaner = EscanerArchivos(*argumentos)
+
+
+def escanear_en_proceso(ruta):
+    return _escaner.escanear_archivo(ruta)
+
+
+def recorrer_rutas(rutas):
+    """Genera los archivos de las rutas dadas; los directorios se recorren en orden"""
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            for carpeta, subcarpetas, archivos in os.walk(ruta):
+                subcarpetas.sort()
+                for nombre in sorted(archivos):
+                    yield os.path.join(carpeta, nombre)
+        else:
+            yield ruta
+
+
+def escanear(expresion, rutas, procesos=None, ordenado=True, **opciones):
+    """
+    Genera los resultados de escanear_archivo para cada archivo de las rutas
+    Con ordenado=False los resultados salen apenas terminan (no en orden de archivo)
+    procesos=0 escanea en el proceso actual
+    """
+    archivos = recorrer_rutas(rutas)
+    argumentos = (expresion, opciones.get('por_archivo', False), opciones.get('completa', False),
+                  opciones.get('invertir', False), opciones.get('solo_contar', False),
+                  opciones.get('solo_nombres', False))
+    if procesos == 0:
+        escaner = EscanerArchivos(*argumentos)
+        for ruta in archivos:
+            yield escaner.escanear_archivo(ruta)
+        return
+
+    with multiprocessing.Pool(procesos, initializer=inicializar_proceso, initargs=(argumentos,)) as pool:
+        mapear = pool.imap if ordenado else pool.imap_unordered
+        yield from mapear(escanear_en_proceso, archivos, chunksize=4)
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos; retorna el código de salida (0 si hubo coincidencias)"""
+    parser = argparse.ArgumentParser(description="Busca una expresión regular en archivos (estilo grep)")
+    parser.add_argument('expresion')
+    parser.add_argument('rutas', nargs='+', help="Archivos o directorios")
+    parser.add_argument('-c', '--contar', action='store_true', help="Solo el número de coincidencias por archivo")
+    parser.add_argument('-l', '--archivos', action='store_true', help="Solo los archivos con coincidencias")
+    parser.add_argument('-v', '--invertir', action='store_true', help="Selecciona lo que no coincide")
+    parser.add_argument('-x', '--completa', action='store_true', help="La línea (o archivo) completa debe ser aceptada")
+    parser.add_argument('--por-archivo', action='store_true', help="La unidad es el archivo completo")
+    parser.add_argument('-p', '--procesos', type=int, default=None, help="Procesos (0 = sin pool)")
+    parser.add_argument('--desordenado', action='store_true', help="Mostrar resultados apenas terminan")
+    argumentos = parser.parse_args(argv)
+
+    try:
+        compilar_afd(argumentos.expresion)
+    except ErrorSintaxisRegex as e:
+        print("Error de sintaxis en la expresión:", file=sys.stderr)
+        print(e.mostrar(), file=sys.stderr)
+        return 2
+
+    inicio = time.perf_counter()
+    total_archivos = total_bytes = total_coincidencias = 0
+    varios = len(argumentos.rutas) > 1 or any(os.path.isdir(ruta) for ruta in argumentos.rutas)
+    salida = sys.stdout
+    resultados = escanear(argumentos.expresion, argumentos.rutas, argumentos.procesos,
+                          not argumentos.desordenado, por_archivo=argumentos.por_archivo,
+                          completa=argumentos.completa, invertir=argumentos.invertir,
+                          solo_contar=argumentos.contar, solo_nombres=argumentos.archivos)
+    for ruta, coincidencias, lineas, leidos, error in resultados:
+        total_archivos += 1
+        total_bytes += leidos
+        total_coincidencias += coincidencias
+        if error is not None:
+            print(f"{ruta}: {error}", file=sys.stderr)
+        elif argumentos.archivos:
+            if coincidencias:
+                print(ruta, file=salida)
+        elif argumentos.contar:
+            print(f"{ruta}:{coincidencias}" if varios else coincidencias, file=salida)
+        elif argumentos.por_archivo:
+            if coincidencias:
+                print(ruta, file=salida)
+        else:
+            for numero, linea in lineas:
+                texto = linea.decode('utf-8', errors='replace')
+                print(f"{ruta}:{numero}:{texto}" if varios else f"{numero}:{texto}", file=salida)
+
+    transcurrido = time.perf_counter() - inicio
+    velocidad = total_bytes / transcurrido / 1e6 if transcurrido > 0 else 0.0
+    print(f"{total_archivos} archivos, {total_bytes} bytes, {total_coincidencias} coincidencias "
+          f"en {transcurrido:.3f} s ({velocidad:.2f} MB/s)", file=sys.stderr)
+    return 0 if total_coincidencias else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Estimación del costo de una expresión antes de compilarla
+Sobre el árbol de sintaxis: tamaño del AFN de Thompson, posiciones de Glushkov
+y formas que hacen explotar la construcción de subconjuntos, como (a|b)*a(a|b)(a|b)...
+donde el AFD debe recordar los últimos k símbolos (2^k estados)
+Una determinización parcial con presupuesto confirma o descarta la explosión
+y el reporte indica qué motor conviene (AFD, AFD perezoso o AFN bit-paralelo)
+"""
+import time
+from arbol_regex import (NodoSimbolo, NodoClase, NodoEpsilon, NodoConcatenacion, NodoUnion,
+                         NodoEstrella, NodoPositiva, NodoUnario)
+from automata_compacto import AFNCompacto
+from motor_glushkov import contar_posiciones, LIMITE_POSICIONES
+
+MOTORES = ('afd', 'afd_perezoso', 'glushkov')
+# Estados del AFD que la determinización de muestra construye como máximo
+PRESUPUESTO_ESTADOS = 2000
+# Con un exponente de explosión mayor ni siquiera se intenta la muestra completa
+EXPONENTE_PELIGROSO = 16
+
+
+class EstimadorCosto:
+    def __init__(self, arbol, presupuesto=PRESUPUESTO_ESTADOS):
+        """arbol: árbol de sintaxis de la expresión (optimizado o no)"""
+        self.arbol = arbol
+        self.presupuesto = presupuesto
+
+    def tamano_thompson(self, nodo):
+        """(estados, transiciones) aproximados del AFN de Thompson del nodo"""
+        if isinstance(nodo, NodoSimbolo):
+            return 2, 1
+        if isinstance(nodo, NodoClase):
+            return 2, len(nodo.simbolos)
+        if isinstance(nodo, NodoEpsilon):
+            return 2, 1
+        if isinstance(nodo, (NodoConcatenacion, NodoUnion)):
+            estados = transiciones = 0
+            for hijo in nodo.hijos:
+                estados_hijo, transiciones_hijo = self.tamano_thompson(hijo)
+                estados += estados_hijo
+                transiciones += transiciones_hijo
+            if isinstance(nodo, NodoConcatenacion):
+                return estados, transiciones + len(nodo.hijos) - 1
+            return estados + 2, transiciones + 2 * len(nodo.hijos)
+        if isinstance(nodo, NodoUnario):
+            estados, transiciones = self.tamano_thompson(nodo.hijo)
+            return estados + 2, transiciones + (4 if isinstance(nodo, NodoEstrella) else 3)
+        return 1, 0
+
+    def simbolos(self, nodo):
+        """Símbolos que aparecen en el nodo"""
+        if isinstance(nodo, NodoSimbolo):
+            return {nodo.simbolo}
+        if isinstance(nodo, NodoClase):
+            return set(nodo.simbolos)
+        if isinstance(nodo, (NodoConcatenacion, NodoUnion)):
+            return set().union(*(self.simbolos(hijo) for hijo in nodo.hijos))
+        if isinstance(nodo, NodoUnario):
+            return self.simbolos(nodo.hijo)
+        return set()
+
+    def simbolos_de_posicion(self, nodo):
+        """Si el nodo lee exactamente un símbolo (símbolo, clase o unión de ellos), sus símbolos; si no, None"""
+        if isinstance(nodo, NodoSimbolo):
+            return {nodo.simbolo}
+        if isinstance(nodo, NodoClase):
+            return set(nodo.simbolos)
+        if isinstance(nodo, NodoUnion):
+            resultado = set()
+            for hijo in nodo.hijos:
+                simbolos = self.simbolos_de_posicion(hijo)
+                if simbolos is None:
+                    return None
+                resultado |= simbolos
+            return resultado
+        return None
+
+    def formas_explosivas(self, nodo=None, encontradas=None):
+        """
+        Busca en cada concatenación una repetición X* (o X+) seguida de posiciones
+        fijas que leen símbolos de X: después de la primera, cada posición que
+        admite dos o más de esos símbolos duplica los estados del AFD
+        Retorna [(exponente, expresión)] de mayor a menor exponente
+        """
+        raiz = nodo is None
+        if raiz:
+            nodo = self.arbol
+            encontradas = []
+        if isinstance(nodo, NodoConcatenacion):
+            hijos = nodo.hijos
+            for i, hijo in enumerate(hijos):
+                if not isinstance(hijo, (NodoEstrella, NodoPositiva)):
+                    continue
+                repetidos = self.simbolos(hijo.hijo)
+                exponente = 0
+                fin = i + 1
+                while fin < len(hijos):
+                    simbolos = self.simbolos_de_posicion(hijos[fin])
+                    if simbolos is None or not simbolos & repetidos:
+                        break
+                    if fin > i + 1 and len(simbolos & repetidos) >= 2:
+                        exponente += 1
+                    fin += 1
+                if exponente:
+                    # La primera posición de la cola marca desde dónde se cuenta
+                    fragmento = NodoConcatenacion(hijos[i:fin]).a_expresion()
+                    encontradas.append((exponente + 1, fragmento))
+        for hijo in getattr(nodo, 'hijos', ()):
+            self.formas_explosivas(hijo, encontradas)
+        if isinstance(nodo, NodoUnario):
+            self.formas_explosivas(nodo.hijo, encontradas)
+        if raiz:
+            encontradas.sort(key=lambda forma: -forma[0])
+        return encontradas
+
+    def determinizar_muestra(self, afn):
+        """
+        Construcción de subconjuntos sobre el AFN que se detiene al superar el presupuesto
+        Retorna (estados construidos, si se agotó el presupuesto)
+        """
+        compacto = AFNCompacto.desde_automata(afn)
+        inicial = frozenset(compacto.clausura({compacto.inicial}))
+        vistos = {inicial}
+        pendientes = [inicial]
+        while pendientes:
+            conjunto = pendientes.pop()
+            for estados in compacto.movimientos(conjunto).values():
+                destino = frozenset(compacto.clausura(estados))
+                if destino not in vistos:
+                    if len(vistos) >= self.presupuesto:
+                        return len(vistos), True
+                    vistos.add(destino)
+                    pendientes.append(destino)
+        return len(vistos), False
+
+    def estimar(self, afn=None):
+        """
+        Reporte de costo; si se da el AFN de Thompson de la expresión se hace
+        además la determinización de muestra (si no hay una forma muy explosiva)
+        """
+        estados_afn, transiciones_afn = self.tamano_thompson(self.arbol)
+        posiciones = contar_posiciones(self.arbol)
+        formas = self.formas_explosivas()
+        exponente = formas[0][0] if formas else 0
+        reporte = {
+            'estados_afn': estados_afn,
+            'transiciones_afn': transiciones_afn,
+            'posiciones': posiciones,
+            'formas_explosivas': formas,
+            'exponente_explosion': exponente,
+            # Cada estado del AFD es un conjunto de posiciones (más el inicial)
+            'cota_estados_afd': 2 ** posiciones + 1,
+            # Estimación por la forma más explosiva (None si no hay ninguna)
+            'estimacion_estados_afd': 2 ** exponente if exponente else None,
+            'estados_afd_muestra': None,
+            'presupuesto_agotado': None,
+            'segundos_muestra': None,
+        }
+        if afn is not None:
+            if exponente > EXPONENTE_PELIGROSO:
+                reporte['presupuesto_agotado'] = True
+            else:
+                inicio = time.perf_counter()
+                construidos, agotado = self.determinizar_muestra(afn)
+                reporte['segundos_muestra'] = time.perf_counter() - inicio
+                reporte['estados_afd_muestra'] = construidos
+                reporte['presupuesto_agotado'] = agotado
+        reporte['motor'] = self.elegir_motor(reporte)
+        return reporte
+
+    def elegir_motor(self, reporte):
+        """
+        'afd' si el AFD entra en el presupuesto (o, sin muestra, si no hay formas
+        explosivas); si no, 'glushkov' con pocas posiciones y 'afd_perezoso' con muchas
+        """
+        if reporte['presupuesto_agotado'] is None:
+            cabe = 2 ** reporte['exponente_explosion'] <= self.presupuesto
+        else:
+            cabe = not reporte['presupuesto_agotado']
+        if cabe:
+            return 'afd'
+        if reporte['posiciones'] <= LIMITE_POSICIONES:
+            return 'glushkov'
+        return 'afd_perezoso'
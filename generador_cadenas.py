@@ -0,0 +1,234 @@
+"""
+Generación de cadenas a partir de un AFD (idealmente el AFD mínimo)
+Enumeración en orden por longitud y lexicográfico, cadenas más cortas y
+muestreo uniforme. Todo se produce de forma perezosa con generadores
+"""
+import random
+from collections import deque
+
+
+class GeneradorCadenas:
+    def __init__(self, afd):
+        self.afd = afd
+        self.simbolos = sorted(afd.simbolos)
+        self.tabla = afd.tabla_determinista()
+        self.vivos = self.calcular_estados_vivos()
+        self.adyacencia = {}
+        # aceptan_en[k]: estados que aceptan alguna cadena de longitud exactamente k
+        self.aceptan_en = [frozenset(afd.estados_aceptacion)]
+        # conteos[k]: {estado: número de cadenas aceptadas de longitud k desde el estado}
+        self.conteos = [{estado: 1 for estado in afd.estados_aceptacion}]
+
+    def calcular_estados_vivos(self):
+        """
+        Estados desde los que se puede llegar a aceptación; las ramas que salen
+        de ellos hacia estados muertos nunca se exploran
+        """
+        predecesores = {}
+        for estado_origen, transiciones in self.tabla.items():
+            for estado_destino in transiciones.values():
+                predecesores.setdefault(estado_destino, set()).add(estado_origen)
+
+        vivos = set(self.afd.estados_aceptacion)
+        pila = list(vivos)
+        while pila:
+            estado = pila.pop()
+            for predecesor in predecesores.get(estado, ()):
+                if predecesor not in vivos:
+                    vivos.add(predecesor)
+                    pila.append(predecesor)
+        return vivos
+
+    def sucesores(self, estado):
+        """Pares (símbolo, destino) en orden lexicográfico hacia estados vivos"""
+        if estado not in self.adyacencia:
+            transiciones = self.tabla.get(estado, {})
+            self.adyacencia[estado] = [(simbolo, transiciones[simbolo]) for simbolo in self.simbolos
+                                       if transiciones.get(simbolo) in self.vivos]
+        return self.adyacencia[estado]
+
+    def estados_que_aceptan_en(self, longitud):
+        """Calcula (y recuerda) los estados que aceptan con exactamente 'longitud' símbolos"""
+        while len(self.aceptan_en) <= longitud:
+            anteriores = self.aceptan_en[-1]
+            actuales = frozenset(estado for estado in self.vivos
+                                 if any(destino in anteriores for _, destino in self.sucesores(estado)))
+            self.aceptan_en.append(actuales)
+        return self.aceptan_en[longitud]
+
+    def longitud_maxima_aceptada(self):
+        """
+        Longitud de la cadena aceptada más larga, None si el lenguaje es infinito
+        (hay un ciclo entre estados vivos alcanzables) o -1 si el lenguaje es vacío
+        (así enumerar no recorre ninguna longitud)
+        """
+        if self.afd.estado_inicial not in self.vivos:
+            return -1
+        # Orden topológico del subgrafo vivo alcanzable (Kahn)
+        alcanzables = set()
+        pila = [self.afd.estado_inicial]
+        while pila:
+            estado = pila.pop()
+            if estado in alcanzables:
+                continue
+            alcanzables.add(estado)
+            pila.extend(destino for _, destino in self.sucesores(estado))
+
+        grado_entrada = {estado: 0 for estado in alcanzables}
+        for estado in alcanzables:
+            for _, destino in self.sucesores(estado):
+                grado_entrada[destino] += 1
+        cola = deque(estado for estado, grado in grado_entrada.items() if grado == 0)
+        orden = []
+        while cola:
+            estado = cola.popleft()
+            orden.append(estado)
+            for _, destino in self.sucesores(estado):
+                grado_entrada[destino] -= 1
+                if grado_entrada[destino] == 0:
+                    cola.append(destino)
+        if len(orden) < len(alcanzables):
+            return None
+
+        # Camino más largo hasta un estado de aceptación, en orden topológico inverso
+        mas_larga = {}
+        for estado in reversed(orden):
+            candidatos = [mas_larga[destino] + 1 for _, destino in self.sucesores(estado)]
+            if estado in self.afd.estados_aceptacion:
+                candidatos.append(0)
+            mas_larga[estado] = max(candidatos)
+        return mas_larga[self.afd.estado_inicial]
+
+    def enumerar(self, longitud_maxima=None, cantidad_maxima=None):
+        """
+        Genera las cadenas aceptadas en orden por longitud y luego lexicográfico
+        Para cada longitud n se hace un recorrido en profundidad que solo sigue
+        estados capaces de aceptar en exactamente los símbolos restantes, así la
+        memoria es O(n) y no se explora ninguna rama sin salida
+        Sin límites y con lenguaje infinito el generador no termina
+        """
+        limite = self.longitud_maxima_aceptada()
+        if limite is None or (longitud_maxima is not None and longitud_maxima < limite):
+            limite = longitud_maxima
+
+        producidas = 0
+        longitud = 0
+        while limite is None or longitud <= limite:
+            for cadena in self.enumerar_longitud(longitud):
+                if cantidad_maxima is not None and producidas >= cantidad_maxima:
+                    return
+                producidas += 1
+                yield cadena
+            longitud += 1
+
+    def enumerar_longitud(self, longitud):
+        """Genera en orden lexicográfico las cadenas aceptadas de la longitud dada"""
+        for k in range(longitud + 1):
+            self.estados_que_aceptan_en(k)
+        inicial = self.afd.estado_inicial
+        if inicial not in self.aceptan_en[longitud]:
+            return
+        if longitud == 0:
+            yield ''
+            return
+
+        camino = []
+        # Pila de iteradores de sucesores válidos por nivel
+        pila = [iter(self.sucesores_hacia(inicial, longitud))]
+        while pila:
+            siguiente = next(pila[-1], None)
+            if siguiente is None:
+                pila.pop()
+                if camino:
+                    camino.pop()
+                continue
+            simbolo, destino = siguiente
+            camino.append(simbolo)
+            restantes = longitud - len(camino)
+            if restantes == 0:
+                yield ''.join(camino)
+                camino.pop()
+            else:
+                pila.append(iter(self.sucesores_hacia(destino, restantes)))
+
+    def sucesores_hacia(self, estado, restantes):
+        """Sucesores que todavía pueden aceptar con restantes - 1 símbolos más"""
+        objetivo = self.aceptan_en[restantes - 1]
+        return [(simbolo, destino) for simbolo, destino in self.sucesores(estado) if destino in objetivo]
+
+    def cadena_mas_corta_aceptada(self):
+        """Cadena aceptada más corta (la primera en orden lexicográfico), o None"""
+        return self.buscar_cadena_mas_corta(lambda estado: estado in self.afd.estados_aceptacion)
+
+    def cadena_mas_corta_rechazada(self):
+        """
+        Cadena rechazada más corta sobre el alfabeto del AFD, o None si acepta todo
+        Una transición faltante lleva al sumidero (None), que rechaza
+        """
+        return self.buscar_cadena_mas_corta(lambda estado: estado not in self.afd.estados_aceptacion)
+
+    def buscar_cadena_mas_corta(self, es_objetivo):
+        """Búsqueda en anchura en orden lexicográfico hasta un estado objetivo"""
+        inicial = self.afd.estado_inicial
+        previo = {inicial: None}
+        cola = deque([inicial])
+        while cola:
+            estado = cola.popleft()
+            if es_objetivo(estado):
+                simbolos = []
+                while previo[estado] is not None:
+                    estado, simbolo = previo[estado]
+                    simbolos.append(simbolo)
+                return ''.join(reversed(simbolos))
+            if estado is None:
+                continue
+            transiciones = self.tabla.get(estado, {})
+            for simbolo in self.simbolos:
+                destino = transiciones.get(simbolo)
+                if destino not in previo:
+                    previo[destino] = (estado, simbolo)
+                    cola.append(destino)
+        return None
+
+    def contar_cadenas(self, longitud):
+        """
+        Número exacto de cadenas aceptadas de la longitud dada, usando los
+        conteos de caminos por estado (se calculan una vez y se reutilizan)
+        """
+        while len(self.conteos) <= longitud:
+            anteriores = self.conteos[-1]
+            actuales = {}
+            for estado in self.vivos:
+                total = sum(anteriores.get(destino, 0) for _, destino in self.sucesores(estado))
+                if total:
+                    actuales[estado] = total
+            self.conteos.append(actuales)
+        return self.conteos[longitud].get(self.afd.estado_inicial, 0)
+
+    def muestras_uniformes(self, longitud, cantidad=None, semilla=None):
+        """
+        Genera cadenas aceptadas de la longitud dada con distribución uniforme
+        En cada paso se elige el símbolo con probabilidad proporcional al número
+        de cadenas aceptadas que continúan por él. Sin cantidad, no termina
+        """
+        if self.contar_cadenas(longitud) == 0:
+            raise ValueError(f"El autómata no acepta cadenas de longitud {longitud}")
+        return self.generar_muestras(longitud, cantidad, random.Random(semilla))
+
+    def generar_muestras(self, longitud, cantidad, aleatorio):
+        """Generador de muestras_uniformes (los conteos ya están calculados)"""
+        generadas = 0
+        while cantidad is None or generadas < cantidad:
+            estado = self.afd.estado_inicial
+            simbolos = []
+            for restantes in range(longitud, 0, -1):
+                conteos = self.conteos[restantes - 1]
+                eleccion = aleatorio.randrange(self.conteos[restantes][estado])
+                for simbolo, destino in self.sucesores(estado):
+                    eleccion -= conteos.get(destino, 0)
+                    if eleccion < 0:
+                        simbolos.append(simbolo)
+                        estado = destino
+                        break
+            generadas += 1
+            yield ''.join(simbolos)
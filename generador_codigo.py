@@ -0,0 +1,211 @@
+"""
+Generación de código: convierte un AFD mínimo en un módulo de Python con una
+función acepta(cadena) especializada, la compila con compile() y la guarda en
+disco para que las siguientes cargas no tengan que generarla de nuevo
+"""
+import hashlib
+import importlib.util
+import os
+import tempfile
+import time
+import types
+from afd_compilado import AFDCompilado
+
+ESTRATEGIAS = ('saltos', 'tabla', 'traducir')
+# Junto a los módulos del proyecto, no en el directorio de trabajo de quien compila
+CARPETA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'matchers_generados')
+# Cambiar si cambia el código generado, así no se reutilizan módulos viejos
+VERSION_GENERADOR = 1
+
+
+class GeneradorCodigo:
+    def __init__(self, afd):
+        self.compilado = AFDCompilado(afd)
+
+    def generar_fuente(self, estrategia):
+        """Código fuente del módulo para la estrategia dada"""
+        if estrategia == 'saltos':
+            cuerpo = self.fuente_saltos()
+        elif estrategia == 'tabla':
+            cuerpo = self.fuente_tabla()
+        elif estrategia == 'traducir':
+            cuerpo = self.fuente_traducir()
+        else:
+            raise ValueError(f"Estrategia desconocida: {estrategia} (use {', '.join(ESTRATEGIAS)})")
+        encabezado = f'"""Generado por generador_codigo (estrategia {estrategia}); no editar"""\n'
+        return encabezado + cuerpo
+
+    def fuente_saltos(self):
+        """
+        Una cadena de if por estado dentro del ciclo: el estado es una constante
+        en cada rama y los símbolos con el mismo destino se prueban juntos
+        """
+        lineas = ['def acepta(cadena):', '    estado = 0', '    for c in cadena:']
+        for estado, transiciones in enumerate(self.compilado.transiciones):
+            lineas.append(f"        {'if' if estado == 0 else 'elif'} estado == {estado}:")
+            if not transiciones:
+                lineas.append('            return False')
+                continue
+            for i, (destino, simbolos) in enumerate(sorted(self.agrupar_por_destino(transiciones).items())):
+                condicion = f"c == {simbolos[0]!r}" if len(simbolos) == 1 else f"c in {''.join(simbolos)!r}"
+                lineas.append(f"            {'if' if i == 0 else 'elif'} {condicion}:")
+                lineas.append(f"                estado = {destino}")
+            lineas.append('            else:')
+            lineas.append('                return False')
+        aceptacion = [estado for estado, acepta in enumerate(self.compilado.aceptacion) if acepta]
+        lineas.append(f"    return estado in {set(aceptacion) or 'set()'!s}")
+        return '\n'.join(lineas) + '\n'
+
+    def fuente_tabla(self):
+        """
+        Tabla plana en una tupla: el símbolo se convierte en clase con un diccionario
+        y el estado 0 es el sumidero (los estados van multiplicados por el número de clases)
+        """
+        clases, tabla, inicial, aceptacion = self.tabla_plana()
+        return '\n'.join([
+            f"CLASES = {clases!r}",
+            f"TABLA = {tabla!r}",
+            f"ACEPTACION = frozenset({sorted(aceptacion)!r})",
+            '',
+            'def acepta(cadena):',
+            '    tabla = TABLA',
+            '    clase = CLASES.get',
+            f"    estado = {inicial}",
+            '    for c in cadena:',
+            '        estado = tabla[estado + clase(c, 0)]',
+            '        if not estado:',
+            '            return False',
+            '    return estado in ACEPTACION',
+        ]) + '\n'
+
+    def fuente_traducir(self):
+        """
+        Como 'tabla', pero las clases se obtienen para toda la cadena con str.translate
+        y encode('latin-1'): el ciclo recorre bytes (enteros) sin buscar en diccionarios
+        """
+        clases, tabla, inicial, aceptacion = self.tabla_plana()
+        mapa = {ord(simbolo): clase for simbolo, clase in clases.items()}
+        return '\n'.join([
+            'class Clases(dict):',
+            '    def __missing__(self, codigo):',
+            '        return 0',
+            '',
+            f"MAPA = Clases({mapa!r})",
+            f"TABLA = {tabla!r}",
+            f"ACEPTACION = frozenset({sorted(aceptacion)!r})",
+            '',
+            'def acepta(cadena):',
+            '    tabla = TABLA',
+            f"    estado = {inicial}",
+            "    for clase in cadena.translate(MAPA).encode('latin-1'):",
+            '        estado = tabla[estado + clase]',
+            '        if not estado:',
+            '            return False',
+            '    return estado in ACEPTACION',
+        ]) + '\n'
+
+    def agrupar_por_destino(self, transiciones):
+        """{destino: símbolos ordenados que llevan a él}"""
+        grupos = {}
+        for simbolo, destino in sorted(transiciones.items()):
+            grupos.setdefault(destino, []).append(simbolo)
+        return grupos
+
+    def tabla_plana(self):
+        """
+        Clases de símbolos (0 = fuera del alfabeto), tabla plana con el sumidero
+        en 0, estado inicial y estados de aceptación, ya multiplicados por el número de clases
+        """
+        compilado = self.compilado
+        # Símbolos con las mismas transiciones desde todos los estados comparten clase
+        firmas = {}
+        clases = {}
+        for simbolo in compilado.simbolos:
+            firma = tuple(transiciones.get(simbolo) for transiciones in compilado.transiciones)
+            clases[simbolo] = firmas.setdefault(firma, len(firmas) + 1)
+        ancho = len(firmas) + 1
+        if ancho > 256:
+            raise ValueError("Demasiadas clases de símbolos para la estrategia con tabla")
+
+        tabla = [0] * (ancho * (len(compilado.transiciones) + 1))
+        for estado, transiciones in enumerate(compilado.transiciones):
+            for simbolo, destino in transiciones.items():
+                tabla[(estado + 1) * ancho + clases[simbolo]] = (destino + 1) * ancho
+        aceptacion = [(estado + 1) * ancho for estado, acepta in enumerate(compilado.aceptacion) if acepta]
+        return clases, tuple(tabla), ancho, aceptacion
+
+    def clave(self, estrategia):
+        """Huella del AFD (numeración canónica) y de la estrategia para el nombre del archivo"""
+        compilado = self.compilado
+        descripcion = repr((VERSION_GENERADOR, estrategia, compilado.simbolos,
+                            [sorted(t.items()) for t in compilado.transiciones], compilado.aceptacion))
+        return hashlib.sha256(descripcion.encode('utf-8')).hexdigest()[:16]
+
+    def compilar(self, estrategia='traducir', carpeta=CARPETA_CACHE):
+        """
+        Retorna la función acepta generada
+        Si el módulo ya está en 'carpeta' se importa (Python reutiliza su bytecode
+        de __pycache__); si no, se genera, se compila con compile() y se guarda
+        Con carpeta=None no se usa el disco
+        """
+        if carpeta is None:
+            return self.ejecutar(self.generar_fuente(estrategia), f'<afd {estrategia}>').acepta
+
+        ruta = os.path.join(carpeta, f"afd_{estrategia}_{self.clave(estrategia)}.py")
+        if os.path.exists(ruta):
+            especificacion = importlib.util.spec_from_file_location(f"afd_{self.clave(estrategia)}", ruta)
+            modulo = importlib.util.module_from_spec(especificacion)
+            especificacion.loader.exec_module(modulo)
+            return modulo.acepta
+
+        fuente = self.generar_fuente(estrategia)
+        modulo = self.ejecutar(fuente, ruta)
+        os.makedirs(carpeta, exist_ok=True)
+        # Se escribe en un temporal de la misma carpeta y se reemplaza de una vez:
+        # otro proceso nunca importa un archivo a medio escribir
+        descriptor, temporal = tempfile.mkstemp(dir=carpeta, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as archivo:
+                archivo.write(fuente)
+            os.replace(temporal, ruta)
+        except BaseException:
+            os.unlink(temporal)
+            raise
+        return modulo.acepta
+
+    def ejecutar(self, fuente, nombre_archivo):
+        """Compila el código fuente y lo ejecuta en un módulo nuevo"""
+        modulo = types.ModuleType('afd_generado')
+        exec(compile(fuente, nombre_archivo, 'exec'), modulo.__dict__)
+        return modulo
+
+    def medir(self, cadenas, repeticiones=3):
+        """
+        Tiempo (el mejor de varias repeticiones) de aceptar todas las cadenas con
+        cada estrategia generada y con el simulador por tablas (AFDCompilado)
+        Retorna {nombre: segundos}
+        """
+        funciones = {'interpretado': self.compilado.acepta}
+        for estrategia in ESTRATEGIAS:
+            try:
+                funciones[estrategia] = self.compilar(estrategia, carpeta=None)
+            except ValueError:
+                continue
+
+        tiempos = {}
+        for nombre, funcion in funciones.items():
+            mejor = None
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                for cadena in cadenas:
+                    funcion(cadena)
+                transcurrido = time.perf_counter() - inicio
+                mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+            tiempos[nombre] = mejor
+        return tiempos
+
+    def elegir_estrategia(self, cadenas, repeticiones=3):
+        """Estrategia generada más rápida para cadenas como las dadas"""
+        tiempos = self.medir(cadenas, repeticiones)
+        tiempos.pop('interpretado')
+        return min(tiempos, key=tiempos.get)
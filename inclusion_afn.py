@@ -0,0 +1,149 @@
+"""
+Inclusión, universalidad y vacuidad de intersección sobre AFN usando antichains
+No se construye el autómata de subconjuntos completo: cada macroestado se
+descarta si otro ya visitado lo subsume
+"""
+from collections import deque
+from eliminador_epsilon import EliminadorEpsilon
+
+
+class VerificadorInclusion:
+    def __init__(self):
+        self.macroestados_explorados = 0
+
+    def preparar(self, afn):
+        """
+        Elimina las transiciones épsilon (si las hay) e indexa el AFN
+        como {estado: {simbolo: frozenset(destinos)}}
+        """
+        if any(simbolo == 'ε' for (_, simbolo) in afn.transiciones):
+            afn = EliminadorEpsilon().eliminar_epsilon(afn)
+        indice = {}
+        for (estado_origen, simbolo), estados_destino in afn.transiciones.items():
+            indice.setdefault(estado_origen, {})[simbolo] = frozenset(estados_destino)
+        return afn, indice
+
+    def incluido(self, afn_a, afn_b):
+        """
+        Verifica si L(afn_a) ⊆ L(afn_b)
+        Explora pares (p, S): p estado de A, S macroestado de B tras la misma cadena.
+        (p, S) es contraejemplo si p acepta y S no; se poda si ya se visitó
+        (p, S') con S' ⊆ S, porque todo lo que S' rechaza también lo rechaza S
+        La búsqueda es en anchura, así el contraejemplo es el más corto
+        Retorna (True, None) o (False, cadena aceptada por A y rechazada por B)
+        """
+        afn_a, indice_a = self.preparar(afn_a)
+        afn_b, indice_b = self.preparar(afn_b)
+
+        inicial = (afn_a.estado_inicial, frozenset([afn_b.estado_inicial]))
+        antichain = {}
+        self.agregar_a_antichain(antichain, *inicial)
+        previo = {inicial: None}
+        cola = deque([inicial])
+        self.macroestados_explorados = 0
+
+        while cola:
+            par = cola.popleft()
+            self.macroestados_explorados += 1
+            estado, macroestado = par
+            if estado in afn_a.estados_aceptacion and macroestado.isdisjoint(afn_b.estados_aceptacion):
+                return False, self.reconstruir_cadena(previo, par)
+
+            for simbolo, destinos_a in indice_a.get(estado, {}).items():
+                siguiente_macro = self.mover(indice_b, macroestado, simbolo)
+                for destino in destinos_a:
+                    if self.subsumido(antichain, destino, siguiente_macro):
+                        continue
+                    self.agregar_a_antichain(antichain, destino, siguiente_macro)
+                    siguiente = (destino, siguiente_macro)
+                    previo[siguiente] = (par, simbolo)
+                    cola.append(siguiente)
+
+        return True, None
+
+    def universal(self, afn, alfabeto=None):
+        """
+        Verifica si el AFN acepta todas las cadenas sobre el alfabeto
+        (por defecto el del AFN). Retorna (True, None) o (False, cadena rechazada)
+        """
+        afn, indice = self.preparar(afn)
+        simbolos = sorted(set(alfabeto) if alfabeto is not None else afn.simbolos)
+
+        inicial = frozenset([afn.estado_inicial])
+        antichain = {}
+        self.agregar_a_antichain(antichain, None, inicial)
+        previo = {inicial: None}
+        cola = deque([inicial])
+        self.macroestados_explorados = 0
+
+        while cola:
+            macroestado = cola.popleft()
+            self.macroestados_explorados += 1
+            if macroestado.isdisjoint(afn.estados_aceptacion):
+                return False, self.reconstruir_cadena(previo, macroestado)
+
+            for simbolo in simbolos:
+                siguiente = self.mover(indice, macroestado, simbolo)
+                if self.subsumido(antichain, None, siguiente):
+                    continue
+                self.agregar_a_antichain(antichain, None, siguiente)
+                previo[siguiente] = (macroestado, simbolo)
+                cola.append(siguiente)
+
+        return True, None
+
+    def interseccion_vacia(self, afn1, afn2):
+        """
+        Verifica si L(afn1) ∩ L(afn2) = ∅ recorriendo el producto de ambos AFN
+        (pares de estados individuales, sin determinizar)
+        Retorna (True, None) o (False, cadena aceptada por ambos)
+        """
+        afn1, indice1 = self.preparar(afn1)
+        afn2, indice2 = self.preparar(afn2)
+
+        inicial = (afn1.estado_inicial, afn2.estado_inicial)
+        previo = {inicial: None}
+        cola = deque([inicial])
+        self.macroestados_explorados = 0
+
+        while cola:
+            par = cola.popleft()
+            self.macroestados_explorados += 1
+            estado1, estado2 = par
+            if estado1 in afn1.estados_aceptacion and estado2 in afn2.estados_aceptacion:
+                return False, self.reconstruir_cadena(previo, par)
+
+            transiciones2 = indice2.get(estado2, {})
+            for simbolo, destinos1 in indice1.get(estado1, {}).items():
+                for destino1 in destinos1:
+                    for destino2 in transiciones2.get(simbolo, ()):
+                        siguiente = (destino1, destino2)
+                        if siguiente not in previo:
+                            previo[siguiente] = (par, simbolo)
+                            cola.append(siguiente)
+
+        return True, None
+
+    def mover(self, indice, macroestado, simbolo):
+        """Conjunto de estados alcanzables desde el macroestado con el símbolo"""
+        destinos = set()
+        for estado in macroestado:
+            destinos.update(indice.get(estado, {}).get(simbolo, ()))
+        return frozenset(destinos)
+
+    def subsumido(self, antichain, estado, macroestado):
+        """Indica si ya se visitó (estado, S') con S' ⊆ macroestado"""
+        return any(minimo <= macroestado for minimo in antichain.get(estado, ()))
+
+    def agregar_a_antichain(self, antichain, estado, macroestado):
+        """Agrega el macroestado quitando los que lo contienen (ya no son minimales)"""
+        minimos = antichain.get(estado, [])
+        antichain[estado] = [m for m in minimos if not macroestado <= m] + [macroestado]
+
+    def reconstruir_cadena(self, previo, nodo):
+        """Recupera la cadena que lleva del nodo inicial al nodo dado"""
+        simbolos = []
+        while previo[nodo] is not None:
+            nodo, simbolo = previo[nodo]
+            simbolos.append(simbolo)
+        return ''.join(reversed(simbolos))
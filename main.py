@@ -5,7 +5,9 @@ Convierte expresiones regulares a autómatas y los minimiza
 Proyecto 1 de Logica Computacional 
 """
 
-from shunting_yard import convertir_a_postfix, mostrar_conversion
+import sys
+from shunting_yard import convertir_a_postfix, mostrar_conversion, analizar_expresion, ErrorSintaxisRegex
+from optimizador_regex import OptimizadorRegex
 from constructor_afn import ConstructorAFN
 from constructor_afd import ConstructorAFD
 from minimizador_afd import MinimizadorAFD
@@ -14,9 +16,10 @@ from visualizador import (crear_visualizacion_graphviz, crear_visualizacion_simp
                          mostrar_automata_consola, instalar_graphviz_info, guardar_automata_completo, 
                          limpiar_y_crear_carpetas)
 
-def procesar_expresion_regular(expresion):
+def procesar_expresion_regular(expresion, optimizar=True):
     """
     Procesa una expresión regular completa: de regexp a AFD mínimo
+    Si optimizar es True, el AFN se construye desde el árbol de sintaxis simplificado
     """
     print(f"\n{'='*60}")
     print(f"PROCESANDO EXPRESIÓN REGULAR: {expresion}")
@@ -39,7 +42,14 @@ def procesar_expresion_regular(expresion):
     print("\n2. CONSTRUCCIÓN DE AFN (Thompson)")
     print("-" * 40)
     constructor_afn = ConstructorAFN()
-    afn = constructor_afn.convertir_postfix_a_afn(postfix)
+    if optimizar:
+        arbol = analizar_expresion(expresion)
+        arbol_optimizado = OptimizadorRegex().optimizar(arbol)
+        print(f"Árbol de sintaxis: {arbol.a_expresion()} ({arbol.tamano()} nodos)")
+        print(f"Árbol optimizado: {arbol_optimizado.a_expresion()} ({arbol_optimizado.tamano()} nodos)")
+        afn = constructor_afn.convertir_arbol_a_afn(arbol_optimizado)
+    else:
+        afn = constructor_afn.convertir_postfix_a_afn(postfix)
     mostrar_automata_consola(afn, "AFN Generado")
     
     # Guardar AFN en carpeta específica
@@ -148,8 +158,16 @@ def main():
                 else:
                     print("Por favor responde 's' o 'n'")
                     
+        except ErrorSintaxisRegex as e:
+            print("Error de sintaxis en la expresión:")
+            print(e.mostrar())
         except Exception as e:
             print(f"Error al procesar la expresión: {e}")
             print("Verifica que la expresión esté bien formada")
 
-main()
+if __name__ == '__main__':
+    # Con argumentos se escanean archivos en lote (ver escaner.py); sin ellos, el menú interactivo
+    if len(sys.argv) > 1:
+        import escaner
+        sys.exit(escaner.main(sys.argv[1:]))
+    main()
@@ -2,14 +2,15 @@
 Implementación del algoritmo de Hopcroft para minimización de AFD
 """
 from automata import Automata
+from analisis_estados import AnalizadorEstados
 
 class MinimizadorAFD:
     def minimizar_afd(self, afd):
         """
         Minimiza un AFD usando el algoritmo de Hopcroft
         """
-        # Paso 1: Eliminar estados inalcanzables
-        afd_alcanzable = self.eliminar_estados_inalcanzables(afd)
+        # Paso 1: Eliminar estados inalcanzables y estados muertos
+        afd_alcanzable = self.eliminar_estados_muertos(self.eliminar_estados_inalcanzables(afd))
         
         # Paso 2: Crear partición inicial (estados de aceptación vs. no aceptación)
         particiones = self.crear_particion_inicial(afd_alcanzable)
@@ -54,6 +55,27 @@ class MinimizadorAFD:
         
         return afd_alcanzable
     
+    def eliminar_estados_muertos(self, afd):
+        """
+        Elimina los estados desde los que no se puede llegar a aceptación y las
+        transiciones hacia ellos (una transición faltante ya significa rechazo)
+        El estado inicial se conserva aunque esté muerto (lenguaje vacío)
+        """
+        muertos = AnalizadorEstados(afd).estados_muertos()
+        afd_vivo = Automata()
+        afd_vivo.estados = (afd.estados - muertos) | {afd.estado_inicial}
+        afd_vivo.simbolos = afd.simbolos.copy()
+        afd_vivo.estado_inicial = afd.estado_inicial
+        afd_vivo.estados_aceptacion = afd.estados_aceptacion.copy()
+
+        for (estado_origen, simbolo), estados_destino in afd.transiciones.items():
+            if estado_origen not in muertos:
+                for estado_destino in estados_destino:
+                    if estado_destino not in muertos:
+                        afd_vivo.agregar_transicion(estado_origen, simbolo, estado_destino)
+
+        return afd_vivo
+    
     def crear_particion_inicial(self, afd):
         """
         Crea la partición inicial: estados de aceptación y no aceptación
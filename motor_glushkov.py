@@ -0,0 +1,134 @@
+"""
+Motor bit-paralelo sobre el autómata de posiciones de Glushkov (Shift-And generalizado)
+Cada aparición de un símbolo en la expresión es una posición; el conjunto de
+posiciones activas es un entero y un paso es siguientes(D) & MASCARA[símbolo]
+No hay épsilon ni construcción de subconjuntos: compilar solo arma las máscaras
+"""
+from arbol_regex import (NodoVacio, NodoEpsilon, NodoSimbolo, NodoClase, NodoConcatenacion,
+                         NodoUnion, NodoEstrella, NodoPositiva, NodoOpcional)
+
+# Por encima de este número de posiciones conviene el AFD (ver compilador.compilar_motor)
+LIMITE_POSICIONES = 64
+# Los siguientes de un conjunto se leen de a BITS_BLOQUE posiciones con tablas precalculadas
+BITS_BLOQUE = 8
+
+
+def contar_posiciones(nodo):
+    """Número de posiciones (símbolos y clases) del árbol"""
+    if isinstance(nodo, (NodoSimbolo, NodoClase)):
+        return 1
+    if isinstance(nodo, (NodoConcatenacion, NodoUnion)):
+        return sum(contar_posiciones(hijo) for hijo in nodo.hijos)
+    if isinstance(nodo, (NodoEstrella, NodoPositiva, NodoOpcional)):
+        return contar_posiciones(nodo.hijo)
+    return 0
+
+
+class AutomataGlushkov:
+    def __init__(self, arbol):
+        """
+        El bit 0 es el estado inicial y el bit i (i >= 1) la posición i
+        mascaras[simbolo]: posiciones que leen ese símbolo
+        siguientes[i]: posiciones que pueden seguir a la posición i (followpos)
+        """
+        self.mascaras = {}
+        self.siguientes = [0]
+        anulable, primeros, ultimos = self.analizar(arbol)
+        self.siguientes[0] = primeros
+        self.numero_posiciones = len(self.siguientes) - 1
+        self.aceptacion = ultimos | (1 if anulable else 0)
+        self.tablas = self.tablas_por_bloque()
+
+    def nueva_posicion(self, simbolos):
+        """Agrega una posición que lee cualquiera de los símbolos; retorna su bit"""
+        bit = 1 << len(self.siguientes)
+        self.siguientes.append(0)
+        for simbolo in simbolos:
+            self.mascaras[simbolo] = self.mascaras.get(simbolo, 0) | bit
+        return bit
+
+    def enlazar(self, ultimos, primeros):
+        """Cada posición de 'ultimos' puede ser seguida por las de 'primeros'"""
+        while ultimos:
+            menor = ultimos & -ultimos
+            self.siguientes[menor.bit_length() - 1] |= primeros
+            ultimos ^= menor
+
+    def analizar(self, nodo):
+        """Retorna (anulable, primeros, últimos) del nodo y completa siguientes"""
+        if isinstance(nodo, NodoSimbolo):
+            bit = self.nueva_posicion((nodo.simbolo,))
+            return False, bit, bit
+        if isinstance(nodo, NodoClase):
+            bit = self.nueva_posicion(nodo.simbolos)
+            return False, bit, bit
+        if isinstance(nodo, NodoEpsilon):
+            return True, 0, 0
+        if isinstance(nodo, NodoVacio):
+            return False, 0, 0
+        if isinstance(nodo, NodoConcatenacion):
+            anulable, primeros, ultimos = True, 0, 0
+            for hijo in nodo.hijos:
+                anulable_hijo, primeros_hijo, ultimos_hijo = self.analizar(hijo)
+                self.enlazar(ultimos, primeros_hijo)
+                if anulable:
+                    primeros |= primeros_hijo
+                ultimos = ultimos | ultimos_hijo if anulable_hijo else ultimos_hijo
+                anulable = anulable and anulable_hijo
+            return anulable, primeros, ultimos
+        if isinstance(nodo, NodoUnion):
+            anulable, primeros, ultimos = False, 0, 0
+            for hijo in nodo.hijos:
+                anulable_hijo, primeros_hijo, ultimos_hijo = self.analizar(hijo)
+                anulable = anulable or anulable_hijo
+                primeros |= primeros_hijo
+                ultimos |= ultimos_hijo
+            return anulable, primeros, ultimos
+        if isinstance(nodo, (NodoEstrella, NodoPositiva, NodoOpcional)):
+            anulable, primeros, ultimos = self.analizar(nodo.hijo)
+            if not isinstance(nodo, NodoOpcional):
+                self.enlazar(ultimos, primeros)
+            return anulable or not isinstance(nodo, NodoPositiva), primeros, ultimos
+        raise ValueError(f"Nodo desconocido: {nodo!r}")
+
+    def tablas_por_bloque(self):
+        """
+        tablas[j][b]: siguientes de las posiciones del bloque j cuyo patrón de bits es b
+        Así los siguientes de un conjunto D son la unión de tablas[j][(D >> 8j) & 255]
+        """
+        tablas = []
+        tamano = 1 << BITS_BLOQUE
+        for base in range(0, len(self.siguientes), BITS_BLOQUE):
+            tabla = [0] * tamano
+            for patron in range(1, tamano):
+                menor = patron & -patron
+                posicion = base + menor.bit_length() - 1
+                siguiente = self.siguientes[posicion] if posicion < len(self.siguientes) else 0
+                tabla[patron] = tabla[patron ^ menor] | siguiente
+            tablas.append(tabla)
+        return tablas
+
+    def acepta(self, cadena):
+        """Retorna True si la cadena es aceptada"""
+        mascaras = self.mascaras
+        if len(self.tablas) == 1:
+            # Hasta BITS_BLOQUE - 1 posiciones: una sola búsqueda por símbolo
+            tabla = self.tablas[0]
+            activos = 1
+            for simbolo in cadena:
+                activos = tabla[activos] & mascaras.get(simbolo, 0)
+                if not activos:
+                    return False
+            return bool(activos & self.aceptacion)
+
+        desplazamientos = [(tabla, j * BITS_BLOQUE) for j, tabla in enumerate(self.tablas)]
+        bloque = (1 << BITS_BLOQUE) - 1
+        activos = 1
+        for simbolo in cadena:
+            siguientes = 0
+            for tabla, desplazamiento in desplazamientos:
+                siguientes |= tabla[(activos >> desplazamiento) & bloque]
+            activos = siguientes & mascaras.get(simbolo, 0)
+            if not activos:
+                return False
+        return bool(activos & self.aceptacion)
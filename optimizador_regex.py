@@ -0,0 +1,258 @@
+"""
+Optimizador algebraico del árbol de sintaxis de una expresión regular
+Simplifica el árbol antes de la construcción de Thompson para reducir el AFN y el AFD
+"""
+from arbol_regex import (NodoVacio, NodoEpsilon, NodoSimbolo, NodoClase, NodoConcatenacion,
+                         NodoUnion, NodoUnario, NodoEstrella, NodoPositiva, NodoOpcional)
+
+
+class OptimizadorRegex:
+    def __init__(self):
+        # Memo de subárboles ya simplificados (los nodos se comparan por estructura)
+        self.memo = {}
+
+    def optimizar(self, arbol):
+        """
+        Aplica las reglas de reescritura hasta alcanzar un punto fijo
+        """
+        anterior = None
+        while arbol != anterior:
+            anterior = arbol
+            arbol = self.simplificar(arbol)
+        return arbol
+
+    def simplificar(self, nodo):
+        """
+        Simplifica un nodo de abajo hacia arriba (primero sus hijos)
+        El recorrido en postorden usa una pila explícita, así una expresión
+        profunda como a*** o ((a)*)* no agota el límite de recursión
+        """
+        pila = [(nodo, False)]
+        while pila:
+            actual, listo = pila.pop()
+            if actual in self.memo:
+                continue
+            hijos = self.hijos_simplificables(actual)
+            if not listo:
+                pila.append((actual, True))
+                pila.extend((hijo, False) for hijo in hijos)
+                continue
+            self.memo[actual] = self.reescribir(actual, [self.memo[hijo] for hijo in hijos])
+        return self.memo[nodo]
+
+    def hijos_simplificables(self, nodo):
+        """Hijos que se simplifican antes que el nodo"""
+        if isinstance(nodo, (NodoConcatenacion, NodoUnion)):
+            return nodo.hijos
+        if isinstance(nodo, (NodoEstrella, NodoPositiva, NodoOpcional)):
+            return (nodo.hijo,)
+        return ()
+
+    def reescribir(self, nodo, hijos):
+        """Aplica las reglas al nodo, con sus hijos ya simplificados"""
+        if isinstance(nodo, NodoConcatenacion):
+            return self.simplificar_concatenacion(hijos)
+        if isinstance(nodo, NodoUnion):
+            return self.simplificar_union(hijos)
+        if isinstance(nodo, NodoEstrella):
+            return self.simplificar_estrella(hijos[0])
+        if isinstance(nodo, NodoPositiva):
+            return self.simplificar_positiva(hijos[0])
+        if isinstance(nodo, NodoOpcional):
+            return self.simplificar_opcional(hijos[0])
+        if isinstance(nodo, NodoClase) and len(nodo.simbolos) == 1:
+            return NodoSimbolo(next(iter(nodo.simbolos)))
+        return nodo
+
+    def simplificar_estrella(self, hijo):
+        """
+        (x*)* = (x+)* = (x?)* = x*,  ε* = ∅* = ε,  (ε|x|y*)* = (x|y)*
+        """
+        if isinstance(hijo, (NodoVacio, NodoEpsilon)):
+            return NodoEpsilon()
+        if isinstance(hijo, NodoUnario):
+            return self.simplificar_estrella(hijo.hijo)
+        if isinstance(hijo, NodoUnion):
+            # Dentro de una estrella las alternativas pueden perder ε y sus operadores unarios
+            alternativas = []
+            for alternativa in hijo.hijos:
+                if isinstance(alternativa, NodoEpsilon):
+                    continue
+                if isinstance(alternativa, NodoUnario):
+                    alternativa = alternativa.hijo
+                alternativas.append(alternativa)
+            nuevo_hijo = self.simplificar_union(alternativas)
+            if nuevo_hijo != hijo:
+                return self.simplificar_estrella(nuevo_hijo)
+        return NodoEstrella(hijo)
+
+    def simplificar_positiva(self, hijo):
+        """
+        (x+)+ = x+,  (x*)+ = (x?)+ = x*,  x+ = x* si x acepta ε
+        """
+        if isinstance(hijo, (NodoVacio, NodoEpsilon)):
+            return hijo
+        if isinstance(hijo, NodoPositiva):
+            return hijo
+        if hijo.anulable():
+            return self.simplificar_estrella(hijo)
+        return NodoPositiva(hijo)
+
+    def simplificar_opcional(self, hijo):
+        """
+        x? = x si x acepta ε,  (x+)? = x*,  ∅? = ε
+        """
+        if isinstance(hijo, (NodoVacio, NodoEpsilon)):
+            return NodoEpsilon()
+        if hijo.anulable():
+            return hijo
+        if isinstance(hijo, NodoPositiva):
+            return NodoEstrella(hijo.hijo)
+        return NodoOpcional(hijo)
+
+    def simplificar_concatenacion(self, hijos):
+        """
+        Aplana concatenaciones, elimina ε, propaga ∅ y fusiona repeticiones vecinas
+        del mismo cuerpo (x*x* = x*, x*x = xx* = x+, ...)
+        """
+        factores = []
+        for hijo in hijos:
+            if isinstance(hijo, NodoConcatenacion):
+                candidatos = hijo.hijos
+            else:
+                candidatos = (hijo,)
+            for factor in candidatos:
+                if isinstance(factor, NodoEpsilon):
+                    continue
+                if isinstance(factor, NodoVacio):
+                    return NodoVacio()
+                if factores:
+                    fusion = self.fusionar_repeticiones(factores[-1], factor)
+                    if fusion is not None:
+                        factores[-1] = fusion
+                        continue
+                factores.append(factor)
+
+        if not factores:
+            return NodoEpsilon()
+        if len(factores) == 1:
+            return factores[0]
+        return NodoConcatenacion(factores)
+
+    def fusionar_repeticiones(self, izquierdo, derecho):
+        """
+        Fusiona dos factores consecutivos con el mismo cuerpo
+        Retorna None si no se pueden fusionar
+        """
+        cuerpo_izq = izquierdo.hijo if isinstance(izquierdo, NodoUnario) else izquierdo
+        cuerpo_der = derecho.hijo if isinstance(derecho, NodoUnario) else derecho
+        if cuerpo_izq != cuerpo_der:
+            return None
+
+        operadores = {type(izquierdo), type(derecho)}
+        if NodoEstrella not in operadores:
+            # x+x, xx?, x?x? ... no equivalen a una sola repetición
+            return None
+        if operadores == {NodoEstrella}:
+            return izquierdo
+        if operadores == {NodoEstrella, NodoOpcional}:
+            return NodoEstrella(cuerpo_izq)
+        # x*x+, x*x, xx*: al menos una ocurrencia
+        return NodoPositiva(cuerpo_izq)
+
+    def simplificar_union(self, hijos):
+        """
+        Aplana uniones, elimina ∅ y duplicados, factoriza prefijos comunes
+        (una lista de palabras clave se convierte en un trie), junta las
+        alternativas de un solo carácter en una clase y convierte ε|x en x?
+        """
+        alternativas = []
+        vistos = set()
+        for hijo in hijos:
+            candidatos = hijo.hijos if isinstance(hijo, NodoUnion) else (hijo,)
+            for alternativa in candidatos:
+                if isinstance(alternativa, NodoVacio) or alternativa in vistos:
+                    continue
+                vistos.add(alternativa)
+                alternativas.append(alternativa)
+
+        alternativas = self.factorizar_prefijos(alternativas)
+        alternativas = self.juntar_caracteres(alternativas)
+
+        acepta_epsilon = NodoEpsilon() in alternativas
+        if acepta_epsilon:
+            alternativas = [a for a in alternativas if not isinstance(a, NodoEpsilon)]
+
+        if not alternativas:
+            return NodoEpsilon() if acepta_epsilon else NodoVacio()
+        if len(alternativas) == 1:
+            resultado = alternativas[0]
+        else:
+            resultado = NodoUnion(alternativas)
+
+        if acepta_epsilon and not resultado.anulable():
+            return self.simplificar_opcional(resultado)
+        return resultado
+
+    def factorizar_prefijos(self, alternativas):
+        """
+        ab|ac|d -> a(b|c)|d
+        Las alternativas se agrupan por su primer factor conservando el orden
+        """
+        grupos = {}
+        orden = []
+        for alternativa in alternativas:
+            if isinstance(alternativa, NodoConcatenacion):
+                cabeza = alternativa.hijos[0]
+                resto = alternativa.hijos[1:]
+                resto = resto[0] if len(resto) == 1 else NodoConcatenacion(resto)
+            elif isinstance(alternativa, NodoEpsilon):
+                cabeza, resto = alternativa, None
+            else:
+                cabeza, resto = alternativa, NodoEpsilon()
+
+            if cabeza not in grupos:
+                grupos[cabeza] = []
+                orden.append((cabeza, alternativa))
+            grupos[cabeza].append(resto)
+
+        resultado = []
+        for cabeza, alternativa in orden:
+            restos = grupos[cabeza]
+            if len(restos) == 1 or isinstance(cabeza, NodoEpsilon):
+                resultado.append(alternativa)
+                continue
+            sufijo = self.simplificar_union(restos)
+            resultado.append(self.simplificar_concatenacion([cabeza, sufijo]))
+        return resultado
+
+    def juntar_caracteres(self, alternativas):
+        """
+        a|b|[cd] -> [abcd]
+        La clase resultante ocupa la posición de la primera alternativa de un carácter
+        """
+        simbolos = set()
+        posicion = None
+        cantidad = 0
+        for i, alternativa in enumerate(alternativas):
+            if isinstance(alternativa, NodoSimbolo):
+                simbolos.add(alternativa.simbolo)
+            elif isinstance(alternativa, NodoClase):
+                simbolos.update(alternativa.simbolos)
+            else:
+                continue
+            cantidad += 1
+            if posicion is None:
+                posicion = i
+
+        if cantidad < 2:
+            return alternativas
+
+        resultado = []
+        for i, alternativa in enumerate(alternativas):
+            if i == posicion:
+                resultado.append(NodoClase(simbolos))
+            elif not isinstance(alternativa, (NodoSimbolo, NodoClase)):
+                resultado.append(alternativa)
+        return resultado
+
@@ -0,0 +1,110 @@
+"""
+Reconocimiento sin distinguir mayúsculas y minúsculas
+Al compilar, cada símbolo de la expresión se lleva a su forma plegada (casefold),
+así el AFD tiene el mismo tamaño que el de la expresión original; al reconocer,
+la entrada se normaliza con un solo str.translate sobre una tabla compartida
+"""
+from arbol_regex import (NodoSimbolo, NodoClase, NodoConcatenacion, NodoUnion, NodoUnario,
+                         NodoGrupo)
+
+
+def plegar_simbolo(simbolo):
+    """
+    Forma plegada de un carácter; si casefold da varios caracteres (ß -> ss)
+    se usa lower(), y si tampoco es un solo carácter, el mismo símbolo
+    """
+    plegado = simbolo.casefold()
+    if len(plegado) == 1:
+        return plegado
+    plegado = simbolo.lower()
+    return plegado if len(plegado) == 1 else simbolo
+
+
+class TablaPlegado(dict):
+    """
+    Tabla para str.translate: {código: carácter plegado}
+    Los caracteres se pliegan la primera vez que aparecen y quedan guardados
+    """
+    def __missing__(self, codigo):
+        plegado = self[codigo] = plegar_simbolo(chr(codigo))
+        return plegado
+
+
+TABLA_PLEGADO = TablaPlegado()
+
+
+def normalizar(cadena):
+    """La cadena con cada carácter plegado (misma longitud, mismas posiciones)"""
+    return cadena.translate(TABLA_PLEGADO)
+
+
+def plegar_arbol(arbol):
+    """
+    Árbol equivalente con los símbolos plegados (las clases se reducen al plegarlas)
+    Se recorre en postorden con una pila explícita, así un anidamiento profundo no
+    agota la recursión; cada nodo se arma con sus hijos ya plegados
+    """
+    plegados = []
+    pila = [(arbol, False)]
+    while pila:
+        nodo, listo = pila.pop()
+        hijos = nodo.subarboles()
+        if hijos and not listo:
+            pila.append((nodo, True))
+            pila.extend((hijo, False) for hijo in reversed(hijos))
+            continue
+        if hijos:
+            de_hijos = plegados[-len(hijos):]
+            del plegados[-len(hijos):]
+        else:
+            de_hijos = []
+        plegados.append(plegar_nodo(nodo, de_hijos))
+    return plegados[0]
+
+
+def plegar_nodo(nodo, hijos):
+    """Copia plegada de un nodo a partir de sus hijos ya plegados"""
+    if isinstance(nodo, NodoSimbolo):
+        return NodoSimbolo(plegar_simbolo(nodo.simbolo))
+    if isinstance(nodo, NodoClase):
+        return NodoClase(plegar_simbolo(simbolo) for simbolo in nodo.simbolos)
+    if isinstance(nodo, NodoConcatenacion):
+        return NodoConcatenacion(hijos)
+    if isinstance(nodo, NodoUnion):
+        return NodoUnion(hijos)
+    if isinstance(nodo, NodoGrupo):
+        return NodoGrupo(hijos[0], nodo.numero)
+    if isinstance(nodo, NodoUnario):
+        return type(nodo)(hijos[0])
+    return nodo
+
+
+class ReconocedorSinMayusculas:
+    def __init__(self, buscador):
+        """
+        buscador: BuscadorAFD del AFD compilado con ignorar_mayusculas=True; busca en
+        tiempo lineal sobre el texto normalizado y su AFDCompilado reconoce
+        """
+        self.buscador = buscador
+        self.automata = buscador.compilado
+
+    def acepta(self, cadena):
+        """Retorna True si la cadena, plegada, es aceptada"""
+        return self.automata.acepta(normalizar(cadena))
+
+    def coincidencia_mas_larga(self, texto, posicion):
+        """
+        Como AFDCompilado.coincidencia_mas_larga; las posiciones son las del texto original
+        Solo se normaliza texto[posicion:] (el plegado conserva las posiciones);
+        para probar muchas posiciones conviene buscar o buscar_todas
+        """
+        fin = self.automata.coincidencia_mas_larga(normalizar(texto[posicion:]), 0)
+        return fin if fin == -1 else posicion + fin
+
+    def buscar(self, texto, inicio=0):
+        """Coincidencia más a la izquierda y más larga en texto[inicio:] como (inicio, fin), o None"""
+        return self.buscador.buscar(normalizar(texto), inicio)
+
+    def buscar_todas(self, texto):
+        """Genera las coincidencias (inicio, fin) sin solapamiento; el texto se normaliza una vez"""
+        return self.buscador.buscar_todas(normalizar(texto))
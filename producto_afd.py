@@ -0,0 +1,101 @@
+"""
+Operaciones de producto entre AFD: intersección, unión, diferencia, diferencia
+simétrica y complemento. Solo se construyen los pares de estados alcanzables
+"""
+from collections import deque
+from automata import Automata
+from minimizador_afd import MinimizadorAFD
+
+
+class OperacionesAFD:
+    def interseccion(self, afd1, afd2, minimizar=False):
+        """Acepta las cadenas aceptadas por ambos AFD"""
+        return self.producto(afd1, afd2, lambda a, b: a and b, minimizar)
+
+    def union(self, afd1, afd2, minimizar=False):
+        """Acepta las cadenas aceptadas por al menos uno de los AFD"""
+        return self.producto(afd1, afd2, lambda a, b: a or b, minimizar)
+
+    def diferencia(self, afd1, afd2, minimizar=False):
+        """Acepta las cadenas aceptadas por afd1 pero no por afd2"""
+        return self.producto(afd1, afd2, lambda a, b: a and not b, minimizar)
+
+    def diferencia_simetrica(self, afd1, afd2, minimizar=False):
+        """Acepta las cadenas aceptadas por exactamente uno de los AFD"""
+        return self.producto(afd1, afd2, lambda a, b: a != b, minimizar)
+
+    def producto(self, afd1, afd2, operacion, minimizar=False):
+        """
+        Construye el autómata producto explorando bajo demanda (BFS) solo los pares
+        alcanzables desde el par inicial; nunca se recorre todo Q1 x Q2
+        operacion(acepta1, acepta2) decide si un par es de aceptación
+        Una transición faltante lleva al sumidero implícito None; los pares que ya
+        no pueden aceptar según la operación no se exploran
+        """
+        simbolos = sorted(afd1.simbolos | afd2.simbolos)
+        tabla1 = afd1.tabla_determinista()
+        tabla2 = afd2.tabla_determinista()
+
+        def par_muerto(estado1, estado2):
+            # Un componente en el sumidero nunca vuelve a aceptar
+            valores1 = (False,) if estado1 is None else (False, True)
+            valores2 = (False,) if estado2 is None else (False, True)
+            return not any(operacion(a, b) for a in valores1 for b in valores2)
+
+        resultado = Automata()
+        resultado.simbolos = set(simbolos)
+        par_inicial = (afd1.estado_inicial, afd2.estado_inicial)
+        mapeo = {par_inicial: 0}
+        resultado.establecer_estado_inicial(0)
+        cola = deque([par_inicial])
+
+        while cola:
+            par = cola.popleft()
+            estado1, estado2 = par
+            if operacion(estado1 in afd1.estados_aceptacion, estado2 in afd2.estados_aceptacion):
+                resultado.agregar_estado_aceptacion(mapeo[par])
+
+            for simbolo in simbolos:
+                siguiente = (tabla1.get(estado1, {}).get(simbolo), tabla2.get(estado2, {}).get(simbolo))
+                if par_muerto(*siguiente):
+                    continue
+                if siguiente not in mapeo:
+                    mapeo[siguiente] = len(mapeo)
+                    cola.append(siguiente)
+                resultado.agregar_transicion(mapeo[par], simbolo, mapeo[siguiente])
+
+        if minimizar:
+            return MinimizadorAFD().minimizar_afd(resultado)
+        return resultado
+
+    def complemento(self, afd, alfabeto=None, minimizar=False):
+        """
+        Acepta las cadenas sobre el alfabeto dado (por defecto el del AFD) que el
+        AFD rechaza. Las transiciones faltantes se completan con un estado sumidero
+        que solo se crea si se alcanza
+        """
+        simbolos = sorted(set(alfabeto) if alfabeto is not None else afd.simbolos)
+        tabla = afd.tabla_determinista()
+
+        resultado = Automata()
+        resultado.simbolos = set(simbolos)
+        mapeo = {afd.estado_inicial: 0}
+        resultado.establecer_estado_inicial(0)
+        cola = deque([afd.estado_inicial])
+
+        while cola:
+            estado = cola.popleft()
+            if estado not in afd.estados_aceptacion:
+                resultado.agregar_estado_aceptacion(mapeo[estado])
+
+            for simbolo in simbolos:
+                # None es el sumidero: en el complemento acepta todo lo que sigue
+                siguiente = tabla.get(estado, {}).get(simbolo)
+                if siguiente not in mapeo:
+                    mapeo[siguiente] = len(mapeo)
+                    cola.append(siguiente)
+                resultado.agregar_transicion(mapeo[estado], simbolo, mapeo[siguiente])
+
+        if minimizar:
+            return MinimizadorAFD().minimizar_afd(resultado)
+        return resultado
@@ -0,0 +1,41 @@
+"""
+Reconocimiento incremental de entradas que llegan en fragmentos
+Entre fragmentos solo se guarda el estado actual (un entero), sin acumular
+ni concatenar la entrada; funciona con AFDCompilado (texto) y AFDBytes (bytes,
+donde un carácter UTF-8 puede quedar partido entre dos fragmentos)
+"""
+
+
+class ReconocedorIncremental:
+    __slots__ = ('automata', 'estado')
+
+    def __init__(self, automata):
+        """automata: AFDCompilado o AFDBytes, compartido por todos los flujos"""
+        self.automata = automata
+        self.estado = automata.inicial
+
+    def alimentar(self, fragmento):
+        """Procesa el siguiente fragmento de la entrada; retorna self para encadenar"""
+        if self.automata.es_vivo(self.estado):
+            self.estado = self.automata.avanzar(self.estado, fragmento)
+        return self
+
+    def esta_aceptando(self):
+        """Indica si la entrada leída hasta ahora es aceptada"""
+        return self.automata.es_aceptacion(self.estado)
+
+    def puede_aceptar(self):
+        """Indica si alguna continuación de la entrada leída puede ser aceptada"""
+        return self.automata.es_vivo(self.estado)
+
+    def reiniciar(self):
+        """Vuelve al estado inicial para reconocer una entrada nueva"""
+        self.estado = self.automata.inicial
+
+    def instantanea(self):
+        """Estado actual (un entero, o None si no hay transición) para suspender el flujo"""
+        return self.estado
+
+    def restaurar(self, instantanea):
+        """Continúa un flujo suspendido con instantanea()"""
+        self.estado = instantanea
@@ -0,0 +1,287 @@
+"""
+Servidor local (asyncio) para compilar expresiones y probar cadenas
+Protocolo: una solicitud JSON por línea y una respuesta JSON por línea
+  {"id": 1, "op": "compile", "patron": "(a|b)*abb"}
+  {"id": 2, "op": "match", "patron": "(a|b)*abb", "cadena": "aabb"}
+  {"id": 3, "op": "match_batch", "patron": "(a|b)*abb", "cadenas": ["abb", "ab"]}
+  {"id": 4, "op": "stats"}
+Las solicitudes de una conexión se atienden en paralelo (pipelining): cada
+respuesta lleva el mismo "id" y puede llegar en otro orden
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from afd_compilado import AFDCompilado
+from compilador import compilar_afd
+from shunting_yard import ErrorSintaxisRegex
+
+OPERACIONES = ('compile', 'match', 'match_batch', 'stats')
+PERCENTILES = (50, 90, 99)
+# Latencias que se guardan por operación para calcular percentiles
+MUESTRAS_LATENCIA = 10000
+
+
+def compilar_en_proceso(patron):
+    """
+    Se ejecuta en el pool de procesos: retorna (AFDCompilado, None) o
+    (None, descripción del error); el AFD compilado es picklable
+    """
+    try:
+        return AFDCompilado(compilar_afd(patron)), None
+    except ErrorSintaxisRegex as e:
+        return None, {'error': e.mensaje, 'posicion': e.posicion}
+    except ValueError as e:
+        return None, {'error': str(e)}
+    except Exception as e:
+        # RecursionError, MemoryError, ...: se informa en lugar de salir del pool
+        return None, {'error': f"No se pudo compilar: {type(e).__name__}: {e}"}
+
+
+class ErrorSolicitud(Exception):
+    """Solicitud inválida; se responde con ok=false sin cerrar la conexión"""
+    def __init__(self, detalle):
+        self.detalle = detalle if isinstance(detalle, dict) else {'error': detalle}
+        super().__init__(self.detalle['error'])
+
+
+class ServidorAutomatas:
+    def __init__(self, capacidad_cache=128, procesos=None):
+        """
+        capacidad_cache: número máximo de patrones compilados en memoria (LRU)
+        procesos: tamaño del pool de compilación (None = número de CPUs,
+                  0 = compilar en un hilo del propio proceso)
+        """
+        self.capacidad_cache = capacidad_cache
+        self.procesos = procesos
+        self.cache = OrderedDict()
+        # Compilaciones en curso: varias solicitudes del mismo patrón esperan la misma
+        self.en_curso = {}
+        self.pool = None
+        self.servidor = None
+        self.aciertos_cache = 0
+        self.fallos_cache = 0
+        self.latencias = {operacion: deque(maxlen=MUESTRAS_LATENCIA) for operacion in OPERACIONES}
+
+    async def iniciar(self, host='127.0.0.1', puerto=0, ruta_socket=None):
+        """
+        Empieza a escuchar por TCP local o por un socket Unix
+        Retorna la dirección (host, puerto) o la ruta del socket
+        """
+        if self.procesos != 0:
+            # 'spawn': los procesos hijos no heredan los sockets abiertos del servidor
+            self.pool = ProcessPoolExecutor(max_workers=self.procesos,
+                                            mp_context=multiprocessing.get_context('spawn'))
+        if ruta_socket is not None:
+            self.servidor = await asyncio.start_unix_server(self.atender_conexion, path=ruta_socket)
+            return ruta_socket
+        self.servidor = await asyncio.start_server(self.atender_conexion, host, puerto)
+        return self.servidor.sockets[0].getsockname()[:2]
+
+    async def detener(self):
+        """Cierra el servidor y el pool de procesos"""
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def atender_conexion(self, lector, escritor):
+        """Lee solicitudes línea por línea y atiende cada una en su propia tarea"""
+        tareas = set()
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                tarea = asyncio.create_task(self.responder(linea, escritor))
+                tareas.add(tarea)
+                tarea.add_done_callback(tareas.discard)
+            if tareas:
+                await asyncio.gather(*tareas, return_exceptions=True)
+        finally:
+            escritor.close()
+
+    async def responder(self, linea, escritor):
+        """Procesa una solicitud y escribe su respuesta (con el mismo id)"""
+        inicio = time.perf_counter()
+        identificador = None
+        operacion = None
+        try:
+            try:
+                solicitud = json.loads(linea)
+            except ValueError:
+                raise ErrorSolicitud("JSON inválido")
+            if not isinstance(solicitud, dict):
+                raise ErrorSolicitud("La solicitud debe ser un objeto JSON")
+            identificador = solicitud.get('id')
+            operacion = solicitud.get('op')
+            if operacion not in OPERACIONES:
+                raise ErrorSolicitud(f"Operación desconocida: {operacion} (use {', '.join(OPERACIONES)})")
+            respuesta = await self.ejecutar(operacion, solicitud)
+            respuesta['ok'] = True
+        except ErrorSolicitud as e:
+            respuesta = dict(e.detalle, ok=False)
+        except Exception as e:
+            # Cualquier otro fallo (pool roto, memoria, ...) también recibe respuesta
+            respuesta = {'error': f"Error interno: {type(e).__name__}: {e}", 'ok': False}
+        respuesta['id'] = identificador
+
+        escritor.write(json.dumps(respuesta, ensure_ascii=False).encode('utf-8') + b'\n')
+        await escritor.drain()
+        if operacion in self.latencias:
+            self.latencias[operacion].append(time.perf_counter() - inicio)
+
+    async def ejecutar(self, operacion, solicitud):
+        """Despacha la operación; retorna el diccionario de respuesta"""
+        if operacion == 'stats':
+            return self.estadisticas()
+
+        patron = solicitud.get('patron')
+        if not isinstance(patron, str):
+            raise ErrorSolicitud("Falta el campo 'patron'")
+        compilado = await self.obtener_compilado(patron)
+
+        if operacion == 'compile':
+            return {'estados': len(compilado.estados)}
+        if operacion == 'match':
+            cadena = solicitud.get('cadena')
+            if not isinstance(cadena, str):
+                raise ErrorSolicitud("Falta el campo 'cadena'")
+            return {'acepta': compilado.acepta(cadena)}
+        cadenas = solicitud.get('cadenas')
+        if not isinstance(cadenas, list) or not all(isinstance(c, str) for c in cadenas):
+            raise ErrorSolicitud("El campo 'cadenas' debe ser una lista de cadenas")
+        return {'resultados': [compilado.acepta(cadena) for cadena in cadenas]}
+
+    async def obtener_compilado(self, patron):
+        """AFD compilado del patrón: de la caché LRU o compilado fuera del ciclo de eventos"""
+        compilado = self.cache.get(patron)
+        if compilado is not None:
+            self.cache.move_to_end(patron)
+            self.aciertos_cache += 1
+            return compilado
+
+        self.fallos_cache += 1
+        futuro = self.en_curso.get(patron)
+        if futuro is None:
+            bucle = asyncio.get_running_loop()
+            futuro = bucle.run_in_executor(self.pool, compilar_en_proceso, patron)
+            self.en_curso[patron] = futuro
+            try:
+                compilado, error = await futuro
+            finally:
+                del self.en_curso[patron]
+            if compilado is not None:
+                self.guardar_en_cache(patron, compilado)
+        else:
+            compilado, error = await futuro
+
+        if error is not None:
+            raise ErrorSolicitud(error)
+        return compilado
+
+    def guardar_en_cache(self, patron, compilado):
+        """Agrega el patrón y descarta el usado hace más tiempo si se excede la capacidad"""
+        self.cache[patron] = compilado
+        self.cache.move_to_end(patron)
+        while len(self.cache) > self.capacidad_cache:
+            self.cache.popitem(last=False)
+
+    def estadisticas(self):
+        """Estado de la caché y percentiles de latencia (en milisegundos) por operación"""
+        latencias = {}
+        for operacion, muestras in self.latencias.items():
+            if muestras:
+                ordenadas = sorted(muestras)
+                latencias[operacion] = {f"p{p}": round(percentil(ordenadas, p) * 1000, 3) for p in PERCENTILES}
+                latencias[operacion]['cantidad'] = len(ordenadas)
+        return {
+            'patrones_en_cache': len(self.cache),
+            'capacidad_cache': self.capacidad_cache,
+            'aciertos_cache': self.aciertos_cache,
+            'fallos_cache': self.fallos_cache,
+            'latencias_ms': latencias,
+        }
+
+
+def percentil(ordenadas, p):
+    """Percentil p (0-100) de una lista ordenada, por el rango más cercano"""
+    indice = max(0, min(len(ordenadas) - 1, round(p / 100 * len(ordenadas)) - 1))
+    return ordenadas[indice]
+
+
+class ClienteAutomatas:
+    """Cliente asyncio para el servidor; permite enviar varias solicitudes sin esperar"""
+    def __init__(self):
+        self.lector = None
+        self.escritor = None
+        self.siguiente_id = 0
+        self.pendientes = {}
+        self.tarea_lectura = None
+
+    async def conectar(self, host='127.0.0.1', puerto=None, ruta_socket=None):
+        if ruta_socket is not None:
+            self.lector, self.escritor = await asyncio.open_unix_connection(ruta_socket)
+        else:
+            self.lector, self.escritor = await asyncio.open_connection(host, puerto)
+        self.tarea_lectura = asyncio.create_task(self.leer_respuestas())
+
+    async def leer_respuestas(self):
+        """Entrega cada respuesta a la solicitud con el mismo id"""
+        while True:
+            linea = await self.lector.readline()
+            if not linea:
+                break
+            respuesta = json.loads(linea)
+            futuro = self.pendientes.pop(respuesta.get('id'), None)
+            if futuro is not None and not futuro.done():
+                futuro.set_result(respuesta)
+        for futuro in self.pendientes.values():
+            if not futuro.done():
+                futuro.set_exception(ConnectionError("El servidor cerró la conexión"))
+
+    async def solicitar(self, operacion, **campos):
+        """Envía una solicitud y espera su respuesta"""
+        self.siguiente_id += 1
+        identificador = self.siguiente_id
+        futuro = asyncio.get_running_loop().create_future()
+        self.pendientes[identificador] = futuro
+        solicitud = dict(campos, id=identificador, op=operacion)
+        self.escritor.write(json.dumps(solicitud, ensure_ascii=False).encode('utf-8') + b'\n')
+        await self.escritor.drain()
+        return await futuro
+
+    async def cerrar(self):
+        self.escritor.close()
+        await self.escritor.wait_closed()
+        if self.tarea_lectura is not None:
+            await self.tarea_lectura
+
+
+async def ejecutar_servidor(argumentos):
+    servidor = ServidorAutomatas(argumentos.cache, argumentos.procesos)
+    direccion = await servidor.iniciar(argumentos.host, argumentos.puerto, argumentos.socket)
+    print(f"Servidor escuchando en {direccion}")
+    try:
+        await servidor.servidor.serve_forever()
+    finally:
+        await servidor.detener()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Servidor local de autómatas (JSON por líneas)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--socket', help="Ruta de un socket Unix (en lugar de TCP)")
+    parser.add_argument('--cache', type=int, default=128, help="Patrones compilados en la caché LRU")
+    parser.add_argument('--procesos', type=int, default=None, help="Procesos de compilación (0 = sin pool)")
+    try:
+        asyncio.run(ejecutar_servidor(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
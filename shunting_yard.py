@@ -1,10 +1,20 @@
 """
 Implementación del algoritmo Shunting Yard para convertir expresiones regulares a notación postfix
 """
+from collections import namedtuple
+from arbol_regex import (SIMBOLOS_CENTINELA, NodoEpsilon, NodoSimbolo, NodoClase,
+                         NodoConcatenacion, NodoUnion, NodoEstrella, NodoPositiva, NodoOpcional,
+                         NodoGrupo)
 
 
 alfabeto = list('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789@._!?-, ')
 
+# Operadores y metacaracteres reservados del regex
+OPERADORES_RESERVADOS = frozenset({'|', '·', '*', '+', '(', ')', '[', ']', '\\', '?'})
+
+# Carácter escapado -> símbolo especial usado en la notación postfix
+CENTINELAS_ESCAPE = {literal: centinela for centinela, literal in SIMBOLOS_CENTINELA.items()}
+
 def procesar_escapes(expresion):
     """
     Procesa secuencias de escape y clases de caracteres en la expresión regular
@@ -15,32 +25,10 @@ def procesar_escapes(expresion):
     i = 0
     while i < len(expresion):
         if i < len(expresion) - 1 and expresion[i] == '\\':
-            # Carácter escapado
-            if expresion[i + 1] == '.':
-                resultado.append('●')  # Punto literal usando símbolo especial
-                i += 2
-            elif expresion[i + 1] == '?':
-                resultado.append('◆')  # Signo de interrogación literal usando símbolo especial
-                i += 2
-            elif expresion[i + 1] == '(':
-                resultado.append('◎')  # Paréntesis izquierdo literal
-                i += 2
-            elif expresion[i + 1] == ')':
-                resultado.append('◉')  # Paréntesis derecho literal
-                i += 2
-            elif expresion[i + 1] == '\\':
-                resultado.append('◈')  # Barra invertida literal
-                i += 2
-            elif expresion[i + 1] == '{':
-                resultado.append('◊')  # Llave izquierda literal
-                i += 2
-            elif expresion[i + 1] == '}':
-                resultado.append('◘')  # Llave derecha literal
-                i += 2
-            else:
-                # Otros escapes - convertir a literal quitando la barra
-                resultado.append(expresion[i + 1])
-                i += 2
+            # Carácter escapado: los metacaracteres se codifican con un símbolo especial,
+            # otros escapes se convierten a literal quitando la barra
+            resultado.append(CENTINELAS_ESCAPE.get(expresion[i + 1], expresion[i + 1]))
+            i += 2
         elif expresion[i] == '[':
             # Clase de caracteres - encontrar el final
             j = i + 1
@@ -154,11 +142,8 @@ def es_simbolo(caracter):
     Determina si un carácter es un símbolo del alfabeto
     (letras, dígitos, épsilon, @, símbolos especiales, etc.)
     """
-    # Operadores y metacaracteres reservados del regex
-    operadores_reservados = {'|', '·', '*', '+', '(', ')', '[', ']', '\\', '?'}
-    
     # Un símbolo es cualquier carácter que NO sea un operador reservado
-    return caracter not in operadores_reservados
+    return caracter not in OPERADORES_RESERVADOS
 
 def mostrar_conversion(expresion):
     """
@@ -174,3 +159,182 @@ def mostrar_conversion(expresion):
     resultado = convertir_a_postfix(expresion)
     print(f"Notación postfix: {resultado}")
     return resultado
+
+
+# Analizador de una sola pasada: tokens tipados con su posición en la expresión original
+
+Token = namedtuple('Token', ['tipo', 'valor', 'inicio', 'fin'])
+
+TOKEN_LITERAL = 'literal'
+TOKEN_CLASE = 'clase'
+TOKEN_EPSILON = 'epsilon'
+TOKEN_OPERADOR = 'operador'
+TOKEN_GRUPO = 'grupo'
+
+OPERADORES_POSTFIJOS = frozenset({'*', '+', '?'})
+
+
+class ErrorSintaxisRegex(ValueError):
+    """Error de sintaxis en una expresión regular, con la posición exacta del problema"""
+    def __init__(self, mensaje, expresion, posicion):
+        self.mensaje = mensaje
+        self.expresion = expresion
+        self.posicion = posicion
+        super().__init__(f"{mensaje} (posición {posicion})")
+
+    def mostrar(self):
+        """Retorna la expresión con un indicador ^ bajo la posición del error"""
+        return f"{self.expresion}\n{' ' * self.posicion}^ {self.mensaje}"
+
+
+def tokenizar(expresion):
+    """
+    Recorre la expresión una sola vez y genera tokens tipados (literal, clase,
+    épsilon, operador, grupo) con su intervalo [inicio, fin) en la expresión
+    Los escapes se resuelven aquí, sin símbolos especiales intermedios
+    """
+    n = len(expresion)
+    i = 0
+    while i < n:
+        caracter = expresion[i]
+        if caracter == '\\':
+            if i + 1 >= n:
+                raise ErrorSintaxisRegex("Escape incompleto al final de la expresión", expresion, i)
+            yield Token(TOKEN_LITERAL, expresion[i + 1], i, i + 2)
+            i += 2
+        elif caracter == '[':
+            cierre = expresion.find(']', i + 1)
+            if cierre == -1:
+                raise ErrorSintaxisRegex("Clase de caracteres '[' sin cerrar", expresion, i)
+            if cierre == i + 1:
+                raise ErrorSintaxisRegex("Clase de caracteres vacía", expresion, i)
+            yield Token(TOKEN_CLASE, expresion[i + 1:cierre], i, cierre + 1)
+            i = cierre + 1
+        elif caracter == ']':
+            raise ErrorSintaxisRegex("']' sin '[' correspondiente", expresion, i)
+        elif caracter in ('(', ')'):
+            yield Token(TOKEN_GRUPO, caracter, i, i + 1)
+            i += 1
+        elif caracter in OPERADORES_POSTFIJOS or caracter in ('|', '·'):
+            yield Token(TOKEN_OPERADOR, caracter, i, i + 1)
+            i += 1
+        elif caracter == 'ε' or caracter == 'E':
+            yield Token(TOKEN_EPSILON, caracter, i, i + 1)
+            i += 1
+        else:
+            yield Token(TOKEN_LITERAL, caracter, i, i + 1)
+            i += 1
+
+
+def nodo_clase(caracteres):
+    """Nodo para una clase [..]; como en procesar_escapes, E y ε dentro de la clase son épsilon"""
+    simbolos = set(caracteres) - {'E', 'ε'}
+    if not simbolos:
+        return NodoEpsilon()
+    if len(simbolos) == len(set(caracteres)):
+        return NodoClase(simbolos)
+    return NodoUnion([NodoClase(simbolos), NodoEpsilon()])
+
+
+def es_operador(token, valores):
+    """Indica si el token es uno de los operadores dados"""
+    return token is not None and token.tipo == TOKEN_OPERADOR and token.valor in valores
+
+
+def analizar_expresion(expresion, capturas=False):
+    """
+    Convierte la expresión directamente en un árbol de sintaxis (ver arbol_regex)
+    en una sola pasada y tiempo lineal, sin cadenas intermedias
+    Cada nivel de paréntesis tiene su lista de alternativas y de factores, así
+    la concatenación implícita y la unión producen nodos n-arios sin recursión
+    Con capturas=True cada paréntesis es un NodoGrupo, numerado desde 1 en el
+    orden de los '(' como en otros motores
+    Lanza ErrorSintaxisRegex con la posición exacta si la expresión es inválida
+    """
+    # Cada marco: [posición del '(', alternativas, factores]
+    marcos = [[None, [], []]]
+    # Números de los grupos abiertos (solo con capturas)
+    grupos = []
+    total_grupos = 0
+    ultimo = None
+    # Los nodos son inmutables: un solo NodoSimbolo por carácter distinto
+    literales = {}
+
+    for token in tokenizar(expresion):
+        _, alternativas, factores = marcos[-1]
+
+        if token.tipo == TOKEN_LITERAL:
+            nodo = literales.get(token.valor)
+            if nodo is None:
+                nodo = literales[token.valor] = NodoSimbolo(token.valor)
+            factores.append(nodo)
+        elif token.tipo == TOKEN_CLASE:
+            factores.append(nodo_clase(token.valor))
+        elif token.tipo == TOKEN_EPSILON:
+            factores.append(NodoEpsilon())
+        elif token.tipo == TOKEN_GRUPO and token.valor == '(':
+            marcos.append([token.inicio, [], []])
+            if capturas:
+                total_grupos += 1
+                grupos.append(total_grupos)
+        elif token.tipo == TOKEN_GRUPO:
+            if len(marcos) == 1:
+                raise ErrorSintaxisRegex("')' sin '(' correspondiente", expresion, token.inicio)
+            if es_operador(ultimo, '·'):
+                raise ErrorSintaxisRegex("Concatenación '·' sin operando derecho", expresion, ultimo.inicio)
+            if not factores:
+                mensaje = "Grupo vacío" if not alternativas else "Alternativa vacía antes de ')'"
+                raise ErrorSintaxisRegex(mensaje, expresion, token.inicio)
+            marcos.pop()
+            nodo = cerrar_grupo(alternativas, factores)
+            if capturas:
+                nodo = NodoGrupo(nodo, grupos.pop())
+            marcos[-1][2].append(nodo)
+        elif token.valor == '|':
+            if es_operador(ultimo, '·'):
+                raise ErrorSintaxisRegex("Concatenación '·' sin operando derecho", expresion, ultimo.inicio)
+            if not factores:
+                raise ErrorSintaxisRegex("Alternativa vacía antes de '|'", expresion, token.inicio)
+            alternativas.append(cerrar_concatenacion(factores))
+            marcos[-1][2] = []
+        elif token.valor == '·':
+            if not factores or es_operador(ultimo, '·'):
+                raise ErrorSintaxisRegex("Concatenación '·' sin operando izquierdo", expresion, token.inicio)
+        else:
+            # Operador postfijo: se aplica al último factor
+            if not factores or es_operador(ultimo, '|·'):
+                raise ErrorSintaxisRegex(f"Operador '{token.valor}' sin operando", expresion, token.inicio)
+            operando = factores.pop()
+            if token.valor == '*':
+                factores.append(NodoEstrella(operando))
+            elif token.valor == '+':
+                factores.append(NodoPositiva(operando))
+            else:
+                factores.append(NodoOpcional(operando))
+        ultimo = token
+
+    if len(marcos) > 1:
+        raise ErrorSintaxisRegex("'(' sin cerrar", expresion, marcos[-1][0])
+    if es_operador(ultimo, '·'):
+        raise ErrorSintaxisRegex("Concatenación '·' sin operando derecho", expresion, ultimo.inicio)
+
+    _, alternativas, factores = marcos[0]
+    if not factores:
+        if alternativas:
+            raise ErrorSintaxisRegex("Alternativa vacía al final de la expresión", expresion, len(expresion))
+        raise ErrorSintaxisRegex("Expresión vacía", expresion, 0)
+    return cerrar_grupo(alternativas, factores)
+
+
+def cerrar_concatenacion(factores):
+    """Une los factores de una alternativa en un solo nodo"""
+    if len(factores) == 1:
+        return factores[0]
+    return NodoConcatenacion(factores)
+
+
+def cerrar_grupo(alternativas, factores):
+    """Une las alternativas de un grupo en un solo nodo"""
+    if not alternativas:
+        return cerrar_concatenacion(factores)
+    return NodoUnion(alternativas + [cerrar_concatenacion(factores)])
@@ -1,10 +1,16 @@
 """
 Simulador para probar cadenas en un AFD
 """
+from itertools import islice
+from analisis_estados import AnalizadorEstados
 
 class SimuladorAFD:
     def __init__(self, afd):
         self.afd = afd
+        analizador = AnalizadorEstados(afd)
+        # Al llegar a uno de estos estados el resultado ya no depende del resto de la cadena
+        self.estados_muertos = analizador.estados_muertos()
+        self.estados_universales = analizador.estados_universales()
         
     def simular_cadena(self, cadena):
         """
@@ -41,6 +47,15 @@ class SimuladorAFD:
             estado_siguiente = next(iter(estados_destino))
             print(f"Transición: ({estado_actual}, {simbolo}) -> {estado_siguiente}")
             estado_actual = estado_siguiente
+
+            if estado_actual in self.estados_muertos:
+                print(f"El estado {estado_actual} es muerto: ninguna continuación es aceptada")
+                print("Cadena RECHAZADA ✗")
+                return False
+            if estado_actual in self.estados_universales:
+                print(f"El estado {estado_actual} acepta cualquier continuación del alfabeto")
+                print("Cadena ACEPTADA ✓")
+                return True
         
         # Verificar si el estado final es de aceptación
         print(f"\nEstado final: {estado_actual}")
@@ -56,23 +71,30 @@ class SimuladorAFD:
     def simular_cadena_paso_a_paso(self, cadena):
         """
         Simula una cadena paso a paso, mostrando cada transición
+        Cada configuración es (estado, símbolo leído, posición): lo que falta leer
+        es cadena[posición:], sin copiar el resto de la cadena en cada paso
+        Termina antes del final si llega a un estado muerto o universal
         """
         configuraciones = []
         estado_actual = self.afd.estado_inicial
-        
+
         # Configuración inicial
-        configuraciones.append((estado_actual, cadena, 0))
-        
+        configuraciones.append((estado_actual, None, 0))
+
         for i, simbolo in enumerate(cadena):
             estados_destino = self.afd.obtener_transiciones(estado_actual, simbolo)
-            
+
             if not estados_destino:
-                configuraciones.append((None, cadena[i+1:], i+1))
-                break
-            
+                configuraciones.append((None, simbolo, i+1))
+                return configuraciones, False
+
             estado_actual = next(iter(estados_destino))
-            configuraciones.append((estado_actual, cadena[i+1:], i+1))
-        
+            configuraciones.append((estado_actual, simbolo, i+1))
+            if estado_actual in self.estados_muertos:
+                return configuraciones, False
+            if estado_actual in self.estados_universales:
+                return configuraciones, self.afd.simbolos.issuperset(islice(cadena, i+1, None))
+
         return configuraciones, estado_actual in self.afd.estados_aceptacion
     
     def mostrar_tabla_transiciones(self):
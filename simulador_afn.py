@@ -0,0 +1,49 @@
+"""
+Simulador para probar cadenas directamente en un AFN (sin construir el AFD)
+"""
+from constructor_afd import ConstructorAFD
+
+
+class SimuladorAFN:
+    def __init__(self, afn):
+        self.afn = afn
+        # Un AFN sin ε (ver eliminador_epsilon) no necesita calcular clausuras
+        self.tiene_epsilon = any(simbolo == 'ε' for (_, simbolo) in afn.transiciones)
+        self.clausuras = {}
+
+    def clausura(self, estado):
+        """Retorna la ε-clausura de un estado, calculándola una sola vez"""
+        if estado not in self.clausuras:
+            self.clausuras[estado] = frozenset(ConstructorAFD().epsilon_clausura(self.afn, {estado}))
+        return self.clausuras[estado]
+
+    def estados_iniciales(self):
+        """Conjunto de estados activos antes de leer la cadena"""
+        if self.tiene_epsilon:
+            return set(self.clausura(self.afn.estado_inicial))
+        return {self.afn.estado_inicial}
+
+    def paso(self, estados_actuales, simbolo):
+        """Calcula los estados activos después de leer un símbolo"""
+        siguientes = set()
+        for estado in estados_actuales:
+            destinos = self.afn.transiciones.get((estado, simbolo))
+            if not destinos:
+                continue
+            if self.tiene_epsilon:
+                for destino in destinos:
+                    siguientes.update(self.clausura(destino))
+            else:
+                siguientes.update(destinos)
+        return siguientes
+
+    def acepta(self, cadena):
+        """
+        Retorna True si la cadena es aceptada por el AFN, False si no
+        """
+        estados_actuales = self.estados_iniciales()
+        for simbolo in cadena:
+            estados_actuales = self.paso(estados_actuales, simbolo)
+            if not estados_actuales:
+                return False
+        return not estados_actuales.isdisjoint(self.afn.estados_aceptacion)
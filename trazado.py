@@ -0,0 +1,128 @@
+"""
+Trazado opcional de los reconocedores rápidos (AFDCompilado y AFDBytes)
+Los pasos se guardan en un búfer circular de tamaño fijo (posición, estado,
+símbolo), así una entrada de varios MB solo conserva los últimos pasos
+El reconocimiento sin traza no cambia: el trazado es un ciclo aparte
+"""
+import random
+import sys
+
+
+class TrazaCircular:
+    def __init__(self, capacidad=1024, cada=1):
+        """
+        capacidad: número de pasos que se conservan (los más recientes)
+        cada: se registra uno de cada 'cada' pasos (muestreo dentro de una entrada)
+        """
+        if capacidad < 1 or cada < 1:
+            raise ValueError("La capacidad y el muestreo deben ser al menos 1")
+        self.capacidad = capacidad
+        self.cada = cada
+        self.posiciones = [0] * capacidad
+        self.estados = [None] * capacidad
+        self.simbolos = [None] * capacidad
+        self.vaciar()
+
+    def vaciar(self):
+        """Descarta los pasos registrados"""
+        self.siguiente = 0
+        self.total = 0
+
+    def registrar(self, posicion, estado, simbolo):
+        """Guarda un paso, reemplazando el más antiguo si el búfer está lleno"""
+        i = self.siguiente
+        self.posiciones[i] = posicion
+        self.estados[i] = estado
+        self.simbolos[i] = simbolo
+        self.siguiente = i + 1 if i + 1 < self.capacidad else 0
+        self.total += 1
+
+    def registros(self):
+        """Pasos conservados, del más antiguo al más reciente, como (posición, estado, símbolo)"""
+        if self.total < self.capacidad:
+            indices = range(self.total)
+        else:
+            indices = list(range(self.siguiente, self.capacidad)) + list(range(self.siguiente))
+        return [(self.posiciones[i], self.estados[i], self.simbolos[i]) for i in indices]
+
+    def volcar(self, destino=None, motivo=None):
+        """Escribe los pasos conservados (por defecto en stderr)"""
+        destino = sys.stderr if destino is None else destino
+        descartados = self.total - min(self.total, self.capacidad)
+        if motivo:
+            destino.write(f"{motivo}\n")
+        destino.write(f"Traza: {self.total} pasos registrados, {descartados} descartados\n")
+        for posicion, estado, simbolo in self.registros():
+            destino.write(f"  posición {posicion}: {simbolo!r} -> {'muerto' if estado is None else estado}\n")
+
+
+class TrazadorAFD:
+    def __init__(self, automata, traza=None, tasa_cadenas=1.0, volcar_al_rechazar=False, destino=None):
+        """
+        automata: AFDCompilado o AFDBytes
+        tasa_cadenas: fracción de las entradas que se trazan (las demás usan acepta sin traza)
+        volcar_al_rechazar: al rechazar una entrada trazada se vuelca la traza en 'destino'
+        """
+        self.automata = automata
+        self.traza = TrazaCircular() if traza is None else traza
+        self.tasa_cadenas = tasa_cadenas
+        self.volcar_al_rechazar = volcar_al_rechazar
+        self.destino = destino
+        self.bytes = hasattr(automata, 'tabla')
+
+    def acepta(self, entrada):
+        """Como automata.acepta(entrada); algunas entradas (según tasa_cadenas) se trazan"""
+        if self.tasa_cadenas < 1.0 and random.random() >= self.tasa_cadenas:
+            return self.automata.acepta(entrada)
+        self.traza.vaciar()
+        if self.bytes:
+            aceptada, motivo = self.recorrer_bytes(entrada)
+        else:
+            aceptada, motivo = self.recorrer(entrada)
+        if not aceptada and self.volcar_al_rechazar:
+            self.traza.volcar(self.destino, motivo)
+        return aceptada
+
+    def recorrer(self, cadena):
+        """Ciclo de AFDCompilado.acepta registrando los pasos; retorna (aceptada, motivo del rechazo)"""
+        transiciones = self.automata.transiciones
+        traza = self.traza
+        cada = traza.cada
+        contador = 0
+        estado = self.automata.inicial
+        for i, simbolo in enumerate(cadena):
+            estado = transiciones[estado].get(simbolo)
+            if estado is None:
+                # El paso que rechaza se registra siempre, aunque el muestreo lo salte
+                traza.registrar(i, None, simbolo)
+                return False, f"Rechazada en la posición {i}: sin transición con {simbolo!r}"
+            contador += 1
+            if contador == cada:
+                contador = 0
+                traza.registrar(i, estado, simbolo)
+        if self.automata.aceptacion[estado]:
+            return True, None
+        return False, f"Rechazada al final: el estado {estado} no es de aceptación"
+
+    def recorrer_bytes(self, datos):
+        """Ciclo de AFDBytes.acepta registrando los pasos (estados como número de fila)"""
+        automata = self.automata
+        tabla = automata.tabla
+        clases = automata.clases
+        numero_clases = automata.numero_clases
+        traza = self.traza
+        cada = traza.cada
+        contador = 0
+        estado = automata.inicial
+        for i, byte in enumerate(automata.vista(datos)):
+            estado = tabla[estado + clases[byte]]
+            if not estado:
+                traza.registrar(i, None, byte)
+                return False, f"Rechazada en el byte {i}: sin transición con {byte:#04x}"
+            contador += 1
+            if contador == cada:
+                contador = 0
+                traza.registrar(i, estado // numero_clases, byte)
+        if estado in automata.aceptacion:
+            return True, None
+        return False, f"Rechazada al final: el estado {estado // numero_clases} no es de aceptación"
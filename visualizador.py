@@ -1,8 +1,12 @@
 """
 Visualizador de autómatas usando graphviz
 """
+import io
 import os
 
+# Con más estados se escribe el .dot pero no se llama a Graphviz
+LIMITE_ESTADOS_PNG = 500
+
 def limpiar_y_crear_carpetas():
     """
     Limpia y crea las carpetas para organizar los resultados
@@ -64,18 +68,23 @@ def guardar_automata_completo(automata, nombre_base, tipo_automata, titulo):
     
     return ruta_base
 
-def crear_visualizacion_graphviz(automata, nombre_archivo, titulo="Autómata"):
+def crear_visualizacion_graphviz(automata, nombre_archivo, titulo="Autómata", **opciones):
     """
     Crea una visualización del autómata usando graphviz
+    Las opciones se pasan a escribir_codigo_dot (colapsar, centro, radio)
+    Con más de LIMITE_ESTADOS_PNG estados solo se genera el .dot
     """
-    contenido_dot = generar_codigo_dot(automata, titulo)
-    
-    # Guardar archivo .dot
+    # Guardar archivo .dot (se escribe a medida que se genera)
     archivo_dot = f"{nombre_archivo}.dot"
     with open(archivo_dot, 'w', encoding='utf-8') as f:
-        f.write(contenido_dot)
+        dibujados = escribir_codigo_dot(automata, titulo, f, **opciones)
     
     print(f"Archivo DOT generado: {archivo_dot}")
+
+    if dibujados > LIMITE_ESTADOS_PNG:
+        print(f"El diagrama tiene {dibujados} estados: no se genera la imagen PNG")
+        print("Usa colapsar=True o centro/radio para dibujar solo una parte")
+        return
     
     try:
         # Intentar generar imagen PNG
@@ -92,54 +101,182 @@ def crear_visualizacion_graphviz(automata, nombre_archivo, titulo="Autómata"):
         print(f"Error al generar imágenes: {e}")
         print("El archivo .dot se puede abrir con herramientas compatibles con Graphviz")
 
-def generar_codigo_dot(automata, titulo):
+def generar_codigo_dot(automata, titulo, **opciones):
     """
-    Genera el código DOT para representar el autómata
+    Genera el código DOT para representar el autómata (ver escribir_codigo_dot)
     """
-    dot = []
-    dot.append("digraph automata {")
-    dot.append("    rankdir=LR;")
-    dot.append("    size=\"8,5\";")
-    dot.append(f"    label=\"{titulo}\";")
-    dot.append("    labelloc=\"t\";")
-    dot.append("    node [shape = circle];")
-    dot.append("")
-    
-    # Estados de aceptación (círculo doble)
-    if automata.estados_aceptacion:
-        estados_aceptacion_str = " ".join([f'"{estado}"' for estado in sorted(automata.estados_aceptacion)])
-        dot.append(f"    node [shape = doublecircle]; {estados_aceptacion_str};")
-        dot.append("")
-    
-    # Estado inicial (flecha desde punto invisible)
-    dot.append("    node [shape = circle];")
-    dot.append(f"    start [shape=point, width=0];")
-    dot.append(f"    start -> \"{automata.estado_inicial}\";")
-    dot.append("")
-    
-    # Agrupar transiciones por origen y destino para evitar múltiples flechas
-    transiciones_agrupadas = {}
-    
+    salida = io.StringIO()
+    escribir_codigo_dot(automata, titulo, salida, **opciones)
+    return salida.getvalue()
+
+def escribir_codigo_dot(automata, titulo, salida, colapsar=False, centro=None, radio=1):
+    """
+    Escribe el código DOT en 'salida' (un archivo) a medida que lo genera,
+    sin armar el texto completo en memoria
+    colapsar: une las cadenas de estados que solo tienen una transición épsilon
+              y dibuja todos los estados muertos como un único sumidero
+    centro, radio: dibuja solo los estados a lo sumo a 'radio' transiciones
+                   (en cualquier dirección) del estado 'centro'
+    Retorna el número de estados dibujados
+    """
+    # aristas[origen][destino]: símbolos de las transiciones de origen a destino
+    aristas = {}
     for (estado_origen, simbolo), estados_destino in automata.transiciones.items():
         for estado_destino in estados_destino:
-            clave = (estado_origen, estado_destino)
-            if clave not in transiciones_agrupadas:
-                transiciones_agrupadas[clave] = []
-            transiciones_agrupadas[clave].append(simbolo)
-    
-    # Generar transiciones
-    for (estado_origen, estado_destino), simbolos in transiciones_agrupadas.items():
-        simbolos_ordenados = sorted(simbolos)
-        etiqueta = ", ".join(simbolos_ordenados)
-        
-        # Reemplazar épsilon con símbolo unicode
-        etiqueta = etiqueta.replace('ε', 'ε').replace('E', 'ε')
-        
-        dot.append(f"    \"{estado_origen}\" -> \"{estado_destino}\" [label=\"{etiqueta}\"];")
-    
-    dot.append("}")
-    
-    return "\n".join(dot)
+            aristas.setdefault(estado_origen, {}).setdefault(estado_destino, []).append(simbolo)
+
+    estados = set(automata.estados)
+    sumideros = set()
+    if colapsar:
+        aristas, estados = colapsar_cadenas_epsilon(automata, aristas, estados)
+        sumideros = estados_sin_salida_a_aceptacion(automata, aristas, estados)
+    if centro is not None:
+        estados = vecindario(aristas, estados, centro, radio)
+    frontera = {origen for origen in estados
+                if any(destino not in estados for destino in aristas.get(origen, {}))}
+
+    salida.write("digraph automata {\n")
+    salida.write("    rankdir=LR;\n")
+    salida.write("    size=\"8,5\";\n")
+    salida.write(f"    label=\"{escapar_dot(titulo)}\";\n")
+    salida.write("    labelloc=\"t\";\n")
+    salida.write("    node [shape = circle];\n\n")
+
+    # Estados de aceptación (círculo doble)
+    aceptacion = [estado for estado in ordenar_estados(automata.estados_aceptacion) if estado in estados]
+    if aceptacion:
+        estados_aceptacion_str = " ".join(f'"{escapar_dot(estado)}"' for estado in aceptacion)
+        salida.write(f"    node [shape = doublecircle]; {estados_aceptacion_str};\n\n")
+
+    # Estado inicial (flecha desde punto invisible)
+    salida.write("    node [shape = circle];\n")
+    if automata.estado_inicial in estados:
+        salida.write("    start [shape=point, width=0];\n")
+        salida.write(f"    start -> \"{escapar_dot(automata.estado_inicial)}\";\n")
+    if sumideros & estados:
+        salida.write("    \"∅\" [shape=circle, style=dashed];\n")
+    # Estados con transiciones fuera del vecindario
+    for estado in ordenar_estados(frontera - sumideros):
+        salida.write(f"    \"{escapar_dot(estado)}\" [style=dashed];\n")
+    salida.write("\n")
+
+    # Una flecha por par (origen, destino), con los símbolos agrupados en rangos
+    dibujados = set()
+    for estado_origen in ordenar_estados(estados - sumideros):
+        dibujados.add(estado_origen)
+        hacia_sumidero = []
+        for estado_destino, simbolos in aristas.get(estado_origen, {}).items():
+            if estado_destino not in estados:
+                continue
+            if estado_destino in sumideros:
+                hacia_sumidero.extend(simbolos)
+                continue
+            salida.write(f"    \"{escapar_dot(estado_origen)}\" -> \"{escapar_dot(estado_destino)}\" "
+                         f"[label=\"{escapar_dot(comprimir_simbolos(simbolos))}\"];\n")
+        if hacia_sumidero:
+            salida.write(f"    \"{escapar_dot(estado_origen)}\" -> \"∅\" "
+                         f"[label=\"{escapar_dot(comprimir_simbolos(hacia_sumidero))}\"];\n")
+
+    salida.write("}")
+    return len(dibujados) + (1 if sumideros & estados else 0)
+
+def comprimir_simbolos(simbolos):
+    """
+    Etiqueta de una arista: épsilon primero y los símbolos consecutivos
+    (tres o más) como rangos, por ejemplo "a-z, 0-9"
+    """
+    partes = ['ε'] if 'ε' in simbolos else []
+    codigos = sorted({ord(simbolo) for simbolo in simbolos if simbolo != 'ε'})
+    i = 0
+    while i < len(codigos):
+        j = i
+        while j + 1 < len(codigos) and codigos[j + 1] == codigos[j] + 1:
+            j += 1
+        if j - i >= 2:
+            partes.append(f"{chr(codigos[i])}-{chr(codigos[j])}")
+        else:
+            partes.extend(chr(codigo) for codigo in codigos[i:j + 1])
+        i = j + 1
+    return ", ".join(partes)
+
+def escapar_dot(valor):
+    """Escapa comillas y barras para usar el valor dentro de comillas en DOT"""
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"')
+
+def ordenar_estados(estados):
+    """Estados ordenados (por repr si no son comparables)"""
+    try:
+        return sorted(estados)
+    except TypeError:
+        return sorted(estados, key=repr)
+
+def colapsar_cadenas_epsilon(automata, aristas, estados):
+    """
+    Un estado que no es inicial ni de aceptación y cuya única transición es
+    épsilon se reemplaza por su destino en las flechas que llegan a él
+    Retorna (aristas, estados) sin esos estados
+    """
+    def siguiente(estado):
+        salidas = aristas.get(estado, {})
+        if (estado == automata.estado_inicial or estado in automata.estados_aceptacion
+                or len(salidas) != 1):
+            return None
+        destino, simbolos = next(iter(salidas.items()))
+        return destino if simbolos == ['ε'] else None
+
+    representante = {}
+    for estado in estados:
+        # Se sigue la cadena hasta un estado que no se colapsa (con cuidado de los ciclos)
+        actual = estado
+        vistos = {actual}
+        while siguiente(actual) is not None and siguiente(actual) not in vistos:
+            actual = siguiente(actual)
+            vistos.add(actual)
+        representante[estado] = actual
+
+    nuevas = {}
+    for origen, salidas in aristas.items():
+        if representante[origen] != origen:
+            continue
+        for destino, simbolos in salidas.items():
+            nuevas.setdefault(origen, {}).setdefault(representante[destino], []).extend(simbolos)
+    return nuevas, {estado for estado in estados if representante[estado] == estado}
+
+def estados_sin_salida_a_aceptacion(automata, aristas, estados):
+    """Estados (además del inicial) desde los que no se llega a aceptación"""
+    predecesores = {}
+    for origen, salidas in aristas.items():
+        for destino in salidas:
+            predecesores.setdefault(destino, set()).add(origen)
+    vivos = set(automata.estados_aceptacion) & estados
+    pila = list(vivos)
+    while pila:
+        for predecesor in predecesores.get(pila.pop(), ()):
+            if predecesor not in vivos:
+                vivos.add(predecesor)
+                pila.append(predecesor)
+    return estados - vivos - {automata.estado_inicial}
+
+def vecindario(aristas, estados, centro, radio):
+    """Estados a lo sumo a 'radio' transiciones del centro, en cualquier dirección"""
+    if centro not in estados:
+        raise ValueError(f"El estado {centro} no está en el autómata")
+    vecinos = {}
+    for origen, salidas in aristas.items():
+        for destino in salidas:
+            vecinos.setdefault(origen, set()).add(destino)
+            vecinos.setdefault(destino, set()).add(origen)
+    alcanzados = {centro}
+    borde = [centro]
+    for _ in range(radio):
+        nuevo_borde = []
+        for estado in borde:
+            for vecino in vecinos.get(estado, ()):
+                if vecino not in alcanzados and vecino in estados:
+                    alcanzados.add(vecino)
+                    nuevo_borde.append(vecino)
+        borde = nuevo_borde
+    return alcanzados
 
 def crear_visualizacion_simple(automata, nombre_archivo):
     """